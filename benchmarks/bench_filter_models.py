@@ -0,0 +1,101 @@
+"""Compare `filter_models` against the loop-and-re-sort implementation it replaced, for every model type.
+
+Usage:
+    python benchmarks/bench_filter_models.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import timeit
+
+from pathlib import Path
+from typing import Any
+
+if not importlib.util.find_spec("llm_fallbacks"):
+    sys.path.append(str(Path(__file__).parents[1] / "src"))
+from llm_fallbacks.core import sort_models_by_cost_and_limits
+from llm_fallbacks.filter_litellm import _MODEL_TYPE_GETTERS, _priority_order, filter_models
+
+
+CRITERIA: dict[str, dict[str, Any]] = {
+    "none": {},
+    "free_only": {"free_only": True},
+    "cheap_long_context": {"max_cost_per_token": 1e-06, "min_context_length": 32_000},
+    "vision_tools": {"supports_vision": True, "supports_function_calling": True},
+    "provider": {"provider": "openrouter/"},
+}
+
+
+def legacy_filter_models(
+    model_type: str = "chat",
+    *,
+    free_only: bool = False,
+    max_cost_per_token: float | None = None,
+    min_context_length: int | None = None,
+    supports_vision: bool | None = None,
+    supports_audio_input: bool | None = None,
+    supports_audio_output: bool | None = None,
+    supports_function_calling: bool | None = None,
+    provider: str | None = None,
+) -> list[str]:
+    """The implementation `filter_models` had before it moved onto `ColumnarCatalog`."""
+    models = dict(_priority_order(model_type))
+    filtered_models = {}
+    for name, spec in models.items():
+        if free_only and spec.get("input_cost_per_token", 0) > 0:
+            continue
+        if max_cost_per_token is not None and spec.get("input_cost_per_token", 0) > max_cost_per_token:
+            continue
+        if min_context_length is not None and spec.get("max_tokens", 0) < min_context_length:
+            continue
+        if supports_vision is not None and spec.get("supports_vision", False) != supports_vision:
+            continue
+        if supports_audio_input is not None and spec.get("supports_audio_input", False) != supports_audio_input:
+            continue
+        if supports_audio_output is not None and spec.get("supports_audio_output", False) != supports_audio_output:
+            continue
+        if (
+            supports_function_calling is not None
+            and spec.get("supports_function_calling", False) != supports_function_calling
+        ):
+            continue
+        if provider is not None and not name.startswith(provider):
+            continue
+        filtered_models[name] = spec
+    return [name for name, _ in sort_models_by_cost_and_limits(filtered_models, free_only=free_only)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="calls timed per model type and criteria set")
+    args = parser.parse_args()
+
+    print(f"{'model type':<20} {'criteria':<20} {'models':>7} {'legacy ms':>10} {'query ms':>10} {'speedup':>8}")
+    legacy_total = query_total = 0.0
+    for model_type in _MODEL_TYPE_GETTERS:
+        for criteria_name, criteria in CRITERIA.items():
+            result = filter_models(model_type, **criteria)
+            if result != legacy_filter_models(model_type, **criteria):
+                raise AssertionError(f"filter_models disagrees with the legacy implementation for {model_type}")
+            legacy = timeit.timeit(
+                lambda model_type=model_type, criteria=criteria: legacy_filter_models(model_type, **criteria),
+                number=args.repeat,
+            )
+            query = timeit.timeit(
+                lambda model_type=model_type, criteria=criteria: filter_models(model_type, **criteria),
+                number=args.repeat,
+            )
+            legacy_total += legacy
+            query_total += query
+            print(
+                f"{model_type:<20} {criteria_name:<20} {len(result):>7} {legacy / args.repeat * 1000:>10.3f} "
+                f"{query / args.repeat * 1000:>10.3f} {legacy / query:>7.1f}x"
+            )
+    print(f"{'total':<41} {legacy_total * 1000:>18.1f} {query_total * 1000:>10.1f} {legacy_total / query_total:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Time a cold `import llm_fallbacks.core` plus price map load per source, with and without litellm installed.
+
+Every case runs in a fresh interpreter, offline: the "snapshot" source reads the pinned full fixture
+written to a temporary snapshot, and "litellm" is told to use its bundled map. "Without litellm" hides
+the package from the import system, so "resource" and "litellm" have nothing to read there.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat N] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+from typing import Any
+
+
+BENCHMARKS_DIR: Path = Path(__file__).parent
+SOURCES: tuple[str, ...] = ("resource", "snapshot", "litellm")
+
+# Run in the child: optionally hide litellm, then import the library and load the price map.
+CHILD_CODE = """
+import json, sys, time
+start = time.perf_counter()
+if {hide_litellm!r}:
+    from importlib.machinery import PathFinder
+
+    class HideLitellm:
+        @staticmethod
+        def find_spec(name, path=None, target=None):
+            if name == "litellm" or name.startswith("litellm."):
+                return None
+            return PathFinder.find_spec(name, path, target)
+
+    sys.meta_path[sys.meta_path.index(PathFinder)] = HideLitellm
+from llm_fallbacks import core
+imported = time.perf_counter()
+try:
+    models = len(core._get_litellm_models())
+except ImportError:
+    models = None
+loaded = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "load_ms": (loaded - imported) * 1000,
+    "models": models,
+    "litellm_imported": "litellm" in sys.modules,
+}}))
+"""
+
+
+def run_case(
+    source: str,
+    hide_litellm: bool,
+    env: dict[str, str],
+) -> dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE.format(hide_litellm=hide_litellm)],
+        env={**env, "LLM_FALLBACKS_PRICE_MAP_SOURCE": source},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per case; the median is kept")
+    parser.add_argument("--output", type=Path, default=None, help="also write the results as JSON here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = Path(tmp) / "model_prices_and_context_window.json"
+        with gzip.open(BENCHMARKS_DIR / "fixtures" / "price_map_full.json.gz", "rt", encoding="utf-8") as f:
+            snapshot.write_text(f.read(), encoding="utf-8")
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(BENCHMARKS_DIR.parent / "src"), os.getenv("PYTHONPATH")])),
+            "LLM_FALLBACKS_OFFLINE": "True",
+            "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+            "LLM_FALLBACKS_PRICE_MAP_SNAPSHOT": str(snapshot),
+        }
+
+        results: list[dict[str, Any]] = []
+        print(f"{'litellm':<10} {'source':<10} {'import ms':>10} {'load ms':>10} {'models':>7}  litellm imported")
+        for hide_litellm in (False, True):
+            for source in SOURCES:
+                runs = [run_case(source, hide_litellm, env) for _ in range(args.repeat)]
+                row = {
+                    "litellm": "hidden" if hide_litellm else "installed",
+                    "source": source,
+                    "import_ms": statistics.median(run["import_ms"] for run in runs),
+                    "load_ms": statistics.median(run["load_ms"] for run in runs),
+                    "models": runs[-1]["models"],
+                    "litellm_imported": runs[-1]["litellm_imported"],
+                }
+                results.append(row)
+                models = "-" if row["models"] is None else row["models"]
+                print(
+                    f"{row['litellm']:<10} {source:<10} {row['import_ms']:>10.1f} {row['load_ms']:>10.1f} "
+                    f"{models:>7}  {row['litellm_imported']}"
+                )
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
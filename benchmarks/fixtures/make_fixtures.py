@@ -0,0 +1,95 @@
+"""Regenerate the pinned benchmark fixtures from the price map bundled with the installed litellm.
+
+The fixtures are committed so benchmark runs do not depend on the network or on the installed
+litellm version; only regenerate them deliberately, and save a new baseline afterwards.
+
+Usage:
+    python benchmarks/fixtures/make_fixtures.py
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.metadata
+import importlib.util
+import json
+import os
+
+from pathlib import Path
+from typing import Any
+
+
+FIXTURES_DIR: Path = Path(__file__).parent
+PRICE_MAP_RESOURCE: str = "model_prices_and_context_window_backup.json"
+# Every SMALL_CATALOG_STRIDE-th model, by name, makes the small catalog.
+SMALL_CATALOG_STRIDE: int = 8
+
+
+def _bundled_price_map() -> dict[str, Any]:
+    spec = importlib.util.find_spec("litellm")
+    if spec is None or not spec.submodule_search_locations:
+        raise SystemExit("litellm is not installed; it provides the price map the fixtures are made from")
+    with open(os.path.join(spec.submodule_search_locations[0], PRICE_MAP_RESOURCE), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def openrouter_response(
+    price_map: dict[str, Any],
+) -> dict[str, Any]:
+    """Build an OpenRouter `/models` response listing the price map's OpenRouter models."""
+    data = []
+    for name in sorted(price_map):
+        spec = price_map[name]
+        if not isinstance(spec, dict) or spec.get("litellm_provider") != "openrouter":
+            continue
+        data.append(
+            {
+                "id": name.removeprefix("openrouter/"),
+                "description": "",
+                "pricing": {
+                    "prompt": str(spec.get("input_cost_per_token", 0)),
+                    "completion": str(spec.get("output_cost_per_token", 0)),
+                    "image": str(spec.get("input_cost_per_image", 0)),
+                    "request": "0",
+                },
+                "architecture": {
+                    "modality": "text+image->text" if spec.get("supports_vision") else "text->text",
+                    "instruct_type": "Function" if spec.get("supports_function_calling") else None,
+                },
+                "top_provider": {
+                    "context_length": spec.get("max_input_tokens"),
+                    "max_completion_tokens": spec.get("max_output_tokens"),
+                },
+            }
+        )
+    return {"data": data}
+
+
+def _write(
+    name: str,
+    payload: Any,
+) -> None:
+    # mtime=0 keeps the archives byte-identical across regenerations of the same data.
+    with gzip.GzipFile(FIXTURES_DIR / name, "wb", compresslevel=9, mtime=0) as f:
+        f.write(json.dumps(payload, sort_keys=True).encode())
+
+
+def main() -> None:
+    price_map = _bundled_price_map()
+    small = {name: price_map[name] for name in sorted(price_map)[::SMALL_CATALOG_STRIDE]}
+    response = openrouter_response(price_map)
+    _write("price_map_full.json.gz", price_map)
+    _write("price_map_small.json.gz", small)
+    _write("openrouter_models.json.gz", response)
+    manifest = {
+        "litellm_version": importlib.metadata.version("litellm"),
+        "price_map_full": len(price_map),
+        "price_map_small": len(small),
+        "openrouter_models": len(response["data"]),
+    }
+    (FIXTURES_DIR / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    print(json.dumps(manifest))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Benchmark the catalog, ranking and config-generation hot paths offline, against a stored baseline.
+
+Every run loads a pinned price map from `benchmarks/fixtures`, or a seeded synthetic one for the
+`synthetic-*` catalogs, before anything reads the catalog, and sets `LITELLM_LOCAL_MODEL_COST_MAP` and
+`LLM_FALLBACKS_OFFLINE`, so nothing touches the network and results do not move with the installed
+litellm's price map.
+
+Usage:
+    python benchmarks/suite.py                     # run, compare with benchmarks/baselines/<catalog>.json
+    python benchmarks/suite.py --save-baseline     # run and store the results as the new baseline
+    python benchmarks/suite.py --catalog small --only filter_models --repeat 10
+    python benchmarks/suite.py --catalog synthetic-100k    # generated catalog, see llm_fallbacks.synthetic
+
+Exits with status 1 when a case's fastest batch is more than `--threshold` slower than its baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+
+BENCHMARKS_DIR: Path = Path(__file__).parent
+FIXTURES_DIR: Path = BENCHMARKS_DIR / "fixtures"
+BASELINES_DIR: Path = BENCHMARKS_DIR / "baselines"
+# "full" and "small" are pinned fixtures; "synthetic-*" are generated by `llm_fallbacks.synthetic` with a fixed seed.
+CATALOGS: tuple[str, ...] = ("full", "small", "synthetic-10k", "synthetic-100k", "synthetic-1m")
+SYNTHETIC_SEED: int = 0
+# OpenRouter models listed by the synthetic `/models` payload, whatever the catalog size.
+SYNTHETIC_OPENROUTER_MODELS: int = 200
+# Minimum duration of one timed batch; fast cases are called in loops of `number` calls to reach it.
+MIN_BATCH_SECONDS: float = 0.2
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Per-call timings of one case, in milliseconds."""
+
+    min_ms: float
+    median_ms: float
+    number: int
+    repeat: int
+
+
+@dataclass(frozen=True)
+class Comparison:
+    case: str
+    baseline_ms: float | None
+    current_ms: float | None
+    ratio: float | None
+    status: str  # "ok", "regression", "improvement", "new" or "missing"
+
+
+def load_fixture(
+    name: str,
+) -> Any:
+    with gzip.open(FIXTURES_DIR / name, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def time_case(
+    func: Callable[[], Any],
+    repeat: int = 5,
+    budget: float | None = None,
+) -> Timing:
+    """Time `func` like `timeit`: calibrate a batch size, then keep the per-call min and median of `repeat` batches.
+
+    With a `budget` in seconds, slow cases run fewer batches (at least one) so that they fit in it.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_BATCH_SECONDS:
+            break
+        number *= 10 if elapsed < MIN_BATCH_SECONDS / 10 else 2
+    if budget is not None:
+        repeat = max(1, min(repeat, int(budget / elapsed)))
+    batches = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        batches.append((time.perf_counter() - start) / number)
+    return Timing(
+        min_ms=min(batches) * 1000, median_ms=statistics.median(batches) * 1000, number=number, repeat=repeat
+    )
+
+
+def compare(
+    results: dict[str, Timing | dict[str, Any]],
+    baseline: dict[str, Timing | dict[str, Any]],
+    threshold: float = 0.25,
+) -> list[Comparison]:
+    """Compare the fastest batch per call, case by case.
+
+    The minimum is the least noisy estimate on a shared machine: slower batches measure other load,
+    not the code. A ratio above `1 + threshold` is a regression, below `1 / (1 + threshold)` an
+    improvement.
+    """
+
+    def fastest(timing: Timing | dict[str, Any]) -> float:
+        return timing.min_ms if isinstance(timing, Timing) else float(timing["min_ms"])
+
+    comparisons: list[Comparison] = []
+    for case in [*results, *(case for case in baseline if case not in results)]:
+        if case not in baseline:
+            comparisons.append(Comparison(case, None, fastest(results[case]), None, "new"))
+            continue
+        if case not in results:
+            comparisons.append(Comparison(case, fastest(baseline[case]), None, None, "missing"))
+            continue
+        before, after = fastest(baseline[case]), fastest(results[case])
+        ratio = after / before if before > 0 else float("inf")
+        status = "regression" if ratio > 1 + threshold else "improvement" if ratio < 1 / (1 + threshold) else "ok"
+        comparisons.append(Comparison(case, before, after, ratio, status))
+    return comparisons
+
+
+def install_catalog(
+    catalog: str,
+) -> dict[str, Any]:
+    """Point the library at a pinned price map, offline, before any module reads the catalog."""
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    os.environ["LLM_FALLBACKS_OFFLINE"] = "True"
+    if not importlib.util.find_spec("llm_fallbacks"):
+        sys.path.append(str(BENCHMARKS_DIR.parent / "src"))
+    from llm_fallbacks import core
+
+    if catalog.startswith("synthetic-"):
+        from llm_fallbacks.synthetic import SCALES, generate_price_map
+
+        price_map = generate_price_map(SCALES[catalog.removeprefix("synthetic-")], seed=SYNTHETIC_SEED)
+    else:
+        price_map = load_fixture(f"price_map_{catalog}.json.gz")
+    core.refresh_litellm_models(price_map)
+    return price_map
+
+
+def build_cases(
+    catalog: str = "full",
+) -> dict[str, Callable[[], Any]]:
+    """Return the benchmark cases; call `install_catalog` first."""
+    from llm_fallbacks import core
+    from llm_fallbacks.config import CustomProviderConfig, _parse_openrouter_models_response
+    from llm_fallbacks.filter_litellm import filter_models
+    from llm_fallbacks.generate_configs import to_litellm_config_yaml
+
+    if catalog.startswith("synthetic-"):
+        from llm_fallbacks.synthetic import generate_openrouter_models
+
+        openrouter_models = generate_openrouter_models(SYNTHETIC_OPENROUTER_MODELS, seed=SYNTHETIC_SEED)
+    else:
+        openrouter_models = load_fixture("openrouter_models.json.gz")
+    chat_models = core.get_chat_models()
+
+    def get_litellm_models() -> Any:
+        core.CACHED_LITELLM_MODELS.clear()
+        return core.get_litellm_models()
+
+    def openrouter_provider() -> CustomProviderConfig:
+        return CustomProviderConfig(
+            provider_name="openrouter",
+            base_url="https://openrouter.ai/api/v1",
+            custom_get_models_from_api=lambda _api_key: openrouter_models,
+            parse_models_function=_parse_openrouter_models_response,
+        )
+
+    providers = [openrouter_provider()]
+    return {
+        "get_litellm_models": get_litellm_models,
+        "sort_models_by_cost_and_limits[chat]": lambda: core.sort_models_by_cost_and_limits(chat_models),
+        "sort_models_by_cost_and_limits[chat,free_only]": lambda: core.sort_models_by_cost_and_limits(
+            chat_models, free_only=True
+        ),
+        "get_fallback_list[chat]": lambda: core.get_fallback_list("chat"),
+        "get_fallback_list[embedding]": lambda: core.get_fallback_list("embedding"),
+        "filter_models[chat]": lambda: filter_models("chat"),
+        "filter_models[chat,vision_tools]": lambda: filter_models(
+            "chat", supports_vision=True, supports_function_calling=True
+        ),
+        "filter_models[chat,cheap_long_context]": lambda: filter_models(
+            "chat", max_cost_per_token=1e-06, min_context_length=32_000
+        ),
+        "_parse_openrouter_models_response": lambda: _parse_openrouter_models_response("openrouter", openrouter_models),
+        "CustomProviderConfig[openrouter]": openrouter_provider,
+        "to_litellm_config_yaml": lambda: to_litellm_config_yaml(providers),
+        "to_litellm_config_yaml[free_only]": lambda: to_litellm_config_yaml(providers, free_only=True),
+    }
+
+
+def _format_ms(
+    value: float | None,
+) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalog", choices=CATALOGS, default="full", help="pinned price map to load")
+    parser.add_argument("--repeat", type=int, default=7, help="timed batches per case")
+    parser.add_argument(
+        "--budget", type=float, default=30.0, help="seconds per case; slow cases run fewer batches to fit"
+    )
+    parser.add_argument("--only", default=None, help="only run cases whose name contains this text")
+    parser.add_argument("--baseline", type=Path, default=None, help="default: benchmarks/baselines/<catalog>.json")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown ratio above 1 flagged as a regression")
+    parser.add_argument("--output", type=Path, default=None, help="also write the results as JSON here")
+    args = parser.parse_args()
+
+    install_catalog(args.catalog)
+    cases = build_cases(args.catalog)
+    results: dict[str, Timing] = {}
+    for name, func in cases.items():
+        if args.only is None or args.only in name:
+            results[name] = time_case(func, args.repeat, args.budget)
+            print(f"{name:<50} {results[name].min_ms:>12.3f} ms", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "catalog": args.catalog,
+            "fixtures": json.loads((FIXTURES_DIR / "manifest.json").read_text()),
+            "synthetic_seed": SYNTHETIC_SEED if args.catalog.startswith("synthetic-") else None,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": {name: asdict(timing) for name, timing in results.items()},
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    baseline_path = args.baseline or BASELINES_DIR / f"{args.catalog}.json"
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Saved baseline to {baseline_path}")
+        return 0
+    if not baseline_path.is_file():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one.")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())["results"]
+    if args.only is not None:
+        baseline = {name: timing for name, timing in baseline.items() if args.only in name}
+    comparisons = compare(results, baseline, args.threshold)
+    print(f"{'case':<50} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}  status")
+    for c in comparisons:
+        ratio = "-" if c.ratio is None else f"{c.ratio:.2f}x"
+        print(f"{c.case:<50} {_format_ms(c.baseline_ms):>12} {_format_ms(c.current_ms):>12} {ratio:>7}  {c.status}")
+    regressions = [c.case for c in comparisons if c.status == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
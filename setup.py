@@ -50,7 +50,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "llm-fallbacks=llm_fallbacks.__main__:main",
+            "llm-fallbacks=llm_fallbacks.cli:main",
         ],
     },
     keywords="llm, ai, fallbacks, litellm",
@@ -5,30 +5,38 @@ using the litellm library. It helps you handle API failures gracefully by
 providing alternative models to try when a primary model fails.
 """
 
-from llm_fallbacks.core import (
-    get_audio_input_models,
-    get_audio_output_models,
-    get_audio_speech_models,
-    get_audio_transcription_models,
-    get_chat_models,
-    get_completion_models,
-    get_embedding_models,
-    get_fallback_list,
-    get_function_calling_models,
-    get_image_generation_models,
-    get_image_input_models,
-    get_litellm_model_specs,
-    get_litellm_models,
-    get_models,
-    get_moderation_models,
-    get_parallel_function_calling_models,
-    get_pdf_input_models,
-    get_rerank_models,
-    get_vision_models,
-    sort_models_by_cost_and_limits,
-    calculate_cost_per_token,
-)
-from llm_fallbacks.filter_litellm import filter_models
+from __future__ import annotations
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from llm_fallbacks.core import (
+        calculate_cost_per_token,
+        get_audio_input_models,
+        get_audio_output_models,
+        get_audio_speech_models,
+        get_audio_transcription_models,
+        get_chat_models,
+        get_completion_models,
+        get_embedding_models,
+        get_fallback_list,
+        get_function_calling_models,
+        get_image_generation_models,
+        get_image_input_models,
+        get_litellm_model_specs,
+        get_litellm_models,
+        get_models,
+        get_moderation_models,
+        get_parallel_function_calling_models,
+        get_pdf_input_models,
+        get_rerank_models,
+        get_vision_models,
+        sort_models_by_cost_and_limits,
+    )
+    from llm_fallbacks.filter_litellm import filter_models
 
 
 __version__ = "0.1.0"
@@ -56,3 +64,24 @@ __all__ = [
     "calculate_cost_per_token",
     "filter_models",
 ]
+
+# Public name -> defining module. Submodules are imported on first attribute access, so that
+# `import llm_fallbacks` (and `python -m llm_fallbacks`) does not rank every model type or build
+# the provider configs until something actually needs them.
+_LAZY_ATTRIBUTES: dict[str, str] = {  # noqa: RUF067
+    **{name: "llm_fallbacks.core" for name in __all__ if name != "filter_models"},
+    "filter_models": "llm_fallbacks.filter_litellm",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,222 @@
+"""Bounded LRU/TTL caches for catalog query results, invalidated when the catalog version changes."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Mapping, TypeVar
+
+from llm_fallbacks import instrumentation
+from llm_fallbacks.core import get_catalog_version
+from llm_fallbacks.filter_litellm import _MODEL_TYPE_GETTERS, filter_models
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+    maxsize: int
+
+
+def freeze(
+    value: Any,
+) -> Any:
+    """Return an immutable deep copy of lists, tuples and dicts (tuples and read-only mappings)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+class ResultCache:
+    """Thread-safe LRU cache with an optional TTL whose entries belong to one catalog version.
+
+    The first lookup after `refresh_litellm_models()` bumps the catalog version drops every entry,
+    so results computed from an old catalog are never served.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used one is evicted beyond it.
+        ttl: Seconds an entry stays valid, or None to keep it until evicted or invalidated.
+        clock: Monotonic time source, overridable for tests.
+        name: The `cache` label of the cache counters reported to `instrumentation.sink`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "result_cache",
+    ):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize: int = maxsize
+        self.ttl: float | None = ttl
+        self.clock: Callable[[], float] = clock
+        self.name: str = name
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._version: int = get_catalog_version()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = self._invalidations = 0
+
+    def _check_version(self):
+        version = get_catalog_version()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+            self._invalidations += 1
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], T],
+    ) -> T:
+        """Return the cached value of `key`, computing, freezing and storing it on a miss."""
+        # Counters are reported once the lock is released, so a slow sink never blocks other lookups.
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            expired = entry is not None and entry[0] <= self.clock()
+            if entry is not None and not expired:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                if expired:
+                    del self._entries[key]
+                    self._expirations += 1
+                self._misses += 1
+            version = self._version
+        if entry is not None and not expired:
+            instrumentation.count("cache.hits", cache=self.name)
+            return entry[1]
+        if expired:
+            instrumentation.count("cache.expirations", cache=self.name)
+        instrumentation.count("cache.misses", cache=self.name)
+
+        # Compute outside the lock so a slow miss does not block hits on other keys.
+        value = freeze(compute())
+        evicted = 0
+        with self._lock:
+            if version == self._version:
+                expires = float("inf") if self.ttl is None else self.clock() + self.ttl
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    evicted += 1
+                self._evictions += evicted
+        if evicted:
+            instrumentation.count("cache.evictions", evicted, cache=self.name)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+
+def lru_ttl_cache(
+    maxsize: int = 256,
+    ttl: float | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a catalog query so its results are cached in a `ResultCache` and returned frozen.
+
+    Arguments are normalized by binding them to the function's signature with defaults applied,
+    so `f("chat")`, `f(model_type="chat")` and `f("chat", free_only=False)` share one entry.
+    The wrapper exposes the cache as `.cache` and its counters through `.cache_stats()`.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        cache = ResultCache(maxsize, ttl, name=func.__qualname__)
+        # Raw call shape -> normalized key, so hits skip `Signature.bind`.
+        normalized_keys: dict[Hashable, tuple[tuple[str, Any], ...]] = {}
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            raw_key = (args, tuple(kwargs.items()))
+            key = normalized_keys.get(raw_key)
+            if key is None:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = tuple(bound.arguments.items())
+                if len(normalized_keys) >= 4 * maxsize:
+                    normalized_keys.clear()
+                normalized_keys[raw_key] = key
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_stats = cache.stats  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@lru_ttl_cache(maxsize=256)
+def cached_filter_models(
+    model_type: str = "chat",
+    *,
+    free_only: bool = False,
+    max_cost_per_token: float | None = None,
+    min_context_length: int | None = None,
+    supports_vision: bool | None = None,
+    supports_audio_input: bool | None = None,
+    supports_audio_output: bool | None = None,
+    supports_function_calling: bool | None = None,
+    provider: str | None = None,
+) -> tuple[str, ...]:
+    """Cached `filter_models`, returning the model names as a tuple."""
+    return tuple(
+        filter_models(
+            model_type,
+            free_only=free_only,
+            max_cost_per_token=max_cost_per_token,
+            min_context_length=min_context_length,
+            supports_vision=supports_vision,
+            supports_audio_input=supports_audio_input,
+            supports_audio_output=supports_audio_output,
+            supports_function_calling=supports_function_calling,
+            provider=provider,
+        )
+    )
+
+
+@lru_ttl_cache(maxsize=32)
+def cached_models(
+    model_type: str = "chat",
+) -> Mapping[str, Mapping[str, Any]]:
+    """Cached `get_<model_type>_models()`, returning read-only specs.
+
+    Args:
+        model_type: One of the `filter_models` model types, e.g. "chat" for `get_chat_models`.
+    """
+    if model_type not in _MODEL_TYPE_GETTERS:
+        raise ValueError(f"Unknown model type: {model_type}")
+    return _MODEL_TYPE_GETTERS[model_type]()
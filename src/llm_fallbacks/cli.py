@@ -0,0 +1,316 @@
+"""Command line interface: headless catalog queries streamed as JSON Lines or CSV, plus the GUI.
+
+Only the catalog is loaded for the headless subcommands; tkinter and pandas are imported by the `gui`
+subcommand alone, and the provider configs by `gui` and `memory`. The headless subcommands
+never import numpy. Most of their cold start is the interpreter itself, then loading and ranking
+the price map (about 30 ms to import the package and 100-150 ms of work for ~3300 models).
+
+Usage:
+    python -m llm_fallbacks query --type chat --free-only --fields max_input_tokens
+    python -m llm_fallbacks fallbacks embedding --limit 5 --format csv
+    python -m llm_fallbacks cost gpt-4o claude-3-5-sonnet-20240620 --input-tokens 1000 --output-tokens 200
+    python -m llm_fallbacks --offline memory --synthetic 100000 --format csv
+    python -m llm_fallbacks gui
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence, TextIO
+
+from llm_fallbacks.core import (
+    _MODEL_TYPE_GETTERS,
+    PRICE_MAP_SOURCES,
+    get_litellm_models,
+    sort_models_by_cost_and_limits,
+)
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+OUTPUT_FORMATS: tuple[str, ...] = ("jsonl", "csv")
+DEFAULT_FIELDS: tuple[str, ...] = (
+    "litellm_provider",
+    "mode",
+    "input_cost_per_token",
+    "output_cost_per_token",
+    "max_input_tokens",
+    "max_output_tokens",
+)
+MEMORY_COLUMNS: tuple[str, ...] = (
+    "structure",
+    "entries",
+    "objects",
+    "deep_bytes",
+    "exclusive_bytes",
+    "shared_bytes",
+    "spec_dicts",
+    "duplicate_spec_dicts",
+    "duplicate_spec_bytes",
+)
+
+
+def write_rows(
+    rows: Iterable[dict[str, Any]],
+    columns: Sequence[str],
+    output_format: str = "jsonl",
+    out: TextIO | None = None,
+) -> int:
+    """Write rows to `out` (stdout by default) one at a time, and return how many were written.
+
+    Args:
+        rows: Rows keyed by column name; missing columns are written as null / empty.
+        columns: Column order, also the CSV header.
+        output_format: "jsonl" or "csv".
+        out: Text stream to write to.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    out = sys.stdout if out is None else out
+    count = 0
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=list(columns), extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            out.write(json.dumps({column: row.get(column) for column in columns}) + "\n")
+            count += 1
+    return count
+
+
+def _spec_rows(
+    names: Iterable[str],
+    fields: Sequence[str],
+    models: dict[str, LiteLLMBaseModelSpec],
+) -> Iterator[dict[str, Any]]:
+    for rank, name in enumerate(names, start=1):
+        spec = models[name]
+        yield {"rank": rank, "model": name, **{field: spec.get(field) for field in fields}}
+
+
+def query_rows(
+    args: argparse.Namespace,
+) -> Iterator[dict[str, Any]]:
+    """Rows of the `query` subcommand: `filter_models` for one model type, ranking only that type.
+
+    The ranked list is filtered once, so it is scanned in Python rather than loaded into numpy columns.
+    """
+    from llm_fallbacks.query import iter_matching
+
+    models = _MODEL_TYPE_GETTERS[args.model_type]()
+    names = iter_matching(
+        sort_models_by_cost_and_limits(models),
+        free_only=args.free_only,
+        max_cost_per_token=args.max_cost_per_token,
+        min_context_length=args.min_context_length,
+        supports_vision=args.vision,
+        supports_audio_input=args.audio_input,
+        supports_audio_output=args.audio_output,
+        supports_function_calling=args.function_calling,
+        provider=args.provider,
+    )
+    return _spec_rows(itertools.islice(names, args.limit), args.fields, models)
+
+
+def fallback_rows(
+    args: argparse.Namespace,
+) -> Iterator[dict[str, Any]]:
+    """Rows of the `fallbacks` subcommand: the ranked fallback list of one model type."""
+    models = _MODEL_TYPE_GETTERS[args.model_type]()
+    ranked = sort_models_by_cost_and_limits(models, free_only=args.free_only)
+    return _spec_rows((name for name, _ in itertools.islice(ranked, args.limit)), args.fields, models)
+
+
+def cost_rows(
+    args: argparse.Namespace,
+) -> Iterator[dict[str, Any]]:
+    """Rows of the `cost` subcommand: the cost in USD of one call with the given usage, per model."""
+    from llm_fallbacks.cost_evaluator import CostEvaluator, Usage, cost_of
+
+    usage = Usage(
+        input_tokens=args.input_tokens,
+        output_tokens=args.output_tokens,
+        cached_input_tokens=args.cached_input_tokens,
+        images=args.images,
+        audio_seconds=args.audio_seconds,
+    )
+    models = get_litellm_models()
+    for name in args.models:
+        name = name.casefold()
+        if name not in models:
+            raise ValueError(f"Unknown model: {name}")
+        # Compile only this model's pricing rather than the whole catalog's.
+        evaluator = CostEvaluator.from_spec(models[name])
+        yield {"model": name, "cost_usd": cost_of(name, usage, {} if evaluator is None else {name: evaluator})}
+
+
+def memory_rows(
+    args: argparse.Namespace,
+) -> Iterator[dict[str, Any]]:
+    """Rows of the `memory` subcommand: one per catalog structure, then an `(all)` row of totals."""
+    from dataclasses import asdict
+
+    from llm_fallbacks.memory import catalog_structures, measure_structures
+
+    from llm_fallbacks import core
+
+    # Before `catalog_structures` imports the provider configs, which read the catalog once.
+    if args.synthetic is not None:
+        from llm_fallbacks.synthetic import generate_price_map
+
+        core.refresh_litellm_models(generate_price_map(args.synthetic, seed=args.seed))
+    if args.intern:
+        core.intern_catalog()
+    report = measure_structures(catalog_structures())
+    for structure in report.structures:
+        row = asdict(structure)
+        yield {"structure": row.pop("name"), **row}
+    yield {
+        "structure": "(all)",
+        "deep_bytes": report.total_bytes,
+        "spec_dicts": report.spec_dicts,
+        "duplicate_spec_dicts": report.duplicate_spec_dicts,
+        "duplicate_spec_bytes": report.duplicate_spec_bytes,
+    }
+
+
+def _fields(
+    value: str,
+) -> tuple[str, ...]:
+    return tuple(field.strip() for field in value.split(",") if field.strip())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="llm_fallbacks", description="Query the LiteLLM model catalog.")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=(
+            "read the price map bundled with litellm instead of fetching it and skip provider model discovery "
+            "(same as LITELLM_LOCAL_MODEL_COST_MAP=True LLM_FALLBACKS_OFFLINE=True)"
+        ),
+    )
+    parser.add_argument(
+        "--price-map-source",
+        choices=PRICE_MAP_SOURCES,
+        default=None,
+        help="where to read the LiteLLM price map from (same as LLM_FALLBACKS_PRICE_MAP_SOURCE, default: auto)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=OUTPUT_FORMATS, default="jsonl", dest="output_format")
+
+    listing = argparse.ArgumentParser(add_help=False, parents=[output])
+    listing.add_argument("--limit", type=int, default=None, help="maximum number of models to write")
+    listing.add_argument(
+        "--fields",
+        type=_fields,
+        default=DEFAULT_FIELDS,
+        help=f"comma-separated spec fields to write (default: {','.join(DEFAULT_FIELDS)})",
+    )
+
+    query = subparsers.add_parser("query", parents=[listing], help="filter the models of one type")
+    query.add_argument("--type", choices=list(_MODEL_TYPE_GETTERS), default="chat", dest="model_type")
+    query.add_argument("--free-only", action="store_true")
+    query.add_argument("--max-cost-per-token", type=float, default=None)
+    query.add_argument("--min-context-length", type=int, default=None)
+    for flag in ("vision", "audio-input", "audio-output", "function-calling"):
+        query.add_argument(f"--{flag}", action=argparse.BooleanOptionalAction, default=None)
+    query.add_argument("--provider", default=None, help="model name prefix, e.g. openrouter/")
+    query.set_defaults(rows=query_rows, columns=lambda args: ("rank", "model", *args.fields))
+
+    fallbacks = subparsers.add_parser("fallbacks", parents=[listing], help="the ranked fallback list of a type")
+    fallbacks.add_argument("model_type", choices=list(_MODEL_TYPE_GETTERS))
+    fallbacks.add_argument("--free-only", action="store_true")
+    fallbacks.set_defaults(rows=fallback_rows, columns=lambda args: ("rank", "model", *args.fields))
+
+    cost = subparsers.add_parser("cost", parents=[output], help="price one call on each of the given models")
+    cost.add_argument("models", nargs="+")
+    cost.add_argument("--input-tokens", type=int, default=0)
+    cost.add_argument("--output-tokens", type=int, default=0)
+    cost.add_argument("--cached-input-tokens", type=int, default=0)
+    cost.add_argument("--images", type=int, default=0)
+    cost.add_argument("--audio-seconds", type=float, default=0.0)
+    cost.set_defaults(rows=cost_rows, columns=lambda args: ("model", "cost_usd"))
+
+    memory = subparsers.add_parser(
+        "memory", parents=[output], help="deep, shared and duplicated memory of the catalog structures"
+    )
+    memory.add_argument(
+        "--synthetic",
+        type=int,
+        default=None,
+        metavar="N",
+        help="measure a generated catalog of N models instead (see llm_fallbacks.synthetic)",
+    )
+    memory.add_argument("--seed", type=int, default=0, help="seed of the --synthetic catalog")
+    memory.add_argument(
+        "--intern", action="store_true", help="share identical specs first (see llm_fallbacks.interning)"
+    )
+    memory.set_defaults(rows=memory_rows, columns=lambda args: MEMORY_COLUMNS)
+
+    subparsers.add_parser("gui", help="open the model specs browser (the default without a subcommand)")
+    return parser
+
+
+@contextmanager
+def _scoped_environ(
+    overrides: dict[str, str],
+) -> Iterator[None]:
+    """Set environment variables for the duration of one command, restoring the previous values after."""
+    previous = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def main(
+    argv: Sequence[str] | None = None,
+) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    overrides: dict[str, str] = {}
+    if args.offline:
+        overrides["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+        overrides["LLM_FALLBACKS_OFFLINE"] = "True"
+    if args.price_map_source is not None:
+        overrides["LLM_FALLBACKS_PRICE_MAP_SOURCE"] = args.price_map_source
+
+    with _scoped_environ(overrides):
+        if args.command in (None, "gui"):
+            from llm_fallbacks.gui import main as gui_main
+
+            gui_main()
+            return 0
+
+        try:
+            write_rows(args.rows(args), args.columns(args), args.output_format)
+            sys.stdout.flush()
+        except ValueError as e:
+            parser.exit(1, f"{parser.prog}: error: {e}\n")
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`); stop quietly without a second error at exit.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
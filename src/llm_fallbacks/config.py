@@ -11,9 +11,11 @@ if __name__ == "__main__":
 
     sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
+from llm_fallbacks import instrumentation
 from llm_fallbacks.core import (
     calculate_cost_per_token,
     get_litellm_models,
+    get_spec_interner,
     sort_models_by_cost_and_limits,
 )
 
@@ -275,7 +277,8 @@ class CustomProviderConfig(BaseProviderConfig):
     def __post_init__(self):
         self._requested_models: Any = None
         self._parse_api_key()
-        self._parse_models()
+        with instrumentation.span("provider.discover", provider=self.provider_name):
+            self._parse_models()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the CustomProviderConfig to a dictionary for JSON serialization."""
@@ -329,9 +332,13 @@ class CustomProviderConfig(BaseProviderConfig):
             )
             try:
                 key = model_key if model_key in self.ALL_KNOWN_MODELS else model_name
-                entry: LiteLLMBaseModelSpec = self.ALL_KNOWN_MODELS.setdefault(key, model_spec.copy())
+                entry: LiteLLMBaseModelSpec = self.ALL_KNOWN_MODELS.get(key) or model_spec
                 self.model_specs.setdefault(model_name, entry.copy()).update(model_spec)
-                entry.update(model_spec)
+                # Catalog specs may be interned and immutable: replace the entry with the merge, interned
+                # when the catalog is, so that providers applying the same override share one spec.
+                merged: LiteLLMBaseModelSpec = {**entry, **model_spec}  # pyright: ignore[reportAssignmentType]
+                interner = get_spec_interner()
+                self.ALL_KNOWN_MODELS[key] = merged if interner is None else interner.intern(merged)  # pyright: ignore[reportArgumentType]
             except Exception:
                 logger.warning(
                     f"Failed to register model '{model_name}' from '{self.provider_name}'.",
@@ -348,7 +355,8 @@ class CustomProviderConfig(BaseProviderConfig):
                 model_spec.copy(),  # pyright: ignore[reportArgumentType]
             ).update(model_spec)
             if model_name in self.free_models:
-                model_spec.update(self.FREE_COSTS)
+                # `model_spec` may be a shared catalog spec, so merge into a new dict.
+                model_spec = {**model_spec, **self.FREE_COSTS}  # pyright: ignore[reportAssignmentType]
             if calculate_cost_per_token(model_spec) == 0.0:
                 self.free_models.setdefault(model_name, model_spec.copy()).update(model_spec)
 
@@ -406,13 +414,17 @@ class CustomProviderConfig(BaseProviderConfig):
         self._set_free_model_costs(models)
 
     def _get_models_from_api(self):
+        if os.getenv("LLM_FALLBACKS_OFFLINE", False) in {True, "True"}:
+            logger.info(f"LLM_FALLBACKS_OFFLINE is set, not fetching models from '{self.base_url}/models'.")
+            return
         try:
             import requests
 
-            response = requests.get(
-                f"{self.base_url}/models",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-            )
+            with instrumentation.span("provider.fetch", provider=self.provider_name):
+                response = requests.get(
+                    f"{self.base_url}/models",
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                )
             response.raise_for_status()
         except Exception:
             logger.warning(
@@ -437,8 +449,8 @@ def _parse_openrouter_models_response(
         if not model_id:
             continue
 
-        # start with the main provider's template if exists.
-        model_spec: LiteLLMBaseModelSpec = get_litellm_models().get(model_id, {})
+        # start with a copy of the main provider's template if exists; catalog specs are immutable.
+        model_spec: LiteLLMBaseModelSpec = dict(get_litellm_models().get(model_id, {}))  # pyright: ignore[reportAssignmentType]
 
         # Parse pricing information
         pricing = model.get("pricing", {})
@@ -0,0 +1,121 @@
+"""Index of models by context window, to pick cost-ranked models that can accept a prompt of a given size."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from llm_fallbacks.core import sort_models_by_cost_and_limits
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+def context_window(
+    model_spec: LiteLLMBaseModelSpec | Mapping[str, Any],
+) -> int | None:
+    """Return the prompt tokens a model accepts: `max_input_tokens`, else `max_tokens`, else None."""
+    for key in ("max_input_tokens", "max_tokens"):
+        value = model_spec.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            return int(value)
+    return None
+
+
+class _Bucket:
+    """The models of one mode/capability combination, in one array sorted by context window.
+
+    `windows[i]` is the window of the model of cost rank `ranks[i]`, ascending; models of equal
+    window stay in rank order. `names[rank]` is the model of each cost rank.
+    """
+
+    __slots__ = ("names", "ranks", "windows")
+
+    def __init__(
+        self,
+        members: list[tuple[str, int]],
+    ):
+        self.names: list[str] = [name for name, _ in members]
+        self.ranks: list[int] = sorted(range(len(members)), key=lambda rank: members[rank][1])
+        self.windows: list[int] = [members[rank][1] for rank in self.ranks]
+
+    def fitting(
+        self,
+        tokens: int,
+        limit: int | None = None,
+    ) -> tuple[str, ...]:
+        i = bisect_left(self.windows, tokens)
+        fitting = self.ranks[i:]
+        ranks = sorted(fitting) if limit is None else heapq.nsmallest(limit, fitting)
+        return tuple(self.names[rank] for rank in ranks)
+
+
+class ContextWindowIndex:
+    """Cost-ranked models grouped by mode and required capabilities, searchable by prompt size.
+
+    Models are ranked once with `sort_models_by_cost_and_limits`. The first query for a
+    `(mode, require)` combination builds its bucket, one array of the matching models sorted by
+    window in O(n log n) time and O(n) memory; later queries binary-search that array and put the
+    k fitting models back in cost order, i.e. O(log n + k log k), or O(log n + k log m) when only
+    the cheapest m are asked for. Models without a known window are left out, since they cannot be
+    shown to fit.
+
+    Args:
+        models: Model name -> spec, e.g. `get_litellm_models()`.
+        free_only: Only index free models.
+    """
+
+    def __init__(
+        self,
+        models: Mapping[str, LiteLLMBaseModelSpec] | Iterable[tuple[str, LiteLLMBaseModelSpec]],
+        *,
+        free_only: bool = False,
+    ):
+        items = dict(models.items() if isinstance(models, Mapping) else models)
+        self._ranked: list[tuple[str, LiteLLMBaseModelSpec, int]] = [
+            (name, spec, window)
+            for name, spec in sort_models_by_cost_and_limits(items, free_only=free_only)
+            if (window := context_window(spec)) is not None
+        ]
+        self._buckets: dict[tuple[str | None, frozenset[str]], _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(
+        self,
+        mode: str | None,
+        require: frozenset[str],
+    ) -> _Bucket:
+        key = (mode, require)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = _Bucket(
+                        [
+                            (name, window)
+                            for name, spec, window in self._ranked
+                            if (mode is None or spec.get("mode") == mode) and all(spec.get(c) for c in require)
+                        ]
+                    )
+        return bucket
+
+    def models_fitting(
+        self,
+        tokens: int,
+        mode: str | None = None,
+        require: Iterable[str] = (),
+        limit: int | None = None,
+    ) -> tuple[str, ...]:
+        """Return the cost-ranked models whose context window can hold a prompt of `tokens` tokens.
+
+        Args:
+            tokens: Prompt size in tokens.
+            mode: Only models of this mode, e.g. "chat". None accepts any mode.
+            require: Capability flags the models must set, e.g. `("supports_vision",)`.
+            limit: Return only the cheapest `limit` of them.
+        """
+        return self._bucket(mode, frozenset(require)).fitting(tokens, limit)
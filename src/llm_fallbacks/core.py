@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-import http.client
 import json
 import logging
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from llm_fallbacks.config import LiteLLMBaseModelSpec
+    from llm_fallbacks.latency import LatencyStats, RankingWeights
 
 
 import threading
 
+from llm_fallbacks.instrumentation import instrumented
+from llm_fallbacks.interning import InternStats, SpecInterner
+
+logger = logging.getLogger(__name__)
+
 _litellm_models_cache: dict[str, Any] | None = None
 _litellm_models_cache_lock = threading.Lock()
+# Canonical specs of the current price map once `intern_catalog` was called, else None;
+# provider merges intern their overridden specs here too.
+_spec_interner: SpecInterner | None = None
 
 def _get_litellm_models() -> dict[str, Any]:
     global _litellm_models_cache
@@ -25,63 +33,230 @@ def _get_litellm_models() -> dict[str, Any]:
     with _litellm_models_cache_lock:
         if _litellm_models_cache is not None:
             return _litellm_models_cache
+        price_map = _load_litellm_models()
+        _litellm_models_cache = price_map if _spec_interner is None else _intern_price_map(price_map)
+        return _litellm_models_cache
 
-        import importlib.util
-        import socket
-
-        # Ensure the warning is only logged once
-        _logged_warning = getattr(_get_litellm_models, "_logged_warning", False)
 
-        if importlib.util.find_spec("litellm"):
-            import litellm  # pyright: ignore[reportMissingImports]
-            _litellm_models_cache = dict(litellm.model_cost)
-            return _litellm_models_cache
+@instrumented("catalog.intern")
+def _intern_price_map(
+    price_map: dict[str, Any],
+) -> dict[str, Any]:
+    """Share one immutable spec between identical price map entries, with a fresh interner per price map."""
+    global _spec_interner
+
+    interner = SpecInterner()
+    interned = interner.intern_all(price_map)
+    _spec_interner = interner
+    stats = interner.stats()
+    logger.info(
+        f"Interned {stats.seen} model specs into {stats.unique} ({stats.dedup_ratio:.1%} duplicates), "
+        f"saving {stats.bytes_saved / 2**20:.2f} MiB"
+    )
+    return interned
+
+
+def intern_catalog() -> InternStats:
+    """Share one immutable `FrozenSpec` between identical specs of the price map, and report the savings.
+
+    Interning is opt-in: it costs a pass over the price map, and afterwards `get_litellm_models()` and
+    the other getters return read-only specs, so callers must `copy()` a spec before changing it.
+    It stays on for price maps loaded by later `refresh_litellm_models` calls. Call it before
+    importing `llm_fallbacks.config`, whose provider configs bind the catalog at import time.
+    """
+    global _litellm_models_cache, _catalog_version
 
-        def _local_fallback():
-            import importlib.resources
+    price_map = _get_litellm_models()
+    with _litellm_models_cache_lock:
+        _litellm_models_cache = _intern_price_map(price_map)
+        CACHED_LITELLM_MODELS.clear()
+        _catalog_version += 1
+    return get_spec_interner().stats()  # pyright: ignore[reportOptionalMemberAccess]
 
-            with importlib.resources.open_text(
-                "litellm", "model_prices_and_context_window_backup.json"
-            ) as f:
-                return json.load(f)
 
-        if os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) in {True, "True"}:
-            _litellm_models_cache = _local_fallback()
-            return _litellm_models_cache
+def get_spec_interner() -> SpecInterner | None:
+    """Return the interner of the current price map, or None unless `intern_catalog` was called.
 
-        try:
-            if not _logged_warning:
-                logging.warning(
-                    "Attempting to fetch model prices from GitHub (raw.githubusercontent.com). "
-                    "This may hang if the network is slow or unavailable. Timeout is set to 5 seconds."
-                )
-                setattr(_get_litellm_models, "_logged_warning", True)
-            conn = http.client.HTTPSConnection("raw.githubusercontent.com", timeout=1)
-            conn.request("GET", "/BerriAI/litellm/refs/heads/main/model_prices_and_context_window.json")
-            response: http.client.HTTPResponse = conn.getresponse()
-            print(response.status, response.reason)
-        except (http.client.HTTPException, socket.timeout):
-            logging.warning(
-                "Failed to fetch model prices from GitHub (raw.githubusercontent.com). "
-                "Using local fallback."
-            )
-            _litellm_models_cache = _local_fallback()
-            return _litellm_models_cache
-        except Exception:
-            _litellm_models_cache = _local_fallback()
-            return _litellm_models_cache
-        else:
-            if response.status != 200:
-                logging.error(f"Request failed with status: {response.status}: {response.reason}")
-                _litellm_models_cache = _local_fallback()
-                return _litellm_models_cache
-            _litellm_models_cache = json.loads(response.read())
-            return _litellm_models_cache
+    Specs merged later (e.g. provider overrides) should be interned here too, so that identical
+    results share the catalog's canonical specs.
+    """
+    _get_litellm_models()
+    return _spec_interner
+
+
+# Where `_load_litellm_models` reads the price map from, set by `LLM_FALLBACKS_PRICE_MAP_SOURCE`:
+# - "resource": the `model_prices_and_context_window_backup.json` packaged with litellm, read
+#   without importing litellm (the default when `LITELLM_LOCAL_MODEL_COST_MAP` is set).
+# - "snapshot": the last price map fetched by "remote"/"auto", cached at `price_map_snapshot_path()`.
+# - "remote": LiteLLM's current price map from GitHub, cached as the snapshot.
+# - "litellm": `litellm.model_cost`, importing litellm (seconds, and it fetches the remote map itself).
+# - "auto" (default): a snapshot younger than `SNAPSHOT_MAX_AGE_SECONDS`, else "remote" (skipped when
+#   `LLM_FALLBACKS_OFFLINE` is set), else any snapshot, else "resource".
+# Except for "litellm", a source that is unavailable falls back to the next of snapshot and resource.
+PRICE_MAP_SOURCES: tuple[str, ...] = ("auto", "resource", "snapshot", "remote", "litellm")
+PRICE_MAP_RESOURCE: str = "model_prices_and_context_window_backup.json"
+PRICE_MAP_URL: tuple[str, str] = (
+    "raw.githubusercontent.com",
+    "/BerriAI/litellm/refs/heads/main/model_prices_and_context_window.json",
+)
+SNAPSHOT_MAX_AGE_SECONDS: float = 24 * 60 * 60
+
+
+def price_map_source() -> str:
+    """Return the configured price map source, one of `PRICE_MAP_SOURCES`."""
+    source = os.getenv("LLM_FALLBACKS_PRICE_MAP_SOURCE") or (
+        "resource" if os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) in {True, "True"} else "auto"
+    )
+    if source not in PRICE_MAP_SOURCES:
+        raise ValueError(f"Unknown price map source: {source}")
+    return source
+
+
+def price_map_snapshot_path() -> str:
+    """Return where the price map snapshot is cached: `LLM_FALLBACKS_PRICE_MAP_SNAPSHOT`, else the user cache dir."""
+    path = os.getenv("LLM_FALLBACKS_PRICE_MAP_SNAPSHOT")
+    if path:
+        return path
+    cache_dir = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "llm_fallbacks", "model_prices_and_context_window.json")
+
+
+def _read_resource_price_map() -> dict[str, Any]:
+    """Read the price map packaged with litellm without executing `litellm/__init__.py`."""
+    import importlib.resources
+    import importlib.util
+
+    spec = importlib.util.find_spec("litellm")
+    if spec is None:
+        raise ModuleNotFoundError("litellm is not installed, so its packaged price map is unavailable")
+    # The loader's resource reader serves the package's files (also from a zip) like
+    # `importlib.resources.files("litellm")`, which would import the package first.
+    get_resource_reader = getattr(spec.loader, "get_resource_reader", None)
+    reader = get_resource_reader(spec.name) if get_resource_reader is not None else None
+    if reader is not None:
+        with reader.files().joinpath(PRICE_MAP_RESOURCE).open("r", encoding="utf-8") as f:
+            return json.load(f)
+    with importlib.resources.files("litellm").joinpath(PRICE_MAP_RESOURCE).open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_snapshot_price_map(
+    max_age: float | None = None,
+) -> dict[str, Any] | None:
+    """Read the cached snapshot, or return None when there is none or it is older than `max_age` seconds."""
+    import time
+
+    path = price_map_snapshot_path()
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot_price_map(
+    price_map: dict[str, Any],
+):
+    path = price_map_snapshot_path()
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(price_map, f)
+        os.replace(f"{path}.tmp", path)
+    except OSError:
+        logger.warning(f"Failed to cache the price map snapshot at '{path}'.", exc_info=True)
+
+
+def _fetch_remote_price_map() -> dict[str, Any] | None:
+    """Fetch LiteLLM's current price map from GitHub, or return None on failure."""
+    import http.client
+    import socket
+
+    # Ensure the warning is only logged once
+    if not getattr(_fetch_remote_price_map, "_logged_warning", False):
+        logging.warning(
+            "Attempting to fetch model prices from GitHub (raw.githubusercontent.com). "
+            "This may hang if the network is slow or unavailable. Timeout is set to 5 seconds."
+        )
+        setattr(_fetch_remote_price_map, "_logged_warning", True)
+    try:
+        conn = http.client.HTTPSConnection(PRICE_MAP_URL[0], timeout=5)
+        conn.request("GET", PRICE_MAP_URL[1])
+        response: http.client.HTTPResponse = conn.getresponse()
+        if response.status != 200:
+            logging.error(f"Request failed with status: {response.status}: {response.reason}")
+            return None
+        return json.loads(response.read())
+    except (http.client.HTTPException, socket.timeout, OSError, ValueError):
+        logging.warning("Failed to fetch model prices from GitHub (raw.githubusercontent.com).")
+        return None
+
+
+@instrumented("catalog.fetch")
+def _load_litellm_models() -> dict[str, Any]:
+    """Load the LiteLLM price map from the source chosen by `price_map_source()`."""
+    source = price_map_source()
+    if source == "resource":
+        return _read_resource_price_map()
+    if source == "litellm":
+        import litellm  # pyright: ignore[reportMissingImports]
+
+        return dict(litellm.model_cost)
+
+    if source == "auto":
+        price_map = _read_snapshot_price_map(max_age=SNAPSHOT_MAX_AGE_SECONDS)
+        if price_map is not None:
+            return price_map
+    if source == "remote" or (source == "auto" and os.getenv("LLM_FALLBACKS_OFFLINE", False) not in {True, "True"}):
+        price_map = _fetch_remote_price_map()
+        if price_map is not None:
+            _write_snapshot_price_map(price_map)
+            return price_map
+    price_map = _read_snapshot_price_map()
+    if price_map is not None:
+        return price_map
+    if source != "auto":
+        logger.warning(f"No price map from the '{source}' source; using the one packaged with litellm.")
+    return _read_resource_price_map()
 
 
 if "CACHED_LITELLM_MODELS" not in globals():
     CACHED_LITELLM_MODELS: dict[str, LiteLLMBaseModelSpec] = {}
 
+_catalog_version: int = 0
+
+
+def get_catalog_version() -> int:
+    """Return a counter that changes whenever `refresh_litellm_models` replaces the cached price map.
+
+    Anything derived from the catalog (compiled evaluators, indexes, cached queries) can store the
+    version it was built from and rebuild when it no longer matches.
+    """
+    return _catalog_version
+
+
+def refresh_litellm_models(
+    price_map: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Drop the cached LiteLLM price map, load it again and bump the catalog version.
+
+    Args:
+        price_map: A price map in LiteLLM's `model_prices_and_context_window.json` format to use
+            instead of loading one, e.g. a pinned snapshot for tests and benchmarks.
+    """
+    global _litellm_models_cache, _catalog_version
+
+    with _litellm_models_cache_lock:
+        if price_map is None:
+            _litellm_models_cache = None
+        else:
+            _litellm_models_cache = price_map if _spec_interner is None else _intern_price_map(price_map)
+        CACHED_LITELLM_MODELS.clear()
+        _catalog_version += 1
+    return _get_litellm_models()
+
 
 def get_litellm_models(
     *,
@@ -100,6 +275,14 @@ def get_litellm_models(
     if CACHED_LITELLM_MODELS:
         return CACHED_LITELLM_MODELS
 
+    return _normalize_litellm_models(test_prepend_provider)
+
+
+@instrumented("catalog.normalize")
+def _normalize_litellm_models(
+    test_prepend_provider: bool,
+) -> dict[str, LiteLLMBaseModelSpec]:
+    """Key the price map's specs by casefolded model name, dropping LiteLLM's `sample_spec` entry."""
     models: dict[str, LiteLLMBaseModelSpec] = {}
     for k, v in _get_litellm_models().items():
         casefold_key = model_key = str(k).casefold()
@@ -195,6 +378,82 @@ def calculate_cost_per_token(
     return final_cost
 
 
+# Per-request quantities a workload is priced on. `pricing_coefficients` returns one price per
+# quantity for prompts up to `PRICING_TIER_THRESHOLD` tokens, then one per quantity for longer
+# prompts (the `*_above_128k_tokens` tier, which applies to the whole request), then a flat
+# price per request.
+PRICED_QUANTITIES: tuple[str, ...] = ("input_tokens", "cached_input_tokens", "output_tokens", "images", "audio_seconds")
+PRICING_TIER_THRESHOLD: int = 128_000
+CHARACTERS_PER_TOKEN: float = 4.0
+
+
+def _price(
+    model_spec: LiteLLMBaseModelSpec,
+    key: str,
+    multiplier: float = 1.0,
+) -> float | None:
+    value = model_spec.get(key)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+        return float(value) * multiplier
+    return None
+
+
+def _first_price(
+    *prices: float | None,
+) -> float | None:
+    return next((price for price in prices if price is not None), None)
+
+
+def pricing_coefficients(
+    model_spec: LiteLLMBaseModelSpec,
+) -> tuple[float, ...] | None:
+    """Return the linear price coefficients of a model, or None if it has no usable pricing.
+
+    The result has `2 * len(PRICED_QUANTITIES) + 1` entries: the price per unit of each
+    `PRICED_QUANTITIES` entry below the tier threshold, the same above it, and the price per request.
+    Character prices are converted at `CHARACTERS_PER_TOKEN`, cache reads fall back to the normal
+    input price, and a missing above-128k price falls back to the base price.
+    """
+    input_token = _first_price(
+        _price(model_spec, "input_cost_per_token"),
+        _price(model_spec, "input_cost_per_character", CHARACTERS_PER_TOKEN),
+    )
+    output_token = _first_price(
+        _price(model_spec, "output_cost_per_token"),
+        _price(model_spec, "output_cost_per_character", CHARACTERS_PER_TOKEN),
+    )
+    cached_token = _first_price(
+        _price(model_spec, "cache_read_input_token_cost"),
+        _price(model_spec, "input_cost_per_token_cache_hit"),
+    )
+    image = _price(model_spec, "input_cost_per_image")
+    audio_second = _price(model_spec, "input_cost_per_audio_per_second")
+    request = _first_price(_price(model_spec, "input_cost_per_request"), _price(model_spec, "input_cost_per_query"))
+    base = (input_token, cached_token, output_token, image, audio_second)
+    above = (
+        _first_price(
+            _price(model_spec, "input_cost_per_token_above_128k_tokens"),
+            _price(model_spec, "input_cost_per_character_above_128k_tokens", CHARACTERS_PER_TOKEN),
+        ),
+        None,
+        _first_price(
+            _price(model_spec, "output_cost_per_token_above_128k_tokens"),
+            _price(model_spec, "output_cost_per_character_above_128k_tokens", CHARACTERS_PER_TOKEN),
+        ),
+        _price(model_spec, "input_cost_per_image_above_128k_tokens"),
+        _price(model_spec, "input_cost_per_audio_per_second_above_128k_tokens"),
+    )
+    if all(price is None for price in (*base, *above, request)):
+        return None
+
+    base_prices = [0.0 if price is None else price for price in base]
+    base_prices[1] = _first_price(cached_token, input_token) or 0.0
+    above_prices = [base_prices[i] if price is None else price for i, price in enumerate(above)]
+    if cached_token is None:
+        above_prices[1] = above_prices[0]
+    return (*base_prices, *above_prices, request or 0.0)
+
+
 def calculate_approx_max_tokens(
     model_spec: LiteLLMBaseModelSpec,
 ) -> float:
@@ -226,9 +485,13 @@ def calculate_approx_max_tokens(
     return final_total
 
 
+@instrumented("ranking.sort")
 def sort_models_by_cost_and_limits(
     models: dict[str, LiteLLMBaseModelSpec],
     free_only: bool = False,
+    *,
+    latency_stats: LatencyStats | None = None,
+    weights: RankingWeights | None = None,
 ) -> list[tuple[str, LiteLLMBaseModelSpec]]:
     """Sort models by cost (primary) and token limits (secondary).
 
@@ -236,11 +499,19 @@ def sort_models_by_cost_and_limits(
     ----
         models: Dictionary of model specifications. If None, will call get_litellm_models()
         free_only: If True, only return models with zero cost
+        latency_stats: Observed latencies. When given, models are instead ranked by the weighted
+            cost/context/latency score of `llm_fallbacks.latency.LatencyAwareRanker`. Build the
+            ranker directly to re-rank cheaply as the statistics change.
+        weights: Score weights used with `latency_stats`
 
     Returns:
     -------
         list of tuples mapping model names to their original specifications, sorted by cost and token limits
     """
+    if latency_stats is not None:
+        from llm_fallbacks.latency import LatencyAwareRanker
+
+        return LatencyAwareRanker(models, latency_stats, weights, free_only=free_only).rank()
 
     def _negative_one_to_inf(x: float | int) -> float | int:
         return float("inf") if x in {-1, -1.0} else x
@@ -577,6 +848,25 @@ def get_models() -> dict[str, LiteLLMBaseModelSpec]:
     return get_litellm_models()
 
 
+# Model type -> getter of its models, the types accepted by `get_fallback_list` and `filter_models`.
+_MODEL_TYPE_GETTERS: dict[str, Callable[[], dict[str, LiteLLMBaseModelSpec]]] = {
+    "chat": get_chat_models,
+    "completion": get_completion_models,
+    "embedding": get_embedding_models,
+    "image_generation": get_image_generation_models,
+    "audio_transcription": get_audio_transcription_models,
+    "audio_speech": get_audio_speech_models,
+    "moderation": get_moderation_models,
+    "rerank": get_rerank_models,
+    "vision": get_vision_models,
+    "function_calling": get_function_calling_models,
+    "image_input": get_image_input_models,
+    "audio_input": get_audio_input_models,
+    "audio_output": get_audio_output_models,
+    "pdf_input": get_pdf_input_models,
+}
+
+
 def get_fallback_list(
     model_type: str,
 ) -> list[str]:
@@ -594,26 +884,10 @@ def get_fallback_list(
     ------
         ValueError: If model_type is not recognized
     """
-    fallbacks: dict[str, list[tuple[str, LiteLLMBaseModelSpec]]] = {
-        "audio_input": sort_models_by_cost_and_limits(get_audio_input_models()),
-        "audio_output": sort_models_by_cost_and_limits(get_audio_output_models()),
-        "audio_speech": sort_models_by_cost_and_limits(get_audio_speech_models()),
-        "audio_transcription": sort_models_by_cost_and_limits(get_audio_transcription_models()),
-        "chat": sort_models_by_cost_and_limits(get_chat_models()),
-        "completion": sort_models_by_cost_and_limits(get_completion_models()),
-        "embedding": sort_models_by_cost_and_limits(get_embedding_models()),
-        "function_calling": sort_models_by_cost_and_limits(get_function_calling_models()),
-        "image_generation": sort_models_by_cost_and_limits(get_image_generation_models()),
-        "image_input": sort_models_by_cost_and_limits(get_image_input_models()),
-        "moderation": sort_models_by_cost_and_limits(get_moderation_models()),
-        "pdf_input": sort_models_by_cost_and_limits(get_pdf_input_models()),
-        "rerank": sort_models_by_cost_and_limits(get_rerank_models()),
-        "vision": sort_models_by_cost_and_limits(get_vision_models()),
-    }
-
-    if model_type not in fallbacks:
+    if model_type not in _MODEL_TYPE_GETTERS:
         raise ValueError(
-            f"Unknown model type: {model_type}. Available types: {', '.join(sorted(fallbacks.keys()))}"
+            f"Unknown model type: {model_type}. Available types: {', '.join(sorted(_MODEL_TYPE_GETTERS))}"
         )
 
-    return [model for model, _ in fallbacks[model_type]]
+    # Only rank the requested type; ranking all of them costs a full catalog pass each.
+    return [model for model, _ in sort_models_by_cost_and_limits(_MODEL_TYPE_GETTERS[model_type]())]
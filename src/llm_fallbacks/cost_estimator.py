@@ -0,0 +1,168 @@
+"""Vectorized cost of a request workload across many models, with the above-128k pricing tier applied per request."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+import numpy as np
+
+from llm_fallbacks.core import PRICED_QUANTITIES, PRICING_TIER_THRESHOLD, pricing_coefficients
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+_N_QUANTITIES = len(PRICED_QUANTITIES)
+
+
+@dataclass
+class Workload:
+    """A trace of requests as parallel arrays, one entry per request.
+
+    Build it with `Workload.from_arrays`, which accepts scalars for fields shared by all requests.
+    """
+
+    input_tokens: np.ndarray
+    output_tokens: np.ndarray
+    cache_hit_ratio: np.ndarray
+    images: np.ndarray
+    audio_seconds: np.ndarray
+
+    @classmethod
+    def from_arrays(
+        cls,
+        input_tokens: ArrayLike,
+        output_tokens: ArrayLike,
+        cache_hit_ratio: ArrayLike = 0.0,
+        images: ArrayLike = 0,
+        audio_seconds: ArrayLike = 0.0,
+    ) -> Workload:
+        """Build a workload, broadcasting scalar fields to the number of requests."""
+        fields = (input_tokens, output_tokens, cache_hit_ratio, images, audio_seconds)
+        arrays = np.broadcast_arrays(*(np.asarray(field, dtype=np.float64) for field in fields))
+        if arrays[0].ndim != 1:
+            raise ValueError(f"Workload fields must be 1-D arrays, got shape {arrays[0].shape}")
+        if np.any((arrays[2] < 0) | (arrays[2] > 1)):
+            raise ValueError("cache_hit_ratio must be between 0 and 1")
+        return cls(*(np.ascontiguousarray(a) for a in arrays))
+
+    def __len__(self) -> int:
+        return len(self.input_tokens)
+
+    def features(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> np.ndarray:
+        """Return the `(requests, 2 * len(PRICED_QUANTITIES) + 1)` feature matrix of a slice of the workload.
+
+        Each row holds the request's priced quantities in the base-tier columns or, when its prompt
+        exceeds `PRICING_TIER_THRESHOLD` tokens, in the above-tier columns, followed by a 1 for the
+        per-request price. Row @ `pricing_coefficients(spec)` is then the request's exact cost.
+        """
+        input_tokens = self.input_tokens[start:stop]
+        cached = input_tokens * self.cache_hit_ratio[start:stop]
+        quantities = np.stack(
+            (
+                input_tokens - cached,
+                cached,
+                self.output_tokens[start:stop],
+                self.images[start:stop],
+                self.audio_seconds[start:stop],
+            ),
+            axis=1,
+        )
+        above = (input_tokens > PRICING_TIER_THRESHOLD)[:, None]
+        features = np.empty((len(input_tokens), 2 * _N_QUANTITIES + 1))
+        features[:, :_N_QUANTITIES] = np.where(above, 0.0, quantities)
+        features[:, _N_QUANTITIES:-1] = np.where(above, quantities, 0.0)
+        features[:, -1] = 1.0
+        return features
+
+
+class CostEstimator:
+    """Price workloads against a set of models in one matrix product.
+
+    The pricing of every model is extracted once into a coefficient matrix, so the cost of each
+    request on each model is `workload.features() @ coefficients`. Models without usable pricing
+    are left out (see `pricing_coefficients`).
+
+    Args:
+        models: Model name -> spec, e.g. `get_chat_models()`. Order decides ties in `cheapest`.
+    """
+
+    def __init__(
+        self,
+        models: Mapping[str, LiteLLMBaseModelSpec] | Iterable[tuple[str, LiteLLMBaseModelSpec]],
+    ):
+        names: list[str] = []
+        columns: list[tuple[float, ...]] = []
+        for name, spec in models.items() if isinstance(models, Mapping) else models:
+            coefficients = pricing_coefficients(spec)
+            if coefficients is not None:
+                names.append(name)
+                columns.append(coefficients)
+        self.model_names: list[str] = names
+        # An explicit coefficient count keeps the shape valid when no model is priced.
+        coefficients = np.array(columns, dtype=np.float64).reshape(len(columns), 2 * _N_QUANTITIES + 1)
+        self.coefficients: np.ndarray = coefficients.T
+        # Many models share a price list (e.g. all free models); `cheapest` only scores one column
+        # per distinct price list, ordered by first occurrence so ties keep the caller's order.
+        unique, first_index = np.unique(self.coefficients.T, axis=0, return_index=True)
+        order = np.argsort(first_index)
+        self._unique_coefficients: np.ndarray = np.ascontiguousarray(unique[order].T)
+        self._unique_first_model: np.ndarray = first_index[order]
+
+    def cost_matrix(
+        self,
+        workload: Workload,
+    ) -> np.ndarray:
+        """Return the `(requests, models)` matrix of costs in USD, columns in `model_names` order."""
+        return workload.features() @ self.coefficients
+
+    def total_costs(
+        self,
+        workload: Workload,
+        chunk_size: int = 65536,
+    ) -> np.ndarray:
+        """Return the cost of the whole workload on each model, without materializing the full matrix."""
+        totals = np.zeros(len(self.model_names))
+        for start in range(0, len(workload), chunk_size):
+            totals += workload.features(start, start + chunk_size).sum(axis=0) @ self.coefficients
+        return totals
+
+    def cheapest(
+        self,
+        workload: Workload,
+        chunk_size: int = 8192,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the cheapest model for every request.
+
+        Processes the workload in chunks of `chunk_size` requests to bound memory, and scores each
+        distinct price list once, so a million-request trace over the full catalog takes seconds.
+
+        Returns:
+            The index into `model_names` of each request's cheapest model, and that model's cost.
+        """
+        if not self.model_names:
+            raise ValueError("CostEstimator has no priced models to choose from.")
+        indices = np.empty(len(workload), dtype=np.intp)
+        costs = np.empty(len(workload))
+        for start in range(0, len(workload), chunk_size):
+            stop = min(start + chunk_size, len(workload))
+            chunk_costs = workload.features(start, stop) @ self._unique_coefficients
+            best = chunk_costs.argmin(axis=1)
+            indices[start:stop] = self._unique_first_model[best]
+            costs[start:stop] = chunk_costs[np.arange(stop - start), best]
+        return indices, costs
+
+    def cheapest_models(
+        self,
+        workload: Workload,
+    ) -> list[str]:
+        """Return the name of the cheapest model for every request."""
+        indices, _ = self.cheapest(workload)
+        return [self.model_names[i] for i in indices]
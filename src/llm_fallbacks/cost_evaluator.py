@@ -0,0 +1,165 @@
+"""Per-model cost evaluators compiled once per catalog version, for pricing completed calls on the hot path."""
+
+from __future__ import annotations
+
+import threading
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from llm_fallbacks.core import (
+    PRICED_QUANTITIES,
+    PRICING_TIER_THRESHOLD,
+    get_catalog_version,
+    get_litellm_models,
+    pricing_coefficients,
+)
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+@dataclass(frozen=True, slots=True)
+class Usage:
+    """Token and media usage of one completed call.
+
+    `input_tokens` counts the whole prompt, including the `cached_input_tokens` served from the
+    provider's prompt cache.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    images: int = 0
+    audio_seconds: float = 0.0
+
+    @classmethod
+    def from_openai(
+        cls,
+        usage: Mapping[str, Any],
+    ) -> Usage:
+        """Build a usage from an OpenAI-style `usage` object (`prompt_tokens`, `completion_tokens`, ...)."""
+        details = usage.get("prompt_tokens_details") or {}
+        return cls(
+            input_tokens=usage.get("prompt_tokens") or 0,
+            output_tokens=usage.get("completion_tokens") or 0,
+            cached_input_tokens=details.get("cached_tokens") or 0,
+        )
+
+
+class CostEvaluator:
+    """The pricing of one model as two coefficient tuples and the prompt size that switches between them.
+
+    Calling the evaluator is a handful of multiply-adds; build it with `from_spec` or `compile_pricing`.
+    """
+
+    __slots__ = ("above", "base", "per_request", "tier_threshold")
+
+    def __init__(
+        self,
+        coefficients: tuple[float, ...],
+        tier_threshold: int = PRICING_TIER_THRESHOLD,
+    ):
+        n = len(PRICED_QUANTITIES)
+        self.base: tuple[float, ...] = coefficients[:n]
+        self.above: tuple[float, ...] = coefficients[n : 2 * n]
+        self.per_request: float = coefficients[2 * n]
+        self.tier_threshold: int = tier_threshold
+
+    @classmethod
+    def from_spec(
+        cls,
+        model_spec: LiteLLMBaseModelSpec,
+    ) -> CostEvaluator | None:
+        """Compile a model's pricing, or return None if it has no usable pricing."""
+        coefficients = pricing_coefficients(model_spec)
+        return None if coefficients is None else cls(coefficients)
+
+    def __call__(
+        self,
+        usage: Usage,
+    ) -> float:
+        """Return the cost of `usage` in USD."""
+        input_price, cached_price, output_price, image_price, audio_price = (
+            self.above if usage.input_tokens > self.tier_threshold else self.base
+        )
+        return (
+            (usage.input_tokens - usage.cached_input_tokens) * input_price
+            + usage.cached_input_tokens * cached_price
+            + usage.output_tokens * output_price
+            + usage.images * image_price
+            + usage.audio_seconds * audio_price
+            + self.per_request
+        )
+
+    def batch(
+        self,
+        usages: Iterable[Usage],
+    ) -> list[float]:
+        """Return the cost of each usage in USD."""
+        return [self(usage) for usage in usages]
+
+
+def compile_pricing(
+    models: Mapping[str, LiteLLMBaseModelSpec],
+) -> dict[str, CostEvaluator]:
+    """Compile an evaluator for every model with usable pricing."""
+    evaluators: dict[str, CostEvaluator] = {}
+    for name, spec in models.items():
+        evaluator = CostEvaluator.from_spec(spec)
+        if evaluator is not None:
+            evaluators[name] = evaluator
+    return evaluators
+
+
+_compiled_catalog: tuple[int, dict[str, CostEvaluator]] | None = None
+_compiled_catalog_lock = threading.Lock()
+
+
+def catalog_evaluators() -> dict[str, CostEvaluator]:
+    """Return the evaluators of the LiteLLM catalog, compiled once per `get_catalog_version()`."""
+    global _compiled_catalog
+
+    version = get_catalog_version()
+    compiled = _compiled_catalog
+    if compiled is not None and compiled[0] == version:
+        return compiled[1]
+    with _compiled_catalog_lock:
+        if _compiled_catalog is None or _compiled_catalog[0] != version:
+            _compiled_catalog = (version, compile_pricing(get_litellm_models()))
+        return _compiled_catalog[1]
+
+
+def _evaluator(
+    model: str,
+    evaluators: Mapping[str, CostEvaluator] | None,
+) -> CostEvaluator:
+    evaluators = catalog_evaluators() if evaluators is None else evaluators
+    try:
+        return evaluators[model]
+    except KeyError:
+        raise ValueError(f"No pricing known for model: {model}") from None
+
+
+def cost_of(
+    model: str,
+    usage: Usage,
+    evaluators: Mapping[str, CostEvaluator] | None = None,
+) -> float:
+    """Return the cost in USD of a call to `model`.
+
+    Args:
+        model: The model name, as keyed in the catalog.
+        usage: The call's usage.
+        evaluators: Compiled evaluators to use instead of the LiteLLM catalog's, see `compile_pricing`.
+    """
+    return _evaluator(model, evaluators)(usage)
+
+
+def cost_of_batch(
+    model: str,
+    usages: Iterable[Usage],
+    evaluators: Mapping[str, CostEvaluator] | None = None,
+) -> list[float]:
+    """Return the cost in USD of each of several calls to `model`, resolving its evaluator once."""
+    return _evaluator(model, evaluators).batch(usages)
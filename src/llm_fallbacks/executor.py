@@ -0,0 +1,254 @@
+"""In-process execution of a fallback list with sequential failover, hedging and deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Returned by `FallbackExecutor._attempt` when the attempt failed over.
+_FAILED: Any = object()
+
+
+class FallbackExhaustedError(RuntimeError):
+    """Raised when every model in the fallback list failed."""
+
+    def __init__(
+        self,
+        errors: list[tuple[str, BaseException]],
+    ):
+        self.errors: list[tuple[str, BaseException]] = errors
+        details = "; ".join(f"{model}: {error.__class__.__name__}: {error}" for model, error in errors)
+        super().__init__(f"All {len(errors)} fallback attempts failed ({details})")
+
+
+class FallbackTimeoutError(TimeoutError):
+    """Raised when the per-call deadline expires before any model succeeded."""
+
+    def __init__(
+        self,
+        deadline: float,
+        errors: list[tuple[str, BaseException]],
+    ):
+        self.errors: list[tuple[str, BaseException]] = errors
+        super().__init__(f"No fallback succeeded within {deadline}s ({len(errors)} attempts failed)")
+
+
+class FallbackExecutor:
+    """Call models from an ordered fallback list until one succeeds.
+
+    Without `hedge_delay`, models are tried strictly one after another. With it, the next model
+    is also launched whenever the newest in-flight attempt has been running for `hedge_delay`
+    seconds (typically that model's p95 latency), and the first success wins; the remaining
+    attempts are cancelled (async) or abandoned (sync). A failed attempt frees its slot, and the
+    next model is launched in it immediately, even while hedges are still running.
+
+    Args:
+        models: Model names in fallback order, e.g. the result of `get_fallback_list`.
+        hedge_delay: Seconds to wait before hedging, or a callable returning the delay for a model
+            (None disables hedging after that model).
+        deadline: Seconds allowed for the whole call, after which `FallbackTimeoutError` is raised.
+        retry_on: Exception types that trigger failover. Anything else is raised immediately.
+        max_concurrency: Maximum number of attempts in flight at once when hedging.
+
+    Example:
+        ```python
+        executor = FallbackExecutor(get_fallback_list("chat")[:5], hedge_delay=2.0, deadline=30.0)
+        response = executor.call(lambda model: litellm.completion(model=model, messages=messages))
+        ```
+    """
+
+    def __init__(
+        self,
+        models: Sequence[str],
+        *,
+        hedge_delay: float | Callable[[str], float | None] | None = None,
+        deadline: float | None = None,
+        retry_on: tuple[type[BaseException], ...] = (Exception,),
+        max_concurrency: int = 2,
+    ):
+        if not models:
+            raise ValueError("FallbackExecutor needs at least one model.")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.models: list[str] = list(models)
+        self.hedge_delay = hedge_delay
+        self.deadline: float | None = deadline
+        self.retry_on: tuple[type[BaseException], ...] = retry_on
+        self.max_concurrency: int = max_concurrency
+
+    def _hedge_delay_for(self, model: str) -> float | None:
+        if self.hedge_delay is None:
+            return None
+        if callable(self.hedge_delay):
+            return self.hedge_delay(model)
+        return float(self.hedge_delay)
+
+    def _wait_timeout(
+        self,
+        now: float,
+        started: float,
+        last_launch: float,
+        last_model: str,
+        in_flight: int,
+        next_index: int,
+    ) -> float | None:
+        """Seconds until the next hedge or the deadline, whichever comes first."""
+        timeouts: list[float] = []
+        if self.deadline is not None:
+            timeouts.append(started + self.deadline - now)
+        delay = self._hedge_delay_for(last_model)
+        if delay is not None and next_index < len(self.models) and in_flight < self.max_concurrency:
+            timeouts.append(last_launch + delay - now)
+        return max(0.0, min(timeouts)) if timeouts else None
+
+    def _attempt(
+        self,
+        fn: Callable[[str], T],
+        model: str,
+        errors: list[tuple[str, BaseException]],
+    ) -> T:
+        """Return `fn(model)`, or `_FAILED` after recording an error that triggers failover."""
+        try:
+            return fn(model)
+        except self.retry_on as e:
+            logger.debug(f"Fallback attempt '{model}' failed: {e.__class__.__name__}: {e}")
+            errors.append((model, e))
+            return _FAILED
+
+    def _launch_count(
+        self,
+        now: float,
+        last_launch: float,
+        in_flight: int,
+        next_index: int,
+        failures: int,
+    ) -> int:
+        """How many of the next models to launch after a wait, within `max_concurrency`.
+
+        One per attempt that just failed, so a failure frees its slot for the next model right away,
+        and otherwise one when nothing is in flight or the newest attempt outlived its hedge delay.
+        """
+        delay = self._hedge_delay_for(self.models[next_index - 1])
+        hedge_due = delay is not None and now - last_launch >= delay
+        wanted = max(failures, int(hedge_due or not in_flight))
+        return max(0, min(wanted, self.max_concurrency - in_flight, len(self.models) - next_index))
+
+    def call(
+        self,
+        fn: Callable[[str], T],
+    ) -> T:
+        """Run `fn(model)` over the fallback list and return the first successful result."""
+        if self.hedge_delay is None and self.deadline is None:
+            errors: list[tuple[str, BaseException]] = []
+            for model in self.models:
+                result = self._attempt(fn, model, errors)
+                if result is not _FAILED:
+                    return result
+            raise FallbackExhaustedError(errors)
+
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="llm-fallbacks",
+        )
+        try:
+            return self._call_in_pool(pool, fn)
+        finally:
+            # Abandoned hedges finish in the background; their results are discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _call_in_pool(
+        self,
+        pool: concurrent.futures.ThreadPoolExecutor,
+        fn: Callable[[str], T],
+    ) -> T:
+        errors: list[tuple[str, BaseException]] = []
+        in_flight: dict[concurrent.futures.Future[T], str] = {}
+        started = last_launch = time.monotonic()
+        in_flight[pool.submit(fn, self.models[0])] = self.models[0]
+        next_index = 1
+        while True:
+            now = time.monotonic()
+            timeout = self._wait_timeout(
+                now, started, last_launch, self.models[next_index - 1], len(in_flight), next_index
+            )
+            done, _ = concurrent.futures.wait(
+                in_flight,
+                timeout=timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            failures = len(errors)
+            for future in done:
+                model = in_flight.pop(future)
+                error = future.exception()
+                if error is None:
+                    for loser in in_flight:
+                        loser.cancel()
+                    return future.result()
+                if not isinstance(error, self.retry_on):
+                    raise error
+                logger.debug(f"Fallback attempt '{model}' failed: {error.__class__.__name__}: {error}")
+                errors.append((model, error))
+            failures = len(errors) - failures
+
+            now = time.monotonic()
+            if self.deadline is not None and now - started >= self.deadline:
+                for loser in in_flight:
+                    loser.cancel()
+                raise FallbackTimeoutError(self.deadline, errors)
+            if not in_flight and next_index >= len(self.models):
+                raise FallbackExhaustedError(errors)
+            for _ in range(self._launch_count(now, last_launch, len(in_flight), next_index, failures)):
+                in_flight[pool.submit(fn, self.models[next_index])] = self.models[next_index]
+                next_index += 1
+                last_launch = now
+
+    async def acall(
+        self,
+        fn: Callable[[str], Awaitable[T]],
+    ) -> T:
+        """Async variant of `call`: await `fn(model)` over the fallback list, cancelling losing attempts."""
+        loop = asyncio.get_running_loop()
+        errors: list[tuple[str, BaseException]] = []
+        in_flight: dict[asyncio.Task[Any], str] = {}
+        started = last_launch = loop.time()
+        in_flight[asyncio.ensure_future(fn(self.models[0]))] = self.models[0]
+        next_index = 1
+        try:
+            while True:
+                now = loop.time()
+                timeout = self._wait_timeout(
+                    now, started, last_launch, self.models[next_index - 1], len(in_flight), next_index
+                )
+                done, _ = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                failures = len(errors)
+                for task in done:
+                    model = in_flight.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not isinstance(error, self.retry_on):
+                        raise error
+                    logger.debug(f"Fallback attempt '{model}' failed: {error.__class__.__name__}: {error}")
+                    errors.append((model, error))
+                failures = len(errors) - failures
+
+                now = loop.time()
+                if self.deadline is not None and now - started >= self.deadline:
+                    raise FallbackTimeoutError(self.deadline, errors)
+                if not in_flight and next_index >= len(self.models):
+                    raise FallbackExhaustedError(errors)
+                for _ in range(self._launch_count(now, last_launch, len(in_flight), next_index, failures)):
+                    in_flight[asyncio.ensure_future(fn(self.models[next_index]))] = self.models[next_index]
+                    next_index += 1
+                    last_launch = now
+        finally:
+            for task in in_flight:
+                task.cancel()
@@ -0,0 +1,153 @@
+"""Writers for the JSON model catalogs published next to the generated configs."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import re
+
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from typing_extensions import Literal  # pyright: ignore[reportMissingModuleSource]
+
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+    ShardBy = Literal["mode", "provider"]
+else:
+    ShardBy = str
+
+
+INDEX_FILENAME = "index.json"
+
+
+def format_float(value: float) -> str:
+    """Format a float as the shortest positional decimal that round-trips exactly.
+
+    Unlike `f"{value:.100f}"`, this never pads with binary noise and never switches to
+    scientific notation, e.g. `1e-07` becomes `0.0000001` and `2.0` stays `2.0`.
+
+    Args:
+        value: The float to format.
+
+    Returns:
+        The decimal string. NaN and infinities are returned as `nan`, `inf` and `-inf`.
+    """
+    if math.isnan(value) or math.isinf(value):
+        return repr(value)
+    text = format(Decimal(repr(value)), "f")
+    if "." not in text:
+        text += ".0"
+    return text
+
+
+def dumps_models(
+    models: Mapping[str, Any],
+    *,
+    compact: bool = False,
+) -> str:
+    """Serialize a model catalog to JSON.
+
+    Args:
+        models: Mapping of model names to their specifications.
+        compact: Use `(",", ":")` separators and no indentation instead of the 4-space layout.
+
+    Returns:
+        The JSON document. Floats use Python's shortest round-trip representation.
+    """
+    if compact:
+        return json.dumps(models, separators=(",", ":"), ensure_ascii=True)
+    return json.dumps(models, indent=4, ensure_ascii=True)
+
+
+def dump_models_json(
+    models: Mapping[str, Any],
+    path: Path,
+    *,
+    compact: bool = False,
+    compress: bool = False,
+) -> Path:
+    """Write a model catalog to `path`, optionally compacted and gzip-compressed.
+
+    Args:
+        models: Mapping of model names to their specifications.
+        path: Destination file. `.gz` is appended when `compress` is set and missing.
+        compact: Write compact JSON instead of the indented layout.
+        compress: Gzip the output.
+
+    Returns:
+        The path that was written.
+    """
+    payload = dumps_models(models, compact=compact).encode("utf-8")
+    if compress:
+        if path.suffix != ".gz":
+            path = path.with_name(f"{path.name}.gz")
+        # mtime=0 keeps the archive byte-identical across runs with unchanged data.
+        path.write_bytes(gzip.compress(payload, mtime=0))
+    else:
+        path.write_bytes(payload)
+    return path
+
+
+def shard_key(
+    model_name: str,
+    model_spec: LiteLLMBaseModelSpec,
+    shard_by: ShardBy,
+) -> str:
+    """Return the shard a model belongs to when splitting by mode or provider."""
+    if shard_by == "mode":
+        return str(model_spec.get("mode") or "unknown")
+    if shard_by == "provider":
+        provider = model_spec.get("litellm_provider")
+        if not provider:
+            provider = model_name.split("/", 1)[0] if "/" in model_name else "unknown"
+        return str(provider)
+    raise ValueError(f"Unknown shard key: {shard_by}. Available keys: mode, provider")
+
+
+def dump_sharded_models_json(
+    models: Mapping[str, LiteLLMBaseModelSpec],
+    directory: Path,
+    *,
+    shard_by: ShardBy = "mode",
+    compact: bool = False,
+    compress: bool = False,
+) -> Path:
+    """Split a model catalog into one file per mode or provider plus an index.
+
+    The index (`index.json`, never compressed so it can be read without extra tooling) maps
+    every shard to its file and model count, and every model to its shard, so a consumer can
+    fetch just the shard it needs. Models keep their catalog order inside each shard.
+
+    Args:
+        models: Mapping of model names to their specifications.
+        directory: Directory to write the shards and index into. Created if missing.
+        shard_by: Split by `"mode"` or by `"provider"`.
+        compact: Write compact JSON shards.
+        compress: Gzip the shards.
+
+    Returns:
+        The path of the index file.
+    """
+    shards: dict[str, dict[str, LiteLLMBaseModelSpec]] = {}
+    for model_name, model_spec in models.items():
+        shards.setdefault(shard_key(model_name, model_spec, shard_by), {})[model_name] = model_spec
+
+    directory.mkdir(parents=True, exist_ok=True)
+    index: dict[str, Any] = {"shard_by": shard_by, "shards": {}, "models": {}}
+    used_filenames: set[str] = set()
+    for key, shard in shards.items():
+        filename = re.sub(r"[^A-Za-z0-9_.-]+", "_", key) or "unknown"
+        while filename in used_filenames:
+            filename += "_"
+        used_filenames.add(filename)
+        written = dump_models_json(shard, directory / f"{filename}.json", compact=compact, compress=compress)
+        index["shards"][key] = {"path": written.name, "count": len(shard)}
+        index["models"].update(dict.fromkeys(shard, key))
+
+    index_path = directory / INDEX_FILENAME
+    index_path.write_text(dumps_models(index, compact=compact), encoding="utf-8")
+    return index_path
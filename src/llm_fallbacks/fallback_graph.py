@@ -0,0 +1,266 @@
+"""Whole-config analysis of the fallback graph formed by `router_settings.fallbacks`.
+
+Every fallback entry `{model: [f1, f2, ...]}` becomes the edges `model -> f1`, `model -> f2`, ...
+All analyses are linear in the number of models plus fallback edges, so they stay fast on
+configs with tens of thousands of deployments.
+"""
+
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMYAMLConfig, RouterSettings
+
+
+@dataclass(frozen=True)
+class HopStats:
+    """Hop counts for one model's fallback list, tried in order until a call succeeds."""
+
+    worst_case: int  # fallbacks tried when every attempt fails
+    expected: float  # expected number of fallbacks tried
+    success_probability: float  # probability that the model or one of its fallbacks succeeds
+
+
+@dataclass
+class FallbackGraphReport:
+    """Summary of the problems found in a fallback graph."""
+
+    cycles: list[list[str]] = field(default_factory=list)  # models that fall back to each other
+    unreachable: list[str] = field(default_factory=list)  # fallback targets with no deployment
+    unused: list[str] = field(default_factory=list)  # deployments that have no fallbacks and are no model's fallback
+    max_cascade_depth: float = 0.0  # longest chain of fallbacks-of-fallbacks, inf when a cycle is reachable
+
+
+class FallbackGraph:
+    """Directed graph of model -> fallback edges, in fallback-list order."""
+
+    def __init__(
+        self,
+        fallbacks: Mapping[str, Sequence[str]],
+    ):
+        self._names: list[str] = []
+        self._index: dict[str, int] = {}
+        self._edges: list[list[int]] = []
+        for model, targets in fallbacks.items():
+            source = self._node(model)
+            self._edges[source].extend(self._node(target) for target in targets)
+
+    @classmethod
+    def from_router_settings(
+        cls,
+        router_settings: RouterSettings | Mapping[str, Any],
+    ) -> FallbackGraph:
+        """Build the graph from a `router_settings` section, merging repeated entries for a model."""
+        merged: dict[str, list[str]] = {}
+        for entry in router_settings.get("fallbacks") or []:
+            for model, targets in entry.items():
+                merged.setdefault(model, []).extend(targets)
+        return cls(merged)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: LiteLLMYAMLConfig | Mapping[str, Any],
+    ) -> FallbackGraph:
+        """Build the graph from a config produced by `to_litellm_config_yaml`."""
+        return cls.from_router_settings(config.get("router_settings") or {})
+
+    def _node(self, name: str) -> int:
+        index = self._index.get(name)
+        if index is None:
+            index = self._index[name] = len(self._names)
+            self._names.append(name)
+            self._edges.append([])
+        return index
+
+    @property
+    def models(self) -> list[str]:
+        """Every model in the graph, whether it has fallbacks or only appears as one."""
+        return list(self._names)
+
+    def fallbacks(self, model: str) -> list[str]:
+        """Return the fallback list of `model`, empty for models without one."""
+        index = self._index.get(model)
+        return [] if index is None else [self._names[target] for target in self._edges[index]]
+
+    def to_router_fallbacks(self) -> list[dict[str, list[str]]]:
+        """Convert back to the `router_settings.fallbacks` format, skipping models without fallbacks."""
+        return [
+            {self._names[source]: [self._names[target] for target in targets]}
+            for source, targets in enumerate(self._edges)
+            if targets
+        ]
+
+    def _strongly_connected_components(self) -> list[list[int]]:
+        """Iterative Tarjan; components come out in reverse topological order."""
+        counter = 0
+        index: list[int] = [-1] * len(self._names)
+        lowlink: list[int] = [0] * len(self._names)
+        on_stack: list[bool] = [False] * len(self._names)
+        stack: list[int] = []
+        components: list[list[int]] = []
+
+        for root in range(len(self._names)):
+            if index[root] != -1:
+                continue
+            work: list[tuple[int, int]] = [(root, 0)]
+            while work:
+                node, edge_position = work.pop()
+                if edge_position == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                else:
+                    child = self._edges[node][edge_position - 1]
+                    lowlink[node] = min(lowlink[node], lowlink[child])
+
+                edges = self._edges[node]
+                while edge_position < len(edges):
+                    child = edges[edge_position]
+                    edge_position += 1
+                    if index[child] == -1:
+                        work.append((node, edge_position))
+                        work.append((child, 0))
+                        break
+                    if on_stack[child]:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    if lowlink[node] == index[node]:
+                        component: list[int] = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def cycles(self) -> list[list[str]]:
+        """Return every group of models that can fall back to each other, including self-fallbacks."""
+        return [
+            [self._names[node] for node in component]
+            for component in self._strongly_connected_components()
+            if len(component) > 1 or component[0] in self._edges[component[0]]
+        ]
+
+    def cascade_depths(self) -> dict[str, float]:
+        """Return the longest chain of fallbacks-of-fallbacks starting at each model.
+
+        This is the worst case when every fallback also fails over to its own fallbacks. Models
+        that can reach a cycle get `inf`.
+        """
+        components = self._strongly_connected_components()
+        component_of: list[int] = [0] * len(self._names)
+        for component_index, component in enumerate(components):
+            for node in component:
+                component_of[node] = component_index
+
+        # Reverse topological order means every successor component is finished first.
+        depth: list[float] = [0.0] * len(components)
+        for component_index, component in enumerate(components):
+            if len(component) > 1 or component[0] in self._edges[component[0]]:
+                depth[component_index] = math.inf
+                continue
+            node = component[0]
+            depth[component_index] = max(
+                (1.0 + depth[component_of[target]] for target in self._edges[node]),
+                default=0.0,
+            )
+        return {name: depth[component_of[node]] for node, name in enumerate(self._names)}
+
+    def hop_stats(
+        self,
+        failure_rates: Mapping[str, float],
+        *,
+        default_failure_rate: float = 0.0,
+    ) -> dict[str, HopStats]:
+        """Compute worst-case and expected hops for every model with a fallback list.
+
+        A call first tries the model itself, then its fallbacks in order, stopping at the first
+        success. The expected number of hops is the sum, over each fallback, of the probability
+        that every earlier attempt failed.
+
+        Args:
+            failure_rates: Probability in [0, 1] that a call to each model fails.
+            default_failure_rate: Failure rate of models missing from `failure_rates`.
+
+        Returns:
+            Hop statistics keyed by model name.
+        """
+        stats: dict[str, HopStats] = {}
+        for source, targets in enumerate(self._edges):
+            if not targets:
+                continue
+            all_failed = failure_rates.get(self._names[source], default_failure_rate)
+            expected = 0.0
+            for target in targets:
+                expected += all_failed
+                all_failed *= failure_rates.get(self._names[target], default_failure_rate)
+            stats[self._names[source]] = HopStats(
+                worst_case=len(targets),
+                expected=expected,
+                success_probability=1.0 - all_failed,
+            )
+        return stats
+
+    def prune_to_latency_budget(
+        self,
+        latencies: Mapping[str, float],
+        budget: float,
+        *,
+        default_latency: float = 0.0,
+    ) -> FallbackGraph:
+        """Truncate every fallback list so that trying the model and all its fallbacks fits `budget`.
+
+        Args:
+            latencies: Latency charged for one attempt at each model, e.g. its p95 or timeout in seconds.
+            budget: Total latency allowed for one call, in the same unit.
+            default_latency: Latency of models missing from `latencies`.
+
+        Returns:
+            A new graph with the truncated lists. Models whose own attempt exceeds the budget keep no fallbacks.
+        """
+        pruned: dict[str, list[str]] = {}
+        for source, targets in enumerate(self._edges):
+            elapsed = latencies.get(self._names[source], default_latency)
+            kept: list[str] = []
+            for target in targets:
+                elapsed += latencies.get(self._names[target], default_latency)
+                if elapsed > budget:
+                    break
+                kept.append(self._names[target])
+            pruned[self._names[source]] = kept
+        return FallbackGraph(pruned)
+
+    def analyze(
+        self,
+        deployments: Iterable[str] | None = None,
+    ) -> FallbackGraphReport:
+        """Collect cycles, unreachable targets, unused deployments and the maximum cascade depth.
+
+        Args:
+            deployments: The `model_name`s deployed in the config. When omitted, every model with a
+                fallback list is assumed to be deployed.
+        """
+        if deployments is None:
+            deployed = {self._names[source] for source, targets in enumerate(self._edges) if targets}
+        else:
+            deployed = set(deployments)
+        targeted = {target for targets in self._edges for target in targets}
+        depths = self.cascade_depths()
+        return FallbackGraphReport(
+            cycles=self.cycles(),
+            unreachable=[self._names[node] for node in sorted(targeted) if self._names[node] not in deployed],
+            unused=sorted(
+                name
+                for name in deployed
+                if name not in self._index or (not self._edges[self._index[name]] and self._index[name] not in targeted)
+            ),
+            max_cascade_depth=max(depths.values(), default=0.0),
+        )
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from pathlib import Path
 
 if __name__ == "__main__":
@@ -14,12 +15,13 @@ if __name__ == "__main__":
 
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from llm_fallbacks.config import LiteLLMBaseModelSpec
 from llm_fallbacks.core import (
+    _MODEL_TYPE_GETTERS,
     get_audio_input_models,
     get_audio_output_models,
     get_audio_speech_models,
     get_audio_transcription_models,
+    get_catalog_version,
     get_chat_models,
     get_completion_models,
     get_embedding_models,
@@ -32,6 +34,11 @@ from llm_fallbacks.core import (
     get_vision_models,
     sort_models_by_cost_and_limits,
 )
+from llm_fallbacks import instrumentation
+from llm_fallbacks.query import ColumnarCatalog
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
 
 # Chat Model Fallbacks
 CHAT_MODEL_PRIORITY_ORDER: list[tuple[str, LiteLLMBaseModelSpec]] = sort_models_by_cost_and_limits(get_chat_models())
@@ -102,6 +109,63 @@ PDF_INPUT_MODEL_PRIORITY_ORDER: list[tuple[str, LiteLLMBaseModelSpec]] = sort_mo
 )
 
 
+# model type -> (catalog version, ranked models), seeded with the module-level priority orders.
+_priority_orders: dict[str, tuple[int, list[tuple[str, LiteLLMBaseModelSpec]]]] = {
+    model_type: (get_catalog_version(), priority_order)
+    for model_type, priority_order in (
+        ("chat", CHAT_MODEL_PRIORITY_ORDER),
+        ("completion", COMPLETION_MODEL_PRIORITY_ORDER),
+        ("embedding", EMBEDDING_MODEL_PRIORITY_ORDER),
+        ("image_generation", IMAGE_GENERATION_MODEL_PRIORITY_ORDER),
+        ("audio_transcription", AUDIO_TRANSCRIPTION_MODEL_PRIORITY_ORDER),
+        ("audio_speech", AUDIO_SPEECH_MODEL_PRIORITY_ORDER),
+        ("moderation", MODERATION_MODEL_PRIORITY_ORDER),
+        ("rerank", RERANK_MODEL_PRIORITY_ORDER),
+        ("vision", VISION_MODEL_PRIORITY_ORDER),
+        ("function_calling", FUNCTION_CALLING_MODEL_PRIORITY_ORDER),
+        ("image_input", IMAGE_INPUT_MODEL_PRIORITY_ORDER),
+        ("audio_input", AUDIO_INPUT_MODEL_PRIORITY_ORDER),
+        ("audio_output", AUDIO_OUTPUT_MODEL_PRIORITY_ORDER),
+        ("pdf_input", PDF_INPUT_MODEL_PRIORITY_ORDER),
+    )
+}
+_columnar_catalogs: dict[str, tuple[int, ColumnarCatalog]] = {}
+_priority_orders_lock = threading.Lock()
+
+
+def _priority_order(
+    model_type: str,
+) -> list[tuple[str, LiteLLMBaseModelSpec]]:
+    """Return the ranked models of a type, re-ranking them once after the catalog is refreshed."""
+    if model_type not in _MODEL_TYPE_GETTERS:
+        raise ValueError(f"Unknown model type: {model_type}")
+    version = get_catalog_version()
+    cached = _priority_orders.get(model_type)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _priority_orders_lock:
+        cached = _priority_orders.get(model_type)
+        if cached is None or cached[0] != version:
+            cached = _priority_orders[model_type] = (
+                version,
+                sort_models_by_cost_and_limits(_MODEL_TYPE_GETTERS[model_type]()),
+            )
+        return cached[1]
+
+
+def _columnar_catalog(
+    model_type: str,
+) -> ColumnarCatalog:
+    """Return the columnar catalog of a type's ranked models, rebuilt once per catalog version."""
+    version = get_catalog_version()
+    cached = _columnar_catalogs.get(model_type)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    catalog = ColumnarCatalog(_priority_order(model_type))
+    _columnar_catalogs[model_type] = (version, catalog)
+    return catalog
+
+
 def filter_models(
     model_type: str = "chat",
     *,
@@ -128,88 +192,23 @@ def filter_models(
         provider: Filter for models from a specific provider
 
     Returns:
-        List of model names that match the criteria
+        List of model names that match the criteria, in the priority order of `model_type`
     """
-    # Get the appropriate models based on model_type
-    if model_type == "chat":
-        models = dict(CHAT_MODEL_PRIORITY_ORDER)
-    elif model_type == "completion":
-        models = dict(COMPLETION_MODEL_PRIORITY_ORDER)
-    elif model_type == "embedding":
-        models = dict(EMBEDDING_MODEL_PRIORITY_ORDER)
-    elif model_type == "image_generation":
-        models = dict(IMAGE_GENERATION_MODEL_PRIORITY_ORDER)
-    elif model_type == "audio_transcription":
-        models = dict(AUDIO_TRANSCRIPTION_MODEL_PRIORITY_ORDER)
-    elif model_type == "audio_speech":
-        models = dict(AUDIO_SPEECH_MODEL_PRIORITY_ORDER)
-    elif model_type == "moderation":
-        models = dict(MODERATION_MODEL_PRIORITY_ORDER)
-    elif model_type == "rerank":
-        models = dict(RERANK_MODEL_PRIORITY_ORDER)
-    elif model_type == "vision":
-        models = dict(VISION_MODEL_PRIORITY_ORDER)
-    elif model_type == "function_calling":
-        models = dict(FUNCTION_CALLING_MODEL_PRIORITY_ORDER)
-    elif model_type == "image_input":
-        models = dict(IMAGE_INPUT_MODEL_PRIORITY_ORDER)
-    elif model_type == "audio_input":
-        models = dict(AUDIO_INPUT_MODEL_PRIORITY_ORDER)
-    elif model_type == "audio_output":
-        models = dict(AUDIO_OUTPUT_MODEL_PRIORITY_ORDER)
-    elif model_type == "pdf_input":
-        models = dict(PDF_INPUT_MODEL_PRIORITY_ORDER)
-    else:
-        raise ValueError(f"Unknown model type: {model_type}")
-
-    # Filter models based on criteria
-    filtered_models = {}
-    for name, spec in models.items():
-        # Skip if not free and free_only is True
-        if free_only and spec.get("input_cost_per_token", 0) > 0:
-            continue
-
-        # Skip if cost per token is too high
-        if max_cost_per_token is not None and spec.get("input_cost_per_token", 0) > max_cost_per_token:
-            continue
-
-        # Skip if context length is too small
-        if min_context_length is not None and spec.get("max_tokens", 0) < min_context_length:
-            continue
-
-        # Skip if vision support doesn't match
-        if supports_vision is not None and spec.get("supports_vision", False) != supports_vision:
-            continue
-
-        # Skip if audio input support doesn't match
-        if supports_audio_input is not None and spec.get("supports_audio_input", False) != supports_audio_input:
-            continue
-
-        # Skip if audio output support doesn't match
-        if supports_audio_output is not None and spec.get("supports_audio_output", False) != supports_audio_output:
-            continue
-
-        # Skip if function calling support doesn't match
-        if (
-            supports_function_calling is not None
-            and spec.get("supports_function_calling", False) != supports_function_calling
-        ):
-            continue
-
-        # Skip if provider doesn't match
-        if provider is not None and not name.startswith(provider):
-            continue
-
-        filtered_models[name] = spec
-
-    # Sort and return model names
-    sorted_models: list[tuple[str, LiteLLMBaseModelSpec]] = sort_models_by_cost_and_limits(
-        filtered_models, free_only=free_only
-    )
-    return [name for name, _ in sorted_models]
+    with instrumentation.span("filter.query", model_type=model_type):
+        return _columnar_catalog(model_type).select(
+            free_only=free_only,
+            max_cost_per_token=max_cost_per_token,
+            min_context_length=min_context_length,
+            supports_vision=supports_vision,
+            supports_audio_input=supports_audio_input,
+            supports_audio_output=supports_audio_output,
+            supports_function_calling=supports_function_calling,
+            provider=provider,
+        )
 
 
 if __name__ == "__main__":
+    from llm_fallbacks.exporters import format_float
 
     def convert_floats_in_dict(d: dict) -> dict:
         result: dict[str, Any] = {}
@@ -217,12 +216,8 @@ if __name__ == "__main__":
             if isinstance(v, dict):
                 result[k] = convert_floats_in_dict(v)
             elif isinstance(v, float):
-                # Convert to string with many decimal places and strip trailing zeros
-                float_str = f"{v:.100f}".rstrip("0")
-                # If it ends with decimal point, add back one zero
-                if float_str.endswith("."):
-                    float_str += "0"
-                result[k] = float_str
+                # Shortest exact positional form, so prices never render in scientific notation
+                result[k] = format_float(v)
             else:
                 result[k] = v
         return result
@@ -1,28 +1,133 @@
 from __future__ import annotations
 
+import dataclasses
 import importlib.util
 import json
 import logging
 import os
+import time
 import uuid
 
 from pathlib import Path
+from typing import Any
 
 if not importlib.util.find_spec("llm_fallbacks"):
     import sys
     sys.path.append(str(Path(__file__).parents[1]))
-from llm_fallbacks.config import ALL_MODELS, CUSTOM_PROVIDERS, FREE_MODELS, CustomProviderConfig, LiteLLMYAMLConfig
+from llm_fallbacks.config import (
+    ALL_MODELS,
+    CUSTOM_PROVIDERS,
+    FREE_MODELS,
+    BaseProviderConfig,
+    CustomProviderConfig,
+    LiteLLMBaseModelSpec,
+    LiteLLMYAMLConfig,
+)
+from llm_fallbacks.context_index import ContextWindowIndex, context_window
 from llm_fallbacks.core import calculate_cost_per_token
+from llm_fallbacks.health import DEFAULT_ALLOWED_FAILS, DEFAULT_ALLOWED_FAILS_POLICY, DEFAULT_COOLDOWN_TIME
+from llm_fallbacks.instrumentation import instrumented
+from llm_fallbacks.planner import CAPABILITY_KEYS, apply_traffic_plan
 
 logger = logging.getLogger(__name__)
 
 
+def _deployment_params(
+    provider: CustomProviderConfig,
+    key_name: str,
+) -> dict[str, Any]:
+    return {
+        "model": (key_name if key_name.startswith("openai/") else f"openai/{key_name}"),
+        "api_base": provider.base_url,
+        **{"api_key": f"os.environ/{provider.api_env_key_name}"},
+        **({} if provider.api_version is None else {"api_version": provider.api_version}),
+    }
+
+
+def _collapse_to_wildcards(
+    provider: CustomProviderConfig,
+    models: dict[str, LiteLLMBaseModelSpec],
+    claimed_patterns: set[str],
+) -> tuple[list[dict[str, Any]], set[str]]:
+    """Build `<prefix>/*` deployments covering a provider's models that need no per-model overrides.
+
+    Models are grouped by the first segment of their deployment name and by their whole spec, so
+    a wildcard only covers models whose specs are identical apart from the name: the same mode,
+    costs, context window, `supports_*` flags and every other emitted field. The largest group of
+    each prefix becomes a wildcard deployment carrying that spec, unless another provider already
+    claimed the pattern.
+
+    Returns:
+        The wildcard entries and the deployment names they cover.
+    """
+    # (prefix, spec as canonical JSON) -> the spec and the deployment names sharing it
+    groups: dict[tuple[str, str], tuple[dict[str, Any], list[str]]] = {}
+    for model_name, model_spec in models.items():
+        key_name = model_name if "/" in model_name else f"{provider.provider_name}/{model_name}"
+        # `CustomProviderConfig` also files a copy of each spec under the model's own name; that is
+        # the one per-name field, so it is left out of the comparison and of the wildcard's spec.
+        spec: dict[str, Any] = {key: value for key, value in model_spec.items() if key != model_name}
+        # JSON keeps 1 and 1.0 apart, so only specs LiteLLM would read identically share a group.
+        signature = json.dumps(spec, sort_keys=True, default=str)
+        groups.setdefault((key_name.split("/", 1)[0], signature), (spec, []))[1].append(key_name)
+
+    largest: dict[str, tuple[dict[str, Any], list[str]]] = {}
+    for (prefix, _), (model_spec, key_names) in groups.items():
+        if prefix not in largest or len(key_names) > len(largest[prefix][1]):
+            largest[prefix] = (model_spec, key_names)
+
+    entries: list[dict[str, Any]] = []
+    collapsed: set[str] = set()
+    for prefix, (model_spec, key_names) in largest.items():
+        pattern = f"{prefix}/*"
+        if len(key_names) < 2 or pattern in claimed_patterns:
+            continue
+        claimed_patterns.add(pattern)
+        entries.append(
+            {
+                "model_name": pattern,
+                "litellm_params": {
+                    **_deployment_params(provider, pattern),
+                    **model_spec,
+                },
+            }
+        )
+        collapsed.update(key_names)
+    return entries, collapsed
+
+
+@instrumented("config.emit")
 def to_litellm_config_yaml(
     providers: list[CustomProviderConfig],
     free_only: bool = False,
     online_only: bool = False,
+    collapse_wildcards: bool = False,
+    target_rpm: float | None = None,
+    avg_tokens_per_request: float = 1000,
+    max_context_window_fallbacks: int = 5,
 ) -> LiteLLMYAMLConfig:
-    """Convert the provider config to a LiteLLM YAML config format."""
+    """Convert the provider config to a LiteLLM YAML config format.
+
+    Args:
+        providers: The providers whose models become `model_list` deployments.
+        free_only: Only emit free, non-local models.
+        online_only: Skip local models when choosing fallbacks.
+        collapse_wildcards: Replace groups of a provider's models with identical specs by a single
+            `<prefix>/*` wildcard deployment carrying that spec. Models that differ in any field keep
+            explicit entries, which LiteLLM matches before wildcards. Fallbacks are
+            still emitted per model.
+        target_rpm: When given, plan this many requests per minute across each group of equivalent
+            deployments within their `rpm`/`tpm`/`rpd` limits, and add the group's deployments under
+            one shared `traffic/<mode>[+<capability>...][:free]` model name, weighted by the plan.
+            Deployments are equivalent when they share their mode and capabilities and are both free
+            or both paid.
+        avg_tokens_per_request: Average tokens per request used to turn `tpm` limits into request rates.
+        max_context_window_fallbacks: How many cheapest deployments with a larger context window, the
+            same mode and the same capabilities to list per model in `context_window_fallbacks`.
+            These are emitted by default; pass 0 to leave `context_window_fallbacks` empty. Models
+            without a known window or mode get no entry, and neither do the models folded into a
+            wildcard by `collapse_wildcards`, which are not candidates for other models either.
+    """
     # Create base config with all possible settings
     config: LiteLLMYAMLConfig = {
         "cache": {
@@ -78,16 +183,9 @@ def to_litellm_config_yaml(
         },
         "model_list": [],
         "router_settings": {
-            "allowed_fails": 3,
-            "allowed_fails_policy": {
-                "BadRequestErrorAllowedFails": 1000,
-                "AuthenticationErrorAllowedFails": 10,
-                "TimeoutErrorAllowedFails": 12,
-                "RateLimitErrorAllowedFails": 10000,
-                "ContentPolicyViolationErrorAllowedFails": 15,
-                "InternalServerErrorAllowedFails": 20,
-            },
-            "cooldown_time": 30,
+            "allowed_fails": DEFAULT_ALLOWED_FAILS,
+            "allowed_fails_policy": dict(DEFAULT_ALLOWED_FAILS_POLICY),  # pyright: ignore[reportAssignmentType]
+            "cooldown_time": DEFAULT_COOLDOWN_TIME,
             "disable_cooldowns": False,
             "enable_pre_call_checks": True,
             "enable_tag_filtering": True,
@@ -103,7 +201,9 @@ def to_litellm_config_yaml(
         },
     }
 
+    claimed_patterns: set[str] = set()
     for p in providers:
+        selected_models: dict[str, LiteLLMBaseModelSpec] = {}
         for model_name, model_spec in (p.free_models if free_only else p.model_specs).items():
             is_free = calculate_cost_per_token(model_spec) == 0.0
             is_local = (
@@ -117,19 +217,24 @@ def to_litellm_config_yaml(
             )
             if free_only and (not is_free or is_local):
                 continue
+            selected_models[model_name] = model_spec
 
+        collapsed: set[str] = set()
+        if collapse_wildcards:
+            wildcard_entries, collapsed = _collapse_to_wildcards(p, selected_models, claimed_patterns)
+            config["model_list"].extend(wildcard_entries)  # pyright: ignore[reportArgumentType]
+
+        for model_name, model_spec in selected_models.items():
             key_name = model_name if "/" in model_name else f"{p.provider_name}/{model_name}"
-            model_entry = {
-                "model_name": key_name,
-                "litellm_params": {
-                    "model": (key_name if key_name.startswith("openai/") else f"openai/{key_name}"),
-                    "api_base": p.base_url,
-                    **{"api_key": f"os.environ/{p.api_env_key_name}"},
-                    **({} if p.api_version is None else {"api_version": p.api_version}),
-                    **dict(model_spec.items()),
-                },
-            }
-            config["model_list"].append(model_entry)  # pyright: ignore[reportArgumentType]
+            if key_name not in collapsed:
+                model_entry = {
+                    "model_name": key_name,
+                    "litellm_params": {
+                        **_deployment_params(p, key_name),
+                        **dict(model_spec.items()),
+                    },
+                }
+                config["model_list"].append(model_entry)  # pyright: ignore[reportArgumentType]
 
             # Determine suitable fallbacks based on mode and cost
             suitable_fallbacks: list[str] = []
@@ -195,67 +300,221 @@ def to_litellm_config_yaml(
                 fallback_entry = {model_name: suitable_fallbacks}
                 fallback_list.append(fallback_entry)
 
+    if max_context_window_fallbacks > 0:
+        config["litellm_settings"]["context_window_fallbacks"] = _context_window_fallbacks(
+            config, max_context_window_fallbacks
+        )
+    if target_rpm is not None:
+        apply_traffic_plan(config, target_rpm, avg_tokens_per_request)
     return config
 
 
+def _context_window_fallbacks(
+    config: LiteLLMYAMLConfig,
+    max_fallbacks: int,
+) -> list[dict[str, list[str]]]:
+    """Map each deployment to the cheapest equivalent deployments that accept a longer prompt.
+
+    Wildcard deployments are left out on both sides: a `<prefix>/*` entry stands for a group of
+    models rather than one, so it neither gets fallbacks nor serves as one.
+    """
+    deployments: dict[str, dict[str, Any]] = {
+        entry["model_name"]: entry.get("litellm_params", {})  # pyright: ignore[reportAttributeAccessIssue]
+        for entry in config["model_list"]
+        if "*" not in str(entry.get("model_name", ""))
+    }
+    index = ContextWindowIndex(deployments)
+    context_window_fallbacks: list[dict[str, list[str]]] = []
+    for model_name, params in deployments.items():
+        window = context_window(params)
+        # Without a mode there is no telling which deployments can take over its requests.
+        if window is None or params.get("mode") is None:
+            continue
+        require = [key for key in CAPABILITY_KEYS if params.get(key)]
+        larger = index.models_fitting(window + 1, mode=params.get("mode"), require=require, limit=max_fallbacks)
+        if larger:
+            context_window_fallbacks.append({model_name: list(larger)})
+    return context_window_fallbacks
+
+
+def summarize_model_list(
+    config: LiteLLMYAMLConfig,
+) -> dict[str, int]:
+    """Count the `model_list` deployments of a generated config, split into wildcard and explicit entries."""
+    wildcard_entries = sum(1 for entry in config["model_list"] if "*" in str(entry.get("model_name", "")))
+    return {
+        "entries": len(config["model_list"]),
+        "wildcard_entries": wildcard_entries,
+        "explicit_entries": len(config["model_list"]) - wildcard_entries,
+    }
+
+
+def measure_proxy_load(
+    config_yaml: str,
+) -> dict[str, float | None]:
+    """Time how long the LiteLLM proxy side takes to load a generated config.
+
+    Parses the YAML the way the proxy does and, when litellm is installed, builds a
+    `litellm.Router` from its `model_list`, which is where the proxy spends its startup time.
+
+    Returns:
+        `parse_seconds` and `router_seconds` (None when litellm is not installed).
+    """
+    import yaml
+
+    start = time.perf_counter()
+    loaded = yaml.safe_load(config_yaml)
+    parse_seconds = time.perf_counter() - start
+
+    router_seconds: float | None = None
+    if importlib.util.find_spec("litellm"):
+        import litellm  # pyright: ignore[reportMissingImports]
+
+        start = time.perf_counter()
+        litellm.Router(model_list=loaded.get("model_list") or [])
+        router_seconds = time.perf_counter() - start
+    return {"parse_seconds": parse_seconds, "router_seconds": router_seconds}
+
+
+def rediscover_providers(
+    providers: list[CustomProviderConfig],
+) -> list[CustomProviderConfig]:
+    """Build fresh copies of `providers`, repeating their model discovery.
+
+    Discovery runs once when `llm_fallbacks.config` is imported, before any profiler can start;
+    this repeats it with the same settings so it can be profiled. It registers the models into a
+    copy of `BaseProviderConfig.ALL_KNOWN_MODELS`, so the catalog later stages export is untouched.
+    """
+    known_models = BaseProviderConfig.ALL_KNOWN_MODELS
+    BaseProviderConfig.ALL_KNOWN_MODELS = dict(known_models)
+    try:
+        return [dataclasses.replace(provider, model_specs={}, free_models={}) for provider in providers]
+    finally:
+        BaseProviderConfig.ALL_KNOWN_MODELS = known_models
+
+
 if __name__ == "__main__":
+    import argparse
+
+    from contextlib import nullcontext
+
+    from llm_fallbacks.core import sort_models_by_cost_and_limits
+    from llm_fallbacks.exporters import dump_models_json, dump_sharded_models_json
+    from llm_fallbacks.profiling import StageProfiler
+
+    parser = argparse.ArgumentParser(description="Generate the LiteLLM configs and model catalogs in ./configs")
+    parser.add_argument("--compact", action="store_true", help="write compact JSON catalogs (no indentation)")
+    parser.add_argument("--gzip", action="store_true", help="gzip the JSON catalogs")
+    parser.add_argument(
+        "--shard-by",
+        choices=["mode", "provider"],
+        default=None,
+        help="also split the JSON catalogs into per-mode or per-provider shards with an index.json",
+    )
+    parser.add_argument(
+        "--collapse-wildcards",
+        action="store_true",
+        help="collapse each provider's models into '<prefix>/*' deployments where no per-model override is needed",
+    )
+    parser.add_argument(
+        "--report-load",
+        action="store_true",
+        help="report model_list entry counts and the proxy-side load time of each generated YAML config",
+    )
+    parser.add_argument(
+        "--target-rpm",
+        type=float,
+        default=None,
+        help="plan this request rate across equivalent deployments and add them as weighted traffic/<mode> groups",
+    )
+    parser.add_argument(
+        "--avg-tokens",
+        type=float,
+        default=1000,
+        help="average tokens per request used with --target-rpm to apply tpm limits (default: 1000)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="write a cProfile dump, collapsed stacks and a tracemalloc report per stage to configs/profile",
+    )
+    args = parser.parse_args()
+
     # Create configs directory if it doesn't exist
     configs_dir = Path("configs")
     configs_dir.mkdir(exist_ok=True)
-    
+
+    profiler = StageProfiler(configs_dir / "profile") if args.profile else None
+
+    def stage(name: str):
+        return nullcontext() if profiler is None else profiler.stage(name)
+
+    if profiler is not None:
+        with stage("discover"):
+            rediscover_providers(CUSTOM_PROVIDERS)
+        with stage("rank"):
+            all_configs = dict(ALL_MODELS)
+            sort_models_by_cost_and_limits(all_configs)
+            sort_models_by_cost_and_limits(all_configs, free_only=True)
+
     custom_providers_path = configs_dir / "custom_providers.json"
     print(f"Saving {custom_providers_path}")
-    custom_providers_path.write_text(
-        json.dumps(
-            [provider.to_dict() for provider in CUSTOM_PROVIDERS],
-            indent=4,
-            ensure_ascii=True,
-        ),
-    )
-    all_models_path = configs_dir / "all_models.json"
-    print(f"Saving {all_models_path}")
-    all_models_path.write_text(
-        json.dumps(
-            dict(ALL_MODELS),
-            indent=4,
-            ensure_ascii=True,
-        ),
-    )
-    free_chat_models_path = configs_dir / "free_chat_models.json"
-    print(f"Saving {free_chat_models_path}")
-    free_chat_models_path.write_text(
-        json.dumps(
-            dict(FREE_MODELS),
-            indent=4,
-            ensure_ascii=True,
-        ),
-    )
+    with stage("catalogs"):
+        custom_providers_path.write_text(
+            json.dumps(
+                [provider.to_dict() for provider in CUSTOM_PROVIDERS],
+                indent=4,
+                ensure_ascii=True,
+            ),
+        )
+        for catalog_name, catalog in (("all_models", ALL_MODELS), ("free_chat_models", FREE_MODELS)):
+            catalog_path = dump_models_json(
+                dict(catalog),
+                configs_dir / f"{catalog_name}.json",
+                compact=args.compact,
+                compress=args.gzip,
+            )
+            print(f"Saved {catalog_path}")
+            if args.shard_by is not None:
+                index_path = dump_sharded_models_json(
+                    dict(catalog),
+                    configs_dir / catalog_name,
+                    shard_by=args.shard_by,
+                    compact=args.compact,
+                    compress=args.gzip,
+                )
+                print(f"Saved shards indexed by {index_path}")
 
     # Generate and save LiteLLM config files
     try:
         import yaml
 
-        litellm_config_free_path = configs_dir / "litellm_config_free.yaml"
-        print(f"Saving {litellm_config_free_path}")
-        litellm_config_free_path.write_text(
-            yaml.dump(
-                to_litellm_config_yaml(CUSTOM_PROVIDERS, free_only=True),
-                sort_keys=False,
-                allow_unicode=True,
-            ),
-            errors="replace",
-            encoding="utf-8",
-        )
-        litellm_config_path = configs_dir / "litellm_config.yaml"
-        print(f"Saving {litellm_config_path}")
-        litellm_config_path.write_text(
-            yaml.dump(
-                to_litellm_config_yaml(CUSTOM_PROVIDERS, free_only=False),
-                sort_keys=False,
-                allow_unicode=True,
-            ),
-            errors="replace",
-            encoding="utf-8",
-        )
+        for config_filename, free_only in (("litellm_config_free.yaml", True), ("litellm_config.yaml", False)):
+            litellm_config_path = configs_dir / config_filename
+            print(f"Saving {litellm_config_path}")
+            with stage(f"config_{'free' if free_only else 'all'}"):
+                litellm_config = to_litellm_config_yaml(
+                    CUSTOM_PROVIDERS,
+                    free_only=free_only,
+                    collapse_wildcards=args.collapse_wildcards,
+                    target_rpm=args.target_rpm,
+                    avg_tokens_per_request=args.avg_tokens,
+                )
+            with stage(f"yaml_{'free' if free_only else 'all'}"):
+                litellm_config_yaml = yaml.dump(litellm_config, sort_keys=False, allow_unicode=True)
+            litellm_config_path.write_text(litellm_config_yaml, errors="replace", encoding="utf-8")
+            if args.report_load:
+                counts = summarize_model_list(litellm_config)
+                timings = measure_proxy_load(litellm_config_yaml)
+                router_seconds = timings["router_seconds"]
+                router_load = "n/a (litellm not installed)" if router_seconds is None else f"{router_seconds:.3f}s"
+                print(
+                    f"  {counts['entries']} model_list entries ({counts['wildcard_entries']} wildcard, "
+                    f"{counts['explicit_entries']} explicit), YAML parse {timings['parse_seconds']:.3f}s, "
+                    f"router load {router_load}"
+                )
     except ImportError as e:
         logger.warning(f"Failed to generate YAML configs: {e.__class__.__name__}: {e}")
+
+    if profiler is not None:
+        print(f"Saved profiles summarized in {profiler.write_summary()}")
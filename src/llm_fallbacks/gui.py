@@ -0,0 +1,697 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from llm_fallbacks.core import get_catalog_version, get_litellm_model_specs
+
+
+if TYPE_CHECKING:
+    from typing_extensions import Literal  # pyright: ignore[reportMissingModuleSource]
+
+    FilterMethod = Literal[
+        "value",
+        "regex",
+        "quantile",
+        "outlier",
+        "boolean",
+        "string",
+        "null",
+        "topn",
+        "group",
+        "custom",
+        "range",
+        "categorical",
+        "time",
+        "correlation",
+        "variance",
+    ]
+
+    ModelCategory = Literal[
+        # Model Modes
+        "chat",
+        "completion",
+        "embedding",
+        "image_generation",
+        "audio_transcription",
+        "audio_speech",
+        "moderation",
+        "moderations",
+        "rerank",
+        # Model Capabilities
+        "vision",
+        "audio_input",
+        "audio_output",
+        "image_input",
+        "embedding_image_input",
+        "pdf_input",
+        "system_messages",
+        "function_calling",
+        "parallel_function_calling",
+        "tool_choice",
+        "response_schema",
+        "prompt_caching",
+        "assistant_prefill",
+    ]
+else:
+    ModelCategory = str
+    FilterMethod = str
+    Literal = str
+
+
+CATEGORICAL_COLUMNS: tuple[str, ...] = ("litellm_provider", "mode")
+
+# GUI timings: how long typing must pause before a preview filter runs, and how often the Tk
+# main loop checks the worker thread for a finished filter.
+DEBOUNCE_MS: int = 300
+POLL_MS: int = 50
+
+_specs_frame: tuple[int, pd.DataFrame] | None = None
+_specs_frame_lock = threading.Lock()
+
+
+def _typed_column(
+    name: str,
+    column: pd.Series,
+) -> pd.Series:
+    """Give a catalog column its natural dtype: nullable boolean, category, float or object."""
+    if name.startswith("supports_"):
+        return column.map(lambda v: v if isinstance(v, bool) else pd.NA).astype("boolean")
+    if name in CATEGORICAL_COLUMNS:
+        return column.astype("category")
+    values = column.dropna()
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return column.astype(float)
+    return column.astype(object)
+
+
+def get_model_specs_frame() -> pd.DataFrame:
+    """Return the catalog as a typed DataFrame with one row per model, built once per catalog version.
+
+    Costs and limits are float columns, `supports_*` flags nullable booleans and `litellm_provider`/`mode`
+    categories. The frame is shared between callers, so treat it as read-only.
+    """
+    global _specs_frame
+
+    version = get_catalog_version()
+    cached = _specs_frame
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _specs_frame_lock:
+        if _specs_frame is None or _specs_frame[0] != version:
+            df = pd.DataFrame.from_dict(get_litellm_model_specs(), orient="index")
+            df = pd.DataFrame({name: _typed_column(name, df[name]) for name in df.columns}, index=df.index)
+            _specs_frame = (version, df)
+        return _specs_frame[1]
+
+
+def _as_mask(
+    mask: pd.Series,
+) -> pd.Series:
+    """Turn a comparison result into a plain boolean mask, treating missing values as False."""
+    return mask.fillna(False).astype(bool)
+
+
+def filter_model_specs(
+    method: FilterMethod,
+    columns: list[str] | str | None = None,
+    *,
+    # Value filtering
+    comparison: Literal[">", "<", ">=", "<=", "==", "!="] | None = None,  # noqa: F722
+    value: Any = None,
+    # Regex
+    pattern: str | None = None,
+    # Quantile
+    quantile: float | None = None,
+    # Outlier
+    zscore_threshold: float | None = None,
+    iqr_threshold: float | None = None,
+    # Boolean
+    condition: Callable[[pd.Series], pd.Series] | None = None,
+    # String
+    contains: str | None = None,
+    startswith: str | None = None,
+    endswith: str | None = None,
+    # Null
+    include_nulls: bool = False,
+    # TopN
+    n: int | None = None,
+    ascending: bool = False,
+    # Group
+    groupby: str | None = None,
+    agg_func: str | Callable[[pd.Series], pd.Series] | None = None,
+    # Custom
+    custom_func: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    # Range
+    start: Any = None,
+    end: Any = None,
+    # Categorical
+    categories: list[ModelCategory] | None = None,
+    # Correlation
+    target_column: str | None = None,
+    correlation_threshold: float | None = None,
+    # Variance
+    variance_threshold: float | None = None,
+    # Common
+    as_dict: bool = True,
+    source: pd.DataFrame | None = None,
+) -> Any:
+    """Flexibly filter and transform LiteLLM model specifications.
+
+    Args:
+        method: The filtering method to use
+        columns: Spec field(s) to filter on, e.g. "input_cost_per_token"
+        comparison: Comparison operator for value filtering
+        value: Value to compare against
+        pattern: Regex pattern for matching
+        quantile: Quantile threshold (0-1)
+        zscore_threshold: Z-score threshold for outlier detection
+        iqr_threshold: IQR threshold for outlier detection
+        condition: Custom boolean condition function
+        contains: String to check for containment
+        startswith: String to check for prefix
+        endswith: String to check for suffix
+        include_nulls: Whether to include null values
+        n: Number of top/bottom items to select
+        ascending: Sort order for top-n selection
+        groupby: Column to group by
+        agg_func: Aggregation function for groupby
+        custom_func: Custom filtering function
+        start: Start value for range
+        end: End value for range
+        categories: List of categories to filter by
+        target_column: Target column for correlation
+        correlation_threshold: Minimum correlation coefficient
+        variance_threshold: Minimum variance threshold
+        as_dict: Return as dict if True, DataFrame if False
+        source: Frame to filter, e.g. the result of a previous filter. Defaults to the whole catalog.
+
+    Returns:
+        Filtered model specifications as either a dict keyed by model or a DataFrame with one row per model
+    """
+    df = get_model_specs_frame() if source is None else source
+
+    if columns is None:
+        columns = df.columns.tolist()
+    elif isinstance(columns, str):
+        columns = [columns]
+
+    if method == "value" and comparison and value is not None:
+        ops: dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+            ">": np.greater,
+            "<": np.less,
+            ">=": np.greater_equal,
+            "<=": np.less_equal,
+            "==": np.equal,
+            "!=": np.not_equal,
+        }
+        df = df[_as_mask(ops[comparison](df[columns[0]], value))]
+
+    elif method == "regex" and pattern and len(columns) > 0:
+        df = df[df[columns[0]].astype(str).str.match(pattern, na=False)]
+
+    elif method == "quantile" and quantile is not None and len(columns) > 0:
+        threshold = df[columns[0]].quantile(quantile)
+        df = df[df[columns[0]] >= threshold]
+
+    elif method == "outlier" and len(columns) > 0:
+        if zscore_threshold:
+            z_scores = np.abs((df[columns[0]] - df[columns[0]].mean()) / df[columns[0]].std())
+            df = df[z_scores < zscore_threshold]
+        elif iqr_threshold:
+            q1 = df[columns[0]].quantile(0.25)
+            q3 = df[columns[0]].quantile(0.75)
+            iqr = q3 - q1
+            df = df[~((df[columns[0]] < (q1 - iqr_threshold * iqr)) | (df[columns[0]] > (q3 + iqr_threshold * iqr)))]
+
+    elif method == "boolean" and condition and len(columns) > 0:
+        df = df[_as_mask(condition(df[columns[0]]))]
+
+    elif method == "string" and len(columns) > 0:
+        if contains:
+            df = df[df[columns[0]].astype(str).str.contains(contains, na=False)]
+        elif startswith:
+            df = df[df[columns[0]].astype(str).str.startswith(startswith, na=False)]
+        elif endswith:
+            df = df[df[columns[0]].astype(str).str.endswith(endswith, na=False)]
+
+    elif method == "null" and len(columns) > 0:
+        if include_nulls:
+            df = df[df[columns[0]].isnull()]
+        else:
+            df = df[df[columns[0]].notnull()]
+
+    elif method == "topn" and n and len(columns) > 0:
+        df = df.nlargest(n, columns[0]) if not ascending else df.nsmallest(n, columns[0])
+
+    elif method == "group" and groupby and agg_func:
+        df = df.groupby(groupby).agg(agg_func)
+
+    elif method == "custom" and custom_func:
+        df = custom_func(df.copy())
+
+    elif method == "range" and start is not None and end is not None and len(columns) > 0:
+        df = df[_as_mask((df[columns[0]] >= start) & (df[columns[0]] <= end))]
+
+    elif method == "categorical" and categories and len(columns) > 0:
+        df = df[df[columns[0]].isin(categories)]
+
+    elif method == "correlation" and target_column and correlation_threshold:
+        # Keep the numeric fields that correlate with the target field across models
+        correlations: pd.Series = df.select_dtypes("number").corr()[target_column].abs()
+        highly_correlated: pd.Index = correlations[correlations > correlation_threshold].index
+        df = df[highly_correlated]
+
+    elif method == "variance" and variance_threshold and len(columns) > 0:
+        # Keep the numeric fields whose values vary across models by more than the threshold
+        variances: pd.Series = df[columns].select_dtypes("number").var()
+        df = df[variances[variances > variance_threshold].index]
+
+    if as_dict:
+        return df.to_dict(orient="index")  # pyright: ignore[reportCallIssue]
+    return df
+
+
+def _freeze_argument(
+    value: Any,
+) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_argument(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_argument(v)) for k, v in value.items()))
+    return value
+
+
+class FilterPipeline:
+    """A stack of `filter_model_specs` stages, each applied to the previous stage's result.
+
+    Adding a stage only filters the current result, not the whole catalog. Every intermediate
+    result is kept on the stack, so `undo` just pops back to the previous one. Results are also
+    memoized by their chain of stages, so re-adding a stage that was undone is free.
+
+    Args:
+        source: Frame the first stage filters. Defaults to the whole catalog.
+        max_memo: Number of undone stage results kept for reuse.
+
+    Example:
+        ```python
+        pipeline = FilterPipeline()
+        pipeline.add("value", "input_cost_per_token", comparison="<=", value=1e-06)
+        pipeline.add("regex", "litellm_provider", pattern="openai|anthropic")
+        cheap_models = pipeline.result
+        ```
+    """
+
+    def __init__(
+        self,
+        source: pd.DataFrame | None = None,
+        *,
+        max_memo: int = 32,
+    ):
+        self.source: pd.DataFrame = get_model_specs_frame() if source is None else source
+        self.max_memo: int = max_memo
+        self.stages: list[tuple[str, dict[str, Any]]] = []
+        self._keys: list[tuple[Any, ...]] = []
+        self._results: list[pd.DataFrame] = []
+        self._memo: OrderedDict[tuple[Any, ...], pd.DataFrame] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    @property
+    def result(self) -> pd.DataFrame:
+        """The frame produced by the last stage, or the source when there are no stages."""
+        return self._results[-1] if self._results else self.source
+
+    def _key(
+        self,
+        method: FilterMethod,
+        columns: list[str] | str | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[Any, ...] | None:
+        """Return the memo key of the chain of stages ending with this one, or None if it is unhashable."""
+        stage_key = (method, _freeze_argument(columns), _freeze_argument(kwargs))
+        key = (*self._keys[-1], stage_key) if self._keys else (stage_key,)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def compute(
+        self,
+        method: FilterMethod,
+        columns: list[str] | str | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Return the frame `add` would push, without changing the pipeline.
+
+        Only reads the pipeline, so it can run in a worker thread while the pipeline is not modified.
+        """
+        kwargs.pop("as_dict", None)
+        kwargs.pop("source", None)
+        key = self._key(method, columns, kwargs)
+        result = None if key is None else self._memo.get(key)
+        if result is None:
+            result = filter_model_specs(method, columns, as_dict=False, source=self.result, **kwargs)
+        return result
+
+    def push(
+        self,
+        method: FilterMethod,
+        columns: list[str] | str | None,
+        result: pd.DataFrame,
+        **kwargs: Any,
+    ) -> FilterPipeline:
+        """Push a stage whose `result` was obtained from `compute` on the current result."""
+        key = self._key(method, columns, kwargs)
+        if key is None:  # never memoized, so give the stage a unique key
+            key = (object(),)
+        self._memo.pop(key, None)
+        self.stages.append((method, {"columns": columns, **kwargs}))
+        self._keys.append(key)
+        self._results.append(result)
+        return self
+
+    def add(
+        self,
+        method: FilterMethod,
+        columns: list[str] | str | None = None,
+        **kwargs: Any,
+    ) -> FilterPipeline:
+        """Filter the current result with `filter_model_specs(method, columns, **kwargs)` and push it."""
+        kwargs.pop("as_dict", None)
+        kwargs.pop("source", None)
+        return self.push(method, columns, self.compute(method, columns, **kwargs), **kwargs)
+
+    def undo(self) -> pd.DataFrame:
+        """Drop the last stage and return the previous result, without recomputing anything."""
+        if not self.stages:
+            raise ValueError("FilterPipeline has no stage to undo.")
+        self.stages.pop()
+        key = self._keys.pop()
+        self._memo[key] = self._results.pop()
+        while len(self._memo) > self.max_memo:
+            self._memo.popitem(last=False)
+        return self.result
+
+    def reset(self) -> pd.DataFrame:
+        """Drop every stage and return the source frame."""
+        while self.stages:
+            self.undo()
+        return self.result
+
+
+def sorted_positions(
+    df: pd.DataFrame,
+    column: str,
+    reverse: bool = False,
+) -> np.ndarray:
+    """Return the row positions of `df` ordered by `column` ("model" sorts by the index), missing values last.
+
+    Columns whose values cannot be compared with each other are sorted by their string form, still
+    with missing values last rather than sorted as the string "nan".
+    """
+    by_index = column == "model" and column not in df.columns
+    values = pd.Series(df.index if by_index else df[column]).reset_index(drop=True)
+    try:
+        ordered = values.sort_values(ascending=not reverse, na_position="last", kind="stable")
+    except TypeError:
+        missing = values.isna().to_numpy()
+        present = values[~missing].astype(str).sort_values(ascending=not reverse, kind="stable")
+        return np.concatenate([present.index.to_numpy(), np.flatnonzero(missing)])
+    return ordered.index.to_numpy()
+
+
+class ModelSpecsApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("LiteLLM Model Specifications Explorer")
+        self.geometry("1200x800")
+
+        # DataFrame with all model specs, one row per model
+        self.df: pd.DataFrame = get_model_specs_frame()
+        self.pipeline: FilterPipeline = FilterPipeline(self.df)
+        self.current_view: pd.DataFrame = self.pipeline.result
+
+        # Virtualized view: only `page_size` rows starting at display position `first_row` exist in
+        # the Treeview; `row_order` maps display positions to rows of `current_view`.
+        self.page_size: int = 40
+        self.first_row: int = 0
+        self.row_order: np.ndarray = np.arange(len(self.current_view))
+
+        # Background filtering: one worker thread, and a generation counter bumped by every new
+        # filter, undo or reset so that results of superseded filters are dropped on arrival.
+        self.filter_executor: concurrent.futures.ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="filter"
+        )
+        self.filter_generation: int = 0
+        self.pending_filter: concurrent.futures.Future[pd.DataFrame] | None = None
+        self.debounce_id: str | None = None
+
+        # Create main layout
+        self.setup_ui()
+
+    def setup_ui(self):
+        # Filter Frame
+        filter_frame = ttk.LabelFrame(self, text="Filters")
+        filter_frame.pack(padx=10, pady=10, fill="x")
+
+        # Method Selection
+        ttk.Label(filter_frame, text="Filter Method:").grid(row=0, column=0)
+        self.method_var: tk.StringVar = tk.StringVar(value="value")
+        method_dropdown = ttk.Combobox(
+            filter_frame,
+            textvariable=self.method_var,
+            values=list(FilterMethod.__args__),
+        )
+        method_dropdown.grid(row=0, column=1)
+
+        # Column Selection
+        ttk.Label(filter_frame, text="Column:").grid(row=0, column=2)
+        self.column_var: tk.StringVar = tk.StringVar()
+        column_dropdown = ttk.Combobox(
+            filter_frame,
+            textvariable=self.column_var,
+            values=list(self.df.columns),
+        )
+        column_dropdown.grid(row=0, column=3)
+
+        # Value Input
+        ttk.Label(filter_frame, text="Value/Condition:").grid(row=0, column=4)
+        self.value_entry: ttk.Entry = ttk.Entry(filter_frame)
+        self.value_entry.grid(row=0, column=5)
+        # Preview the filter while typing, once the input has been idle for DEBOUNCE_MS
+        self.value_entry.bind("<KeyRelease>", lambda _e: self.schedule_preview())
+
+        # Filter Buttons: each filter narrows the current view, Undo/Reset step back
+        ttk.Button(filter_frame, text="Apply Filter", command=self.apply_filter).grid(
+            row=0,
+            column=6,
+        )
+        ttk.Button(filter_frame, text="Undo", command=self.undo_filter).grid(row=0, column=7)
+        ttk.Button(filter_frame, text="Reset", command=self.reset_filters).grid(row=0, column=8)
+
+        # Progress indicator for filters running in the background
+        self.progress: ttk.Progressbar = ttk.Progressbar(filter_frame, mode="indeterminate", length=120)
+        self.progress.grid(row=0, column=9, padx=5)
+        self.status_var: tk.StringVar = tk.StringVar()
+        ttk.Label(filter_frame, textvariable=self.status_var).grid(row=0, column=10)
+
+        # Treeview for displaying results
+        tree_columns = ["model", *self.df.columns]
+        self.tree: ttk.Treeview = ttk.Treeview(self, columns=tree_columns, show="headings", height=self.page_size)
+        for col in tree_columns:
+            self.tree.heading(col, text=col, command=lambda c=col: self.sort_column(c, False))
+            self.tree.column(col, width=100)
+
+        # Scrollbar: drives `first_row` instead of scrolling the Treeview's own items
+        self.scrollbar: ttk.Scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(padx=10, pady=10, expand=True, fill="both")
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_rows(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(3))
+
+        # Initial population of treeview
+        self.populate_treeview(self.df)
+
+    def filter_arguments(self) -> tuple[str, str, dict[str, Any]]:
+        """Parse the filter inputs into `FilterPipeline.add` arguments, raising ValueError on bad input."""
+        method = self.method_var.get()
+        column = self.column_var.get()
+        value = self.value_entry.get()
+
+        # Dynamic filtering based on method
+        if method == "value":
+            kwargs: dict[str, Any] = {"comparison": "<=", "value": float(value)}
+        elif method == "topn":
+            kwargs = {"n": int(value)}
+        elif method == "regex":
+            kwargs = {"pattern": value}
+        else:
+            # For more complex methods, you might want to add more sophisticated parsing
+            raise ValueError(f"Method {method} requires more complex input")
+        return method, column, kwargs
+
+    def apply_filter(self):
+        if self.debounce_id is not None:
+            self.after_cancel(self.debounce_id)
+            self.debounce_id = None
+        try:
+            method, column, kwargs = self.filter_arguments()
+        except ValueError as e:
+            messagebox.showinfo("Info", str(e))
+            return
+        self.start_filter(method, column, kwargs, commit=True)
+
+    def schedule_preview(self):
+        """Restart the debounce timer; the preview runs once typing pauses."""
+        if self.debounce_id is not None:
+            self.after_cancel(self.debounce_id)
+        self.debounce_id = self.after(DEBOUNCE_MS, self.preview_filter)
+
+    def preview_filter(self):
+        self.debounce_id = None
+        try:
+            method, column, kwargs = self.filter_arguments()
+        except ValueError as e:
+            self.status_var.set(str(e))
+            return
+        self.start_filter(method, column, kwargs, commit=False)
+
+    def start_filter(
+        self,
+        method: str,
+        column: str,
+        kwargs: dict[str, Any],
+        *,
+        commit: bool,
+    ):
+        """Run a filter on the worker thread; the newest request supersedes any earlier one.
+
+        A preview only shows its result, a commit also pushes it onto the pipeline.
+        """
+        self.cancel_pending_filter()
+        generation = self.filter_generation
+        self.pending_filter = self.filter_executor.submit(self.pipeline.compute, method, column, **kwargs)
+        self.progress.start(10)
+        self.status_var.set("Filtering...")
+        self.after(POLL_MS, self.poll_filter, self.pending_filter, generation, (method, column, kwargs, commit))
+
+    def cancel_pending_filter(self):
+        """Supersede the running filter: a queued one is cancelled, a running one is ignored when done."""
+        self.filter_generation += 1
+        if self.pending_filter is not None:
+            self.pending_filter.cancel()
+            self.pending_filter = None
+        self.progress.stop()
+        self.status_var.set("")
+
+    def poll_filter(
+        self,
+        future: concurrent.futures.Future[pd.DataFrame],
+        generation: int,
+        request: tuple[str, str, dict[str, Any], bool],
+    ):
+        """Check the worker from the Tk main loop, so results only touch widgets on the main thread."""
+        if generation != self.filter_generation:
+            return
+        if not future.done():
+            self.after(POLL_MS, self.poll_filter, future, generation, request)
+            return
+        self.pending_filter = None
+        self.progress.stop()
+        method, column, kwargs, commit = request
+        try:
+            result = future.result()
+        except Exception as e:
+            self.status_var.set("")
+            if commit:
+                messagebox.showerror("Error", str(e))
+            else:
+                self.status_var.set(f"{e.__class__.__name__}: {e}")
+            return
+        if commit:
+            # Narrow the current view instead of filtering the whole catalog again
+            self.pipeline.push(method, column, result, **kwargs)
+        self.status_var.set(f"{len(result)} models" if commit else f"{len(result)} models (preview)")
+        self.populate_treeview(result)
+
+    def undo_filter(self):
+        self.cancel_pending_filter()
+        if self.pipeline.stages:
+            self.pipeline.undo()
+        self.populate_treeview(self.pipeline.result)
+
+    def reset_filters(self):
+        self.cancel_pending_filter()
+        self.populate_treeview(self.pipeline.reset())
+
+    def destroy(self):
+        self.filter_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    def populate_treeview(self, df: pd.DataFrame):
+        self.current_view = df
+        self.row_order = np.arange(len(df))
+        self.first_row = 0
+        self.render_rows()
+
+    def render_rows(self):
+        """Materialize only the visible page of `current_view` in the Treeview."""
+        total = len(self.row_order)
+        self.first_row = max(0, min(self.first_row, total - self.page_size))
+        self.tree.delete(*self.tree.get_children())
+        page = self.current_view.iloc[self.row_order[self.first_row : self.first_row + self.page_size]]
+        for index, row in zip(page.index, page.itertuples(index=False), strict=True):
+            self.tree.insert("", "end", values=[index, *row])
+        if total:
+            self.scrollbar.set(self.first_row / total, min(1.0, (self.first_row + self.page_size) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_rows(self, rows: int):
+        self.first_row += rows
+        self.render_rows()
+
+    def on_scroll(self, action: str, amount: str, unit: str | None = None):
+        if action == "moveto":
+            self.first_row = int(float(amount) * len(self.row_order))
+            self.render_rows()
+        elif action == "scroll":
+            self.scroll_rows(int(amount) * (self.page_size if unit == "pages" else 1))
+
+    def on_resize(self, event: tk.Event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        page_size = max(1, (event.height - row_height) // row_height)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.render_rows()
+
+    def sort_column(self, col: str, reverse: bool):
+        # Sort positions with the DataFrame instead of reading cells back from the widget
+        self.row_order = sorted_positions(self.current_view, col, reverse)
+        self.first_row = 0
+        self.render_rows()
+
+        # Toggle sort direction
+        self.tree.heading(col, command=lambda: self.sort_column(col, not reverse))
+
+
+# Create and run the application
+def main():
+    app = ModelSpecsApp()
+    app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""In-process circuit breakers that let callers skip models and providers that are currently failing."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import AllowedFailsPolicy, RouterSettings
+
+
+# Router defaults shared by `to_litellm_config_yaml` and `HealthRegistry`, so the in-process
+# breakers trip under the same conditions as the LiteLLM proxy's cooldowns.
+DEFAULT_ALLOWED_FAILS: int = 3
+DEFAULT_ALLOWED_FAILS_POLICY: AllowedFailsPolicy = {
+    "BadRequestErrorAllowedFails": 1000,
+    "AuthenticationErrorAllowedFails": 10,
+    "TimeoutErrorAllowedFails": 12,
+    "RateLimitErrorAllowedFails": 10000,
+    "ContentPolicyViolationErrorAllowedFails": 15,
+    "InternalServerErrorAllowedFails": 20,
+}
+DEFAULT_COOLDOWN_TIME: int = 30
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _provider_prefix(model: str) -> str | None:
+    return model.split("/", 1)[0] if "/" in model else None
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker counting consecutive failures per error type.
+
+    A failure of type `XError` trips the breaker once more than `allowed_fails_policy["XErrorAllowedFails"]`
+    consecutive `XError`s were seen (`allowed_fails` for types not in the policy). An open breaker
+    rejects calls for `cooldown_time` seconds, then lets a single trial call through (half-open):
+    its success closes the breaker, its failure opens it for another cooldown.
+    """
+
+    __slots__ = ("_failures", "allowed_fails", "allowed_fails_policy", "cooldown_time", "open_until", "state")
+
+    def __init__(
+        self,
+        allowed_fails: int,
+        allowed_fails_policy: Mapping[str, int],
+        cooldown_time: float,
+    ):
+        self.allowed_fails: int = allowed_fails
+        self.allowed_fails_policy: Mapping[str, int] = allowed_fails_policy
+        self.cooldown_time: float = cooldown_time
+        self.state: str = CLOSED
+        self.open_until: float = 0.0
+        self._failures: dict[str, int] = {}
+
+    def allowed_fails_for(self, error: BaseException | str) -> int:
+        """Return how many consecutive failures of this error type are tolerated."""
+        name = error if isinstance(error, str) else error.__class__.__name__
+        return self.allowed_fails_policy.get(f"{name}AllowedFails", self.allowed_fails)
+
+    def record_success(self):
+        self._failures.clear()
+        self.state = CLOSED
+
+    def record_failure(
+        self,
+        error: BaseException | str,
+        now: float,
+    ) -> bool:
+        """Count a failure and return True when it opened the breaker."""
+        name = error if isinstance(error, str) else error.__class__.__name__
+        count = self._failures[name] = self._failures.get(name, 0) + 1
+        if self.state == HALF_OPEN or count > self.allowed_fails_for(name):
+            self.state = OPEN
+            self.open_until = now + self.cooldown_time
+            self._failures.clear()
+            return True
+        return False
+
+
+class HealthRegistry:
+    """Per-model and per-provider circuit breakers consulted before each fallback attempt.
+
+    Open breakers are tracked in a dict keyed by model or provider, so checking a model costs two
+    dict lookups no matter how many breakers exist, and healthy models never take the lock. Feed
+    the registry with `record_success`/`record_failure` after each call, and iterate
+    `filter(get_fallback_list(...))` to walk a fallback list that skips open models.
+
+    Args:
+        allowed_fails: Consecutive failures tolerated for error types not in the policy.
+        allowed_fails_policy: Per-error-type tolerances, keyed like LiteLLM's `allowed_fails_policy`.
+        cooldown_time: Seconds a breaker stays open before a trial call is allowed.
+        provider_allowed_fails: Consecutive failures across all of a provider's models before the
+            whole provider is skipped. Defaults to `allowed_fails`, with the same per-type policy.
+        provider_of: Maps a model to its provider; defaults to the prefix before the first `/`.
+        clock: Monotonic time source, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        allowed_fails: int = DEFAULT_ALLOWED_FAILS,
+        allowed_fails_policy: Mapping[str, int] | None = None,
+        cooldown_time: float = DEFAULT_COOLDOWN_TIME,
+        provider_allowed_fails: int | None = None,
+        provider_of: Callable[[str], str | None] = _provider_prefix,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.allowed_fails: int = allowed_fails
+        self.allowed_fails_policy: Mapping[str, int] = dict(
+            DEFAULT_ALLOWED_FAILS_POLICY if allowed_fails_policy is None else allowed_fails_policy
+        )
+        self.cooldown_time: float = cooldown_time
+        self.provider_allowed_fails: int = allowed_fails if provider_allowed_fails is None else provider_allowed_fails
+        self.provider_of: Callable[[str], str | None] = provider_of
+        self.clock: Callable[[], float] = clock
+        self._model_breakers: dict[str, CircuitBreaker] = {}
+        self._provider_breakers: dict[str, CircuitBreaker] = {}
+        # Only open or half-open breakers live here: key -> time until which calls are rejected.
+        self._open_models: dict[str, float] = {}
+        self._open_providers: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_router_settings(
+        cls,
+        router_settings: RouterSettings | Mapping[str, Any],
+        **kwargs: Any,
+    ) -> HealthRegistry:
+        """Build a registry using the `allowed_fails`, `allowed_fails_policy` and `cooldown_time` of a config."""
+        return cls(
+            allowed_fails=router_settings.get("allowed_fails", DEFAULT_ALLOWED_FAILS),
+            allowed_fails_policy=router_settings.get("allowed_fails_policy", DEFAULT_ALLOWED_FAILS_POLICY),
+            cooldown_time=router_settings.get("cooldown_time", DEFAULT_COOLDOWN_TIME),
+            **kwargs,
+        )
+
+    def _breaker(
+        self,
+        breakers: dict[str, CircuitBreaker],
+        key: str,
+        allowed_fails: int,
+    ) -> CircuitBreaker:
+        breaker = breakers.get(key)
+        if breaker is None:
+            breaker = breakers[key] = CircuitBreaker(allowed_fails, self.allowed_fails_policy, self.cooldown_time)
+        return breaker
+
+    def _claim_trial(
+        self,
+        open_keys: dict[str, float],
+        breakers: dict[str, CircuitBreaker],
+        key: str | None,
+        now: float,
+    ):
+        """Turn an expired open breaker half-open, rejecting other callers until the trial reports back."""
+        if key is not None and key in open_keys:
+            breakers[key].state = HALF_OPEN
+            open_keys[key] = now + self.cooldown_time
+
+    def is_available(
+        self,
+        model: str,
+    ) -> bool:
+        """Return whether `model` should be tried; claims the half-open trial when a cooldown just ended."""
+        if not self._open_models and not self._open_providers:
+            return True
+        provider = self.provider_of(model)
+        model_until = self._open_models.get(model)
+        provider_until = None if provider is None else self._open_providers.get(provider)
+        if model_until is None and provider_until is None:
+            return True
+        now = self.clock()
+        if (model_until is not None and now < model_until) or (provider_until is not None and now < provider_until):
+            return False
+        with self._lock:
+            # Re-check under the lock so only one caller gets each half-open trial.
+            if (model in self._open_models and now < self._open_models[model]) or (
+                provider in self._open_providers and now < self._open_providers[provider]
+            ):
+                return False
+            self._claim_trial(self._open_models, self._model_breakers, model, now)
+            self._claim_trial(self._open_providers, self._provider_breakers, provider, now)
+            return True
+
+    def state(
+        self,
+        model: str,
+    ) -> str:
+        """Return the breaker state of `model` (`closed`, `open` or `half_open`)."""
+        breaker = self._model_breakers.get(model)
+        return CLOSED if breaker is None else breaker.state
+
+    def record_success(
+        self,
+        model: str,
+    ):
+        """Close the breakers of `model` and its provider."""
+        provider = self.provider_of(model)
+        if model not in self._model_breakers and (provider is None or provider not in self._provider_breakers):
+            return
+        with self._lock:
+            breaker = self._model_breakers.get(model)
+            if breaker is not None:
+                breaker.record_success()
+                self._open_models.pop(model, None)
+            if provider is not None and (breaker := self._provider_breakers.get(provider)) is not None:
+                breaker.record_success()
+                self._open_providers.pop(provider, None)
+
+    def record_failure(
+        self,
+        model: str,
+        error: BaseException | str,
+    ):
+        """Count a failed call to `model`, opening its breaker or its provider's when a tolerance is exceeded.
+
+        Args:
+            model: The model that failed.
+            error: The exception raised, or its class name, e.g. `"RateLimitError"`.
+        """
+        now = self.clock()
+        provider = self.provider_of(model)
+        with self._lock:
+            breaker = self._breaker(self._model_breakers, model, self.allowed_fails)
+            if breaker.record_failure(error, now):
+                self._open_models[model] = breaker.open_until
+            if provider is not None:
+                breaker = self._breaker(self._provider_breakers, provider, self.provider_allowed_fails)
+                if breaker.record_failure(error, now):
+                    self._open_providers[provider] = breaker.open_until
+
+    def filter(
+        self,
+        models: Iterable[str],
+    ) -> Iterator[str]:
+        """Lazily yield the models of a fallback list whose breakers are not open."""
+        return (model for model in models if self.is_available(model))
+
+    def first_available(
+        self,
+        models: Sequence[str],
+    ) -> str | None:
+        """Return the first model of a fallback list that may be tried, or None if all are open."""
+        return next(self.filter(models), None)
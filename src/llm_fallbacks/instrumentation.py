@@ -0,0 +1,326 @@
+"""Optional spans and counters around the library's hot paths, reported to a pluggable sink.
+
+Nothing is recorded until `set_sink` installs a sink; until then every instrumented call site costs
+one `sink is None` check. Span names used by the library:
+
+- `catalog.fetch`: loading the LiteLLM price map (local file, litellm or GitHub).
+- `catalog.intern`: sharing one immutable spec between the price map's identical entries.
+- `catalog.normalize`: building `get_litellm_models()` from the price map.
+- `provider.discover`: building a `CustomProviderConfig`'s models, label `provider`.
+- `provider.fetch`: requesting a provider's `/models` endpoint, label `provider`.
+- `ranking.sort`: `sort_models_by_cost_and_limits`.
+- `filter.query`: `filter_models`, label `model_type`.
+- `config.emit`: `to_litellm_config_yaml`.
+
+Counters: `cache.hits`, `cache.misses`, `cache.evictions` and `cache.expirations`, label `cache`,
+reported after the cache releases its lock.
+
+Example:
+    ```python
+    from llm_fallbacks import instrumentation
+
+    sink = instrumentation.PrometheusSink()
+    instrumentation.set_sink(sink)
+    ...
+    print(sink.render())  # serve this from a /metrics endpoint
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+import threading
+import time
+
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Iterator, Mapping, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds, in seconds, of the Prometheus histogram buckets for span durations.
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class Sink(Protocol):
+    """Receives finished spans and counter increments; implementations must be thread-safe."""
+
+    def span(
+        self,
+        name: str,
+        seconds: float,
+        labels: Mapping[str, str],
+    ) -> None: ...
+
+    def count(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str],
+    ) -> None: ...
+
+
+# The active sink. Read it directly on hot paths: `if instrumentation.sink is not None: ...`.
+sink: Sink | None = None
+
+_NO_SPAN: ContextManager[None] = nullcontext()
+
+
+def set_sink(
+    new_sink: Sink | None,
+) -> Sink | None:
+    """Install a sink, or None to disable instrumentation, and return the previous one."""
+    global sink
+
+    previous, sink = sink, new_sink
+    return previous
+
+
+@contextmanager
+def _timed(
+    active: Sink,
+    name: str,
+    labels: Mapping[str, str],
+) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        active.span(name, time.perf_counter() - start, labels)
+
+
+def span(
+    name: str,
+    **labels: str,
+) -> ContextManager[None]:
+    """Time the enclosed block as a span; a no-op context manager when no sink is installed."""
+    active = sink
+    if active is None:
+        return _NO_SPAN
+    return _timed(active, name, labels)
+
+
+def count(
+    name: str,
+    value: float = 1.0,
+    **labels: str,
+) -> None:
+    """Add `value` to a counter."""
+    active = sink
+    if active is not None:
+        active.count(name, value, labels)
+
+
+def instrumented(
+    name: str,
+    **labels: str,
+) -> Callable[[F], F]:
+    """Decorate a function so every call is recorded as a span named `name`."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            active = sink
+            if active is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                active.span(name, time.perf_counter() - start, labels)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class LoggingSink:
+    """Log every span and counter increment, e.g. `span ranking.sort 12.345 ms`.
+
+    Args:
+        log: Logger to write to; this module's logger by default.
+        level: Log level of the records.
+    """
+
+    def __init__(
+        self,
+        log: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+    ):
+        self.log: logging.Logger = logger if log is None else log
+        self.level: int = level
+
+    @staticmethod
+    def _labels(
+        labels: Mapping[str, str],
+    ) -> str:
+        return "".join(f" {key}={value}" for key, value in labels.items())
+
+    def span(
+        self,
+        name: str,
+        seconds: float,
+        labels: Mapping[str, str],
+    ) -> None:
+        if self.log.isEnabledFor(self.level):
+            self.log.log(self.level, f"span {name} {seconds * 1000:.3f} ms{self._labels(labels)}")
+
+    def count(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str],
+    ) -> None:
+        if self.log.isEnabledFor(self.level):
+            self.log.log(self.level, f"count {name} +{value:g}{self._labels(labels)}")
+
+
+class InMemorySink:
+    """Keep every span and the counter totals in memory, for tests and ad hoc inspection."""
+
+    def __init__(self):
+        self.spans: list[tuple[str, float, dict[str, str]]] = []
+        self.counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._lock = threading.Lock()
+
+    def span(
+        self,
+        name: str,
+        seconds: float,
+        labels: Mapping[str, str],
+    ) -> None:
+        with self._lock:
+            self.spans.append((name, seconds, dict(labels)))
+
+    def count(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str],
+    ) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def span_names(self) -> list[str]:
+        with self._lock:
+            return [name for name, _, _ in self.spans]
+
+    def total(
+        self,
+        name: str,
+        **labels: str,
+    ) -> float:
+        """Return a counter summed over every label set that includes `labels`."""
+        wanted = set(labels.items())
+        with self._lock:
+            return sum(value for (n, key), value in self.counters.items() if n == name and wanted <= set(key))
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+
+def _metric_name(
+    namespace: str,
+    name: str,
+) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", f"{namespace}_{name}" if namespace else name)
+
+
+def _escape(
+    value: str,
+) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(
+    labels: tuple[tuple[str, str], ...],
+) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels) + "}"
+
+
+def _format_value(
+    value: float,
+) -> str:
+    # The shortest repr that round-trips, unlike `:g`, which rounds 1234567 to 1.23457e+06.
+    return repr(float(value))
+
+
+class PrometheusSink:
+    """Aggregate spans into histograms and counters into Prometheus counters.
+
+    `render()` returns the Prometheus text exposition format (version 0.0.4); spans become
+    `<namespace>_<name>_seconds` histograms and counters `<namespace>_<name>_total`.
+
+    Args:
+        namespace: Prefix of every metric name.
+        buckets: Upper bounds in seconds of the duration histogram buckets.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "llm_fallbacks",
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.namespace: str = namespace
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        # metric -> labels -> (bucket counts, sum, count)
+        self._histograms: dict[str, dict[tuple[tuple[str, str], ...], tuple[list[int], float, int]]] = {}
+        self._counters: dict[str, dict[tuple[tuple[str, str], ...], float]] = {}
+        self._lock = threading.Lock()
+
+    def span(
+        self,
+        name: str,
+        seconds: float,
+        labels: Mapping[str, str],
+    ) -> None:
+        metric = _metric_name(self.namespace, f"{name}_seconds")
+        key = tuple(sorted(labels.items()))
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._histograms.setdefault(metric, {})
+            counts, total, n = series.get(key) or ([0] * (len(self.buckets) + 1), 0.0, 0)
+            counts[bucket] += 1
+            series[key] = (counts, total + seconds, n + 1)
+
+    def count(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str],
+    ) -> None:
+        metric = _metric_name(self.namespace, f"{name}_total")
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(metric, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for metric, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {metric} counter")
+                lines.extend(
+                    f"{metric}{_format_labels(key)} {_format_value(value)}" for key, value in sorted(series.items())
+                )
+            for metric, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {metric} histogram")
+                for key, (counts, total, n) in sorted(series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip((*self.buckets, float("inf")), counts, strict=True):
+                        cumulative += bucket_count
+                        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                        lines.append(f"{metric}_bucket{_format_labels((*key, ('le', le)))} {cumulative}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {_format_value(total)}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {n}")
+        return "\n".join(lines) + "\n" if lines else ""
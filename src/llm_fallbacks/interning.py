@@ -0,0 +1,144 @@
+"""Hash-consing of model specs: structurally identical specs share one immutable `FrozenSpec`.
+
+LiteLLM's price map repeats many specs verbatim (region variants, provider aliases), and merging
+provider overrides into the catalog produces more equal copies. `SpecInterner` keeps one canonical
+`FrozenSpec` per distinct content, looked up by a content hash, and counts what it deduplicated.
+
+Two specs are identical when they have the same keys and equal values of the same types, nested
+values included, so `{"max_tokens": 1}` and `{"max_tokens": 1.0}` stay distinct. Nested lists and dicts are shared
+with the canonical spec rather than copied; treat them as read-only too.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, Mapping, NoReturn
+
+from llm_fallbacks.memory import content_key, reachable_sizes
+
+
+class FrozenSpec(dict):
+    """A read-only, hashable model spec dict.
+
+    Reads, iteration, `json.dumps` and `dict(...)` work as for a dict; mutating methods raise
+    `TypeError`. `copy()` returns a plain, mutable `dict`, so `spec.copy().update(...)` keeps working.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = _content_hash(self)
+            return self._hash
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is immutable; copy() it to get a mutable dict")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore[assignment]
+
+    def copy(self) -> dict[str, Any]:  # type: ignore[override]
+        return dict(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+
+def _hashable(
+    value: Any,
+) -> Hashable:
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+    if isinstance(value, Mapping):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item) for item in value)
+    return value
+
+
+def _content_hash(
+    spec: Mapping[str, Any],
+) -> int:
+    return hash(frozenset((key, _hashable(value)) for key, value in spec.items()))
+
+
+def _identical(
+    canonical: Mapping[str, Any],
+    spec: Mapping[str, Any],
+) -> bool:
+    return canonical == spec and content_key(canonical) == content_key(spec)
+
+
+def _duplicate_bytes(
+    canonical: Mapping[str, Any],
+    duplicate: Mapping[str, Any],
+) -> int:
+    """Return the bytes `duplicate` holds that `canonical` does not share: its dict and its own values."""
+    size = sys.getsizeof(duplicate)
+    for key, value in duplicate.items():
+        if value is not canonical[key]:
+            size += sum(reachable_sizes(value).values()) if isinstance(value, (dict, list)) else sys.getsizeof(value)
+    return size
+
+
+@dataclass(frozen=True)
+class InternStats:
+    """What a `SpecInterner` deduplicated so far."""
+
+    seen: int
+    unique: int
+    # Bytes the duplicates held beyond their canonical spec, freed once the caller drops them.
+    bytes_saved: int
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Share of the interned specs that were duplicates of an earlier one."""
+        return 1 - self.unique / self.seen if self.seen else 0.0
+
+
+class SpecInterner:
+    """Canonicalize specs into shared `FrozenSpec`s keyed by content hash."""
+
+    def __init__(self):
+        # content hash -> canonical specs with that hash (more than one only on a hash collision)
+        self._table: dict[int, list[FrozenSpec]] = {}
+        self._seen: int = 0
+        self._unique: int = 0
+        self._bytes_saved: int = 0
+
+    def intern(
+        self,
+        spec: Mapping[str, Any],
+    ) -> FrozenSpec:
+        """Return the canonical `FrozenSpec` equal to `spec`, registering `spec` if it is the first."""
+        content_hash = hash(spec) if isinstance(spec, FrozenSpec) else _content_hash(spec)
+        bucket = self._table.setdefault(content_hash, [])
+        if any(canonical is spec for canonical in bucket):
+            return spec  # pyright: ignore[reportReturnType]
+        self._seen += 1
+        for canonical in bucket:
+            if _identical(canonical, spec):
+                self._bytes_saved += _duplicate_bytes(canonical, spec)
+                return canonical
+        canonical = spec if isinstance(spec, FrozenSpec) else FrozenSpec(spec)
+        canonical._hash = content_hash
+        bucket.append(canonical)
+        self._unique += 1
+        return canonical
+
+    def intern_all(
+        self,
+        models: Mapping[str, Any] | Iterable[tuple[str, Any]],
+    ) -> dict[str, Any]:
+        """Return a copy of a `{name: spec}` catalog with every dict spec interned; other values are kept."""
+        items = models.items() if isinstance(models, Mapping) else models
+        return {name: self.intern(spec) if isinstance(spec, Mapping) else spec for name, spec in items}
+
+    def stats(self) -> InternStats:
+        return InternStats(seen=self._seen, unique=self._unique, bytes_saved=self._bytes_saved)
@@ -0,0 +1,220 @@
+"""Observed per-model latency statistics and the latency-aware model ranking built on them."""
+
+from __future__ import annotations
+
+import math
+import threading
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from llm_fallbacks.core import calculate_approx_max_tokens, calculate_cost_per_token, sort_models_by_cost_and_limits
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+class _ModelLatency:
+    __slots__ = ("ewma", "samples", "sorted_samples")
+
+    def __init__(self, window: int):
+        self.ewma: float | None = None
+        self.samples: deque[float] = deque(maxlen=window)
+        self.sorted_samples: list[float] | None = None
+
+
+class LatencyStats:
+    """Thread-safe store of observed call latencies per model.
+
+    Each model keeps an exponentially weighted moving average and a sliding window of its most
+    recent samples, from which quantiles such as p50/p95 are computed lazily and cached until the
+    next sample arrives. `version` increases with every sample so rankings can tell when to refresh.
+
+    Args:
+        alpha: EWMA smoothing factor in (0, 1]; higher values react faster to new samples.
+        window: Number of recent samples kept per model for quantiles.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.2,
+        window: int = 256,
+    ):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.alpha: float = alpha
+        self.window: int = window
+        self._models: dict[str, _ModelLatency] = {}
+        self._lock = threading.Lock()
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        """Number of samples recorded so far."""
+        return self._version
+
+    def record(
+        self,
+        model: str,
+        seconds: float,
+    ):
+        """Record one observed latency for `model`."""
+        with self._lock:
+            stats = self._models.get(model)
+            if stats is None:
+                stats = self._models[model] = _ModelLatency(self.window)
+            stats.ewma = seconds if stats.ewma is None else stats.ewma + self.alpha * (seconds - stats.ewma)
+            stats.samples.append(seconds)
+            stats.sorted_samples = None
+            self._version += 1
+
+    def ewma(
+        self,
+        model: str,
+    ) -> float | None:
+        """Return the moving-average latency of `model`, or None if it has no samples."""
+        stats = self._models.get(model)
+        return None if stats is None else stats.ewma
+
+    def quantile(
+        self,
+        model: str,
+        q: float,
+    ) -> float | None:
+        """Return the `q` quantile (0-1) of the recent latencies of `model`, or None if it has no samples."""
+        stats = self._models.get(model)
+        if stats is None:
+            return None
+        with self._lock:
+            if stats.sorted_samples is None:
+                stats.sorted_samples = sorted(stats.samples)
+            ordered = stats.sorted_samples
+        # Nearest-rank quantile.
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+    def p50(self, model: str) -> float | None:
+        """Return the median recent latency of `model`."""
+        return self.quantile(model, 0.5)
+
+    def p95(self, model: str) -> float | None:
+        """Return the 95th percentile recent latency of `model`, e.g. as a `FallbackExecutor` hedge delay."""
+        return self.quantile(model, 0.95)
+
+    def models(self) -> list[str]:
+        """Return the models that have at least one sample."""
+        return list(self._models)
+
+
+@dataclass(frozen=True)
+class RankingWeights:
+    """Weights of the score terms used by `LatencyAwareRanker`; lower scores rank first."""
+
+    cost: float = 1.0
+    context: float = 0.1
+    p50: float = 0.0
+    p95: float = 1.0
+
+
+# Part of the [0, 1] scale left between zero and the smallest positive value when both occur, so
+# that free models score strictly better than the cheapest paid one.
+_ZERO_GAP = 0.1
+
+
+def _log_normalize(values: Iterable[float | None]) -> list[float | None]:
+    """Min-max normalize the logarithm of positive values to [0, 1]; None stays None, zero maps to 0.
+
+    When some values are zero, positive values map to [`_ZERO_GAP`, 1] instead, so they stay behind them.
+    """
+    values = list(values)
+    logs = [math.log(value) for value in values if value is not None and value > 0]
+    low = min(logs, default=0.0)
+    span = max(logs, default=0.0) - low
+    floor = _ZERO_GAP if any(value is not None and value <= 0 for value in values) else 0.0
+    normalized: list[float | None] = []
+    for value in values:
+        if value is None:
+            normalized.append(None)
+        elif value <= 0:
+            normalized.append(0.0)
+        elif not span:
+            normalized.append(floor)
+        else:
+            normalized.append(floor + (1.0 - floor) * (math.log(value) - low) / span)
+    return normalized
+
+
+class LatencyAwareRanker:
+    """Rank models by a weighted score of cost, context size and observed p50/p95 latency.
+
+    Cost and context terms are computed once, when the ranker is built. Each call to `rank` only
+    reads the latency terms from `stats`, and the result is reused until `stats.version` changes,
+    so re-ranking as new samples arrive is cheap.
+
+    Every term is log-scaled and min-max normalized to [0, 1] across the candidates, so a model
+    ten times slower is penalized as much as one ten times more expensive; free models score 0
+    and the cheapest paid model `_ZERO_GAP`. Unknown costs and
+    context sizes get the worst value (1); models without latency samples get a neutral 0.5.
+    Ties keep the cost-then-context order of `sort_models_by_cost_and_limits`.
+
+    Args:
+        models: Candidate models and their specifications.
+        stats: Observed latencies.
+        weights: Score weights.
+        free_only: Only rank models with zero cost.
+    """
+
+    def __init__(
+        self,
+        models: dict[str, LiteLLMBaseModelSpec],
+        stats: LatencyStats,
+        weights: RankingWeights | None = None,
+        *,
+        free_only: bool = False,
+    ):
+        self.stats: LatencyStats = stats
+        self.weights: RankingWeights = weights or RankingWeights()
+        self._static_order: list[tuple[str, LiteLLMBaseModelSpec]] = sort_models_by_cost_and_limits(
+            models, free_only=free_only
+        )
+        costs = _log_normalize(
+            cost if (cost := calculate_cost_per_token(spec)) >= 0 else None for _, spec in self._static_order
+        )
+        contexts = _log_normalize(
+            tokens if (tokens := calculate_approx_max_tokens(spec)) > 0 else None for _, spec in self._static_order
+        )
+        self._static_scores: list[float] = [
+            self.weights.cost * (1.0 if cost is None else cost)
+            + self.weights.context * (1.0 if context is None else 1.0 - context)
+            for cost, context in zip(costs, contexts, strict=True)
+        ]
+        self._ranked: list[tuple[str, LiteLLMBaseModelSpec]] | None = None
+        self._ranked_version: int = -1
+
+    def scores(self) -> dict[str, float]:
+        """Return the current score of every candidate."""
+        names = [name for name, _ in self._static_order]
+        scores = list(self._static_scores)
+        for weight, q in ((self.weights.p50, 0.5), (self.weights.p95, 0.95)):
+            if not weight:
+                continue
+            latencies = _log_normalize(self.stats.quantile(name, q) for name in names)
+            for position, latency in enumerate(latencies):
+                scores[position] += weight * (0.5 if latency is None else latency)
+        return dict(zip(names, scores, strict=True))
+
+    def rank(self) -> list[tuple[str, LiteLLMBaseModelSpec]]:
+        """Return the candidates ordered by score, recomputing only when new latencies were recorded."""
+        if self._ranked is None or self._ranked_version != self.stats.version:
+            version = self.stats.version
+            scores = self.scores()
+            positions = sorted(
+                range(len(self._static_order)),
+                key=lambda position: (scores[self._static_order[position][0]], position),
+            )
+            self._ranked = [self._static_order[position] for position in positions]
+            self._ranked_version = version
+        return list(self._ranked)
@@ -0,0 +1,222 @@
+"""Deep memory accounting of the catalog data structures, including what they share and duplicate.
+
+`measure_structures` walks the object graph of each structure and counts every object once per
+structure. An object reachable from several structures is *shared*; the rest of a structure's deep
+size is *exclusive* to it, i.e. what dropping that structure alone would free. Sharing is only
+measured between the structures passed in: an object also referenced from elsewhere counts as
+exclusive if only one of them reaches it.
+
+A spec dict is a *duplicate* when another, distinct dict in the walked structures has the same
+content; its `duplicate_spec_bytes` are the bytes it holds beyond what the first copy already
+holds, i.e. what canonicalizing it to that copy could free.
+
+Example:
+    ```python
+    from llm_fallbacks.memory import catalog_structures, format_report, measure_structures
+
+    print(format_report(measure_structures(catalog_structures())))
+    ```
+"""
+
+from __future__ import annotations
+
+import sys
+
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Hashable, Iterator, Mapping
+
+# Objects that belong to the program rather than to the data, and are never counted.
+_SKIPPED_TYPES: tuple[type, ...] = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+@dataclass(frozen=True)
+class StructureMemory:
+    name: str
+    entries: int
+    objects: int
+    deep_bytes: int
+    exclusive_bytes: int
+    shared_bytes: int
+    spec_dicts: int
+    duplicate_spec_dicts: int
+    duplicate_spec_bytes: int
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    structures: list[StructureMemory]
+    # Bytes of every object reachable from any structure, each counted once.
+    total_bytes: int
+    spec_dicts: int
+    distinct_specs: int
+    duplicate_spec_dicts: int
+    duplicate_spec_bytes: int
+
+
+def _children(
+    obj: Any,
+) -> Iterator[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    elif isinstance(obj, Mapping):
+        yield from obj.keys()
+        yield from obj.values()
+    elif hasattr(obj, "__dict__") and not isinstance(obj, _SKIPPED_TYPES):
+        yield vars(obj)
+
+
+def reachable_sizes(
+    root: Any,
+) -> dict[int, int]:
+    """Return the id and `sys.getsizeof` of every object reachable from `root`, `root` included."""
+    sizes: dict[int, int] = {}
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in sizes or obj is None or isinstance(obj, (bool, *_SKIPPED_TYPES)):
+            continue
+        sizes[id(obj)] = sys.getsizeof(obj)
+        stack.extend(_children(obj))
+    return sizes
+
+
+def content_key(
+    value: Any,
+) -> Hashable:
+    """Return a hashable key that is equal for two values exactly when their content and types are."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, content_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, *(content_key(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(content_key(item) for item in value)
+    # Keep 1 and 1.0 (and True) apart; they compare equal but are different spec values.
+    return (type(value).__name__, value)
+
+
+def _spec_dicts(
+    structure: Any,
+) -> Iterator[Mapping[str, Any]]:
+    """Yield the spec dicts of a `{name: spec}` mapping or a `[(name, spec), ...]` list."""
+    if isinstance(structure, Mapping):
+        specs = structure.values()
+    else:
+        specs = (item[1] for item in structure if isinstance(item, tuple) and len(item) == 2)
+    for spec in specs:
+        if isinstance(spec, Mapping):
+            yield spec
+
+
+def measure_structures(
+    structures: Mapping[str, Any],
+) -> MemoryReport:
+    """Measure the deep, exclusive and shared size of each structure and the duplicated spec dicts.
+
+    Args:
+        structures: Structures to measure by name, each a `{name: spec}` mapping or a ranked
+            `[(name, spec), ...]` list; other containers are measured but hold no spec dicts.
+
+    Returns:
+        A `MemoryReport` with one `StructureMemory` per structure, in the given order.
+    """
+    reachable = {name: reachable_sizes(structure) for name, structure in structures.items()}
+    owners: dict[int, int] = {}
+    sizes: dict[int, int] = {}
+    for objects in reachable.values():
+        sizes.update(objects)
+        for object_id in objects:
+            owners[object_id] = owners.get(object_id, 0) + 1
+
+    # content -> the first spec dict seen with it and the objects that copy already holds.
+    canonical: dict[Hashable, dict[int, int]] = {}
+    # id of each duplicate spec dict -> bytes it holds beyond its canonical copy.
+    duplicates: dict[int, int] = {}
+    spec_ids: set[int] = set()
+    for structure in structures.values():
+        for spec in _spec_dicts(structure):
+            if id(spec) in spec_ids:
+                continue
+            spec_ids.add(id(spec))
+            key = content_key(spec)
+            if key not in canonical:
+                canonical[key] = reachable_sizes(spec)
+                continue
+            kept = canonical[key]
+            duplicates[id(spec)] = sum(
+                size for object_id, size in reachable_sizes(spec).items() if object_id not in kept
+            )
+
+    measured: list[StructureMemory] = []
+    for name, structure in structures.items():
+        objects = reachable[name]
+        deep_bytes = sum(objects.values())
+        exclusive_bytes = sum(size for object_id, size in objects.items() if owners[object_id] == 1)
+        spec_dict_ids = {id(spec) for spec in _spec_dicts(structure)}
+        duplicate_ids = spec_dict_ids & duplicates.keys()
+        measured.append(
+            StructureMemory(
+                name=name,
+                entries=len(structure) if hasattr(structure, "__len__") else 0,
+                objects=len(objects),
+                deep_bytes=deep_bytes,
+                exclusive_bytes=exclusive_bytes,
+                shared_bytes=deep_bytes - exclusive_bytes,
+                spec_dicts=len(spec_dict_ids),
+                duplicate_spec_dicts=len(duplicate_ids),
+                duplicate_spec_bytes=sum(duplicates[spec_id] for spec_id in duplicate_ids),
+            )
+        )
+    return MemoryReport(
+        structures=measured,
+        total_bytes=sum(sizes.values()),
+        spec_dicts=len(spec_ids),
+        distinct_specs=len(canonical),
+        duplicate_spec_dicts=len(duplicates),
+        duplicate_spec_bytes=sum(duplicates.values()),
+    )
+
+
+def catalog_structures() -> dict[str, Any]:
+    """Return the library's catalog structures by name, importing (and so building) the provider configs.
+
+    `BaseProviderConfig.ALL_KNOWN_MODELS`, each custom provider's `model_specs` and `free_models`,
+    `ALL_MODELS`, `FREE_MODELS` and the priority order of each of the 14 model types.
+    """
+    from llm_fallbacks.config import ALL_MODELS, CUSTOM_PROVIDERS, FREE_MODELS, BaseProviderConfig
+    from llm_fallbacks.filter_litellm import _MODEL_TYPE_GETTERS, _priority_order
+
+    structures: dict[str, Any] = {"ALL_KNOWN_MODELS": BaseProviderConfig.ALL_KNOWN_MODELS}
+    for provider in CUSTOM_PROVIDERS:
+        structures[f"{provider.provider_name}.model_specs"] = provider.model_specs
+        structures[f"{provider.provider_name}.free_models"] = provider.free_models
+    structures["ALL_MODELS"] = ALL_MODELS
+    structures["FREE_MODELS"] = FREE_MODELS
+    for model_type in _MODEL_TYPE_GETTERS:
+        structures[f"{model_type.upper()}_MODEL_PRIORITY_ORDER"] = _priority_order(model_type)
+    return structures
+
+
+def format_report(
+    report: MemoryReport,
+) -> str:
+    """Format a report as a fixed-width table followed by the totals."""
+    lines = [
+        f"{'structure':<40} {'entries':>8} {'deep KiB':>10} {'exclusive KiB':>14} {'shared KiB':>11} "
+        f"{'specs':>7} {'dup specs':>10} {'dup KiB':>9}"
+    ]
+    lines.extend(
+        f"{s.name:<40} {s.entries:>8} {s.deep_bytes / 1024:>10.1f} {s.exclusive_bytes / 1024:>14.1f} "
+        f"{s.shared_bytes / 1024:>11.1f} {s.spec_dicts:>7} {s.duplicate_spec_dicts:>10} "
+        f"{s.duplicate_spec_bytes / 1024:>9.1f}"
+        for s in report.structures
+    )
+    lines.append(
+        f"total {report.total_bytes / 1024:.1f} KiB counted once; {report.spec_dicts} spec dicts with "
+        f"{report.distinct_specs} distinct contents; {report.duplicate_spec_dicts} duplicates holding "
+        f"{report.duplicate_spec_bytes / 1024:.1f} KiB"
+    )
+    return "\n".join(lines)
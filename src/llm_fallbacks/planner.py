@@ -0,0 +1,179 @@
+"""Offline planning of how to spread a request rate across equivalent models within their rate limits."""
+
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from llm_fallbacks.query import FREE_COST_KEYS
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec, LiteLLMYAMLConfig
+
+
+MINUTES_PER_DAY = 24 * 60
+
+# Capabilities two models must share, besides their mode, to be interchangeable for the same traffic.
+CAPABILITY_KEYS: tuple[str, ...] = (
+    "supports_vision",
+    "supports_function_calling",
+    "supports_audio_input",
+    "supports_audio_output",
+)
+# Fields of an equivalence key. "free" is whether every `FREE_COST_KEYS` cost is zero: free and paid
+# models never share traffic, so a free group never spills onto paid models and vice versa.
+EQUIVALENCE_KEYS: tuple[str, ...] = ("mode", "free", *CAPABILITY_KEYS)
+# First segment of the `model_name` under which `apply_traffic_plan` groups equivalent deployments.
+TRAFFIC_GROUP_PREFIX = "traffic"
+
+
+@dataclass
+class TrafficPlan:
+    """Requests per minute assigned to each model so that none exceeds its limits."""
+
+    target_rpm: float
+    allocations: dict[str, float] = field(default_factory=dict)
+    capacities: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def served_rpm(self) -> float:
+        """Total requests per minute the plan can serve."""
+        return sum(self.allocations.values())
+
+    @property
+    def unserved_rpm(self) -> float:
+        """Requests per minute above the combined capacity of the models."""
+        return max(0.0, self.target_rpm - self.served_rpm)
+
+    def weights(self) -> dict[str, float]:
+        """Return each model's share of the served traffic, summing to 1 (empty when nothing is served)."""
+        served = self.served_rpm
+        if served <= 0:
+            return {}
+        return {model: allocation / served for model, allocation in self.allocations.items() if allocation > 0}
+
+
+def model_capacity_rpm(
+    model_spec: LiteLLMBaseModelSpec | Mapping[str, Any],
+    avg_tokens_per_request: float,
+) -> float:
+    """Return the sustained requests per minute a model accepts, from its `rpm`, `tpm` and `rpd` limits.
+
+    `tpm` is converted with the average request size and `rpd` is spread evenly over the day. A
+    model without any limit has infinite capacity.
+    """
+    capacity = math.inf
+    rpm = model_spec.get("rpm")
+    if isinstance(rpm, (int, float)) and rpm > 0:
+        capacity = min(capacity, float(rpm))
+    tpm = model_spec.get("tpm")
+    if isinstance(tpm, (int, float)) and tpm > 0 and avg_tokens_per_request > 0:
+        capacity = min(capacity, tpm / avg_tokens_per_request)
+    rpd = model_spec.get("rpd")
+    if isinstance(rpd, (int, float)) and rpd > 0:
+        capacity = min(capacity, rpd / MINUTES_PER_DAY)
+    return capacity
+
+
+def plan_traffic(
+    models: Mapping[str, LiteLLMBaseModelSpec] | Iterable[tuple[str, LiteLLMBaseModelSpec]],
+    target_rpm: float,
+    avg_tokens_per_request: float,
+) -> TrafficPlan:
+    """Spread `target_rpm` across equivalent models by water-filling their capacities.
+
+    Every model gets an equal share of the traffic, except that models whose capacity is below
+    that share are filled to capacity and the remainder is split among the others. The result
+    serves `min(target_rpm, total capacity)`, the maximum possible throughput, and among such plans
+    it is the most even one (max-min fair). Runs in O(n log n).
+
+    Args:
+        models: Equivalent models and their specifications, e.g. one entry of `group_equivalent_models`.
+        target_rpm: Requests per minute to serve.
+        avg_tokens_per_request: Average prompt plus completion tokens per request, used for `tpm`.
+
+    Returns:
+        The allocation per model.
+    """
+    items = list(models.items()) if isinstance(models, Mapping) else list(models)
+    plan = TrafficPlan(target_rpm=target_rpm)
+    plan.capacities = {name: model_capacity_rpm(spec, avg_tokens_per_request) for name, spec in items}
+
+    remaining = float(target_rpm)
+    unfilled = len(plan.capacities)
+    for name, capacity in sorted(plan.capacities.items(), key=lambda item: item[1]):
+        share = remaining / unfilled if unfilled else 0.0
+        allocation = min(capacity, share)
+        plan.allocations[name] = allocation
+        remaining -= allocation
+        unfilled -= 1
+    return plan
+
+
+def group_equivalent_models(
+    models: Mapping[str, LiteLLMBaseModelSpec] | Iterable[tuple[str, LiteLLMBaseModelSpec]],
+) -> dict[tuple[Any, ...], dict[str, LiteLLMBaseModelSpec]]:
+    """Group models that share their mode, whether they are free and their capabilities, preserving order.
+
+    Keys are tuples of the `EQUIVALENCE_KEYS` fields, e.g. `("chat", True, False, True, False, False)`.
+    """
+    groups: dict[tuple[Any, ...], dict[str, LiteLLMBaseModelSpec]] = {}
+    for name, spec in models.items() if isinstance(models, Mapping) else models:
+        free = all(spec.get(k, 0) == 0 for k in FREE_COST_KEYS)
+        key = (spec.get("mode"), free, *(bool(spec.get(k)) for k in CAPABILITY_KEYS))
+        groups.setdefault(key, {})[name] = spec
+    return groups
+
+
+def traffic_group_name(
+    key: tuple[Any, ...],
+) -> str:
+    """Return the `model_name` shared by the planned deployments of an equivalence key.
+
+    For example `traffic/chat+vision` for paid chat models with vision, and `traffic/chat+vision:free`
+    for free ones, after OpenRouter's `:free` model suffix.
+    """
+    mode, free, *capabilities = key
+    flags = "".join(
+        f"+{capability.removeprefix('supports_')}"
+        for capability, enabled in zip(CAPABILITY_KEYS, capabilities, strict=True)
+        if enabled
+    )
+    return f"{TRAFFIC_GROUP_PREFIX}/{mode or 'any'}{flags}{':free' if free else ''}"
+
+
+def apply_traffic_plan(
+    config: LiteLLMYAMLConfig,
+    target_rpm: float,
+    avg_tokens_per_request: float,
+) -> dict[tuple[Any, ...], TrafficPlan]:
+    """Plan `target_rpm` for every group of equivalent deployments and add them to the config as model groups.
+
+    LiteLLM's `simple-shuffle` routing only weighs deployments that share a `model_name`, so each
+    group's planned deployments are added once more under `traffic_group_name(key)`, each with its
+    `weight` in `litellm_params`. Requests to that name are split according to the plan, while the
+    per-model entries stay addressable on their own. Wildcard deployments are skipped because they
+    carry no per-model limits.
+
+    Returns:
+        The plan of every group, keyed by its equivalence key.
+    """
+    deployments: dict[str, dict[str, Any]] = {
+        entry["model_name"]: entry.get("litellm_params", {})  # pyright: ignore[reportAttributeAccessIssue]
+        for entry in config["model_list"]
+        if "*" not in str(entry.get("model_name", ""))
+    }
+    plans: dict[tuple[Any, ...], TrafficPlan] = {}
+    for key, group in group_equivalent_models(deployments).items():
+        plan = plans[key] = plan_traffic(group, target_rpm, avg_tokens_per_request)
+        group_name = traffic_group_name(key)
+        for name, weight in plan.weights().items():
+            config["model_list"].append(
+                {
+                    "model_name": group_name,
+                    "litellm_params": {**deployments[name], "weight": round(weight, 6)},
+                }  # pyright: ignore[reportArgumentType]
+            )
+    return plans
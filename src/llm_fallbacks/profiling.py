@@ -0,0 +1,205 @@
+"""Per-stage CPU and allocation profiles of a pipeline run, in formats flamegraph tools read.
+
+For every stage, `StageProfiler.stage` writes to its output directory:
+
+- `<stage>.pstats`: a cProfile dump, for `python -m pstats`, snakeviz or `flameprof`.
+- `<stage>.collapsed`: on-CPU call stacks sampled every `interval` of CPU time, in the collapsed
+  format (`root;caller;callee count`) read by `flamegraph.pl`, inferno and speedscope.
+- `<stage>.alloc.collapsed`: bytes still allocated at the end of the stage, per allocation stack,
+  in the same collapsed format, for a memory flamegraph.
+- `<stage>.tracemalloc.txt`: the top allocation sites by size and the stage's peak traced memory.
+
+`write_summary` adds `summary.txt` with the wall time, peak memory and sample count of each stage.
+cProfile and tracemalloc both slow the run down, so compare profiled runs with profiled runs only.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import signal
+import threading
+import time
+import tracemalloc
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StageProfile:
+    name: str
+    seconds: float
+    peak_bytes: int
+    samples: int
+    paths: tuple[Path, ...]
+
+
+def _frame_label(
+    code: CodeType,
+) -> str:
+    filename = "/".join(Path(code.co_filename).parts[-2:])
+    # `co_qualname` is new in Python 3.11; 3.10 only has the bare function name.
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class _StackSampler:
+    """Count the on-CPU call stacks of the main thread, sampled by a `SIGPROF` interval timer.
+
+    A signal handler runs on the sampled thread itself, so unlike a sampling thread it adds no
+    foreign frames to a cProfile run of the same block: only the handler's own calls show up.
+    Where `signal.setitimer` is unavailable (Windows) or off the main thread, nothing is sampled.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+    ):
+        self.interval: float = interval
+        self.stacks: Counter[tuple[CodeType, ...]] = Counter()
+        self.enabled: bool = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+        self._previous_handler: Any = None
+
+    def _sample(
+        self,
+        signum: int,
+        frame: FrameType | None,
+    ):
+        codes: list[CodeType] = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        self.stacks[tuple(codes)] += 1
+
+    def start(self):
+        if not self.enabled:
+            logger.warning("Stack sampling needs signal.setitimer on the main thread; writing no collapsed stacks")
+            return
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> Counter[str]:
+        """Stop sampling and return the sample count per collapsed stack, root first."""
+        if self.enabled:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+        collapsed: Counter[str] = Counter()
+        for codes, samples in self.stacks.items():
+            collapsed[";".join(_frame_label(code) for code in reversed(codes))] += samples
+        return collapsed
+
+
+def _write_collapsed(
+    path: Path,
+    weights: Counter[str],
+):
+    path.write_text("".join(f"{stack} {weight}\n" for stack, weight in weights.most_common()), encoding="utf-8")
+
+
+class StageProfiler:
+    """Profile the stages of a run one at a time and write each stage's profiles to `output_dir`.
+
+    Args:
+        output_dir: Directory the profiles are written to; created when missing.
+        top: Number of allocation sites listed in each `<stage>.tracemalloc.txt`.
+        interval: Seconds of CPU time between two stack samples.
+        nframe: Frames kept per allocation traceback.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        top: int = 25,
+        interval: float = 0.005,
+        nframe: int = 32,
+    ):
+        self.output_dir: Path = output_dir
+        self.top: int = top
+        self.interval: float = interval
+        self.nframe: int = nframe
+        self.stages: list[StageProfile] = []
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+    ) -> Iterator[None]:
+        """Profile the enclosed block as the stage `name`; stages must not be nested."""
+        if tracemalloc.is_tracing():
+            raise ValueError(f"Cannot profile stage {name!r}: tracemalloc is already tracing")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        sampler = _StackSampler(self.interval)
+        profile = cProfile.Profile()
+        tracemalloc.start(self.nframe)
+        sampler.start()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            seconds = time.perf_counter() - start
+            stacks = sampler.stop()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                ]
+            )
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            paths = self._write_stage(name, profile, stacks, snapshot, peak_bytes)
+            self.stages.append(StageProfile(name, seconds, peak_bytes, sum(stacks.values()), paths))
+            logger.info(f"Profiled stage {name} in {seconds:.3f}s, peak {peak_bytes / 2**20:.1f} MiB")
+
+    def _write_stage(
+        self,
+        name: str,
+        profile: cProfile.Profile,
+        stacks: Counter[str],
+        snapshot: tracemalloc.Snapshot,
+        peak_bytes: int,
+    ) -> tuple[Path, ...]:
+        pstats_path = self.output_dir / f"{name}.pstats"
+        profile.dump_stats(pstats_path)
+
+        collapsed_path = self.output_dir / f"{name}.collapsed"
+        _write_collapsed(collapsed_path, stacks)
+
+        allocations: Counter[str] = Counter()
+        for statistic in snapshot.statistics("traceback"):
+            # Tracebacks run from the oldest frame to the most recent one, the collapsed stack order.
+            frames = [f"{frame.filename}:{frame.lineno}".replace(";", ":") for frame in statistic.traceback]
+            allocations[";".join(frames)] += statistic.size
+        alloc_path = self.output_dir / f"{name}.alloc.collapsed"
+        _write_collapsed(alloc_path, allocations)
+
+        report_path = self.output_dir / f"{name}.tracemalloc.txt"
+        lines = [
+            f"stage {name}: peak {peak_bytes} bytes traced, top {self.top} allocation sites still held at the end",
+            *(str(statistic) for statistic in snapshot.statistics("lineno")[: self.top]),
+        ]
+        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return (pstats_path, collapsed_path, alloc_path, report_path)
+
+    def write_summary(self) -> Path:
+        """Write `summary.txt`, one line per profiled stage, and return its path."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / "summary.txt"
+        lines = [f"{'stage':<30} {'seconds':>10} {'peak MiB':>10} {'samples':>8}"]
+        lines.extend(
+            f"{stage.name:<30} {stage.seconds:>10.3f} {stage.peak_bytes / 2**20:>10.1f} {stage.samples:>8}"
+            for stage in self.stages
+        )
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
@@ -0,0 +1,210 @@
+"""Columnar catalog of a ranked model list, filtered with vectorized predicates that keep the rank order.
+
+numpy is imported by `ColumnarCatalog` alone: `iter_matching` applies the same criteria one spec at a
+time, for cold paths like the CLI that filter a ranked list once and would spend more on the import.
+"""
+
+from __future__ import annotations
+
+import math
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+# Cost fields that must all be zero for `free_only`, as in `sort_models_by_cost_and_limits`.
+FREE_COST_KEYS: tuple[str, ...] = (
+    "input_cost_per_token",
+    "output_cost_per_token",
+    "input_cost_per_character",
+    "output_cost_per_character",
+    "input_cost_per_second",
+    "output_cost_per_second",
+)
+CAPABILITY_FLAGS: tuple[str, ...] = (
+    "supports_vision",
+    "supports_audio_input",
+    "supports_audio_output",
+    "supports_function_calling",
+)
+
+
+def _number(
+    value: Any,
+) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+def _flag_code(
+    value: Any,
+) -> int:
+    """Encode a capability flag so that `code == int(wanted)` matches `value == wanted` for a bool `wanted`."""
+    if value == 1:
+        return 1
+    if value == 0:
+        return 0
+    return -1
+
+
+class ColumnarCatalog:
+    """A ranked model list stored as one numpy array per filtered field.
+
+    `select` compiles its arguments into predicates, counts how many rows each one keeps using
+    per-column statistics prepared at build time, and applies them from most to least selective,
+    each only to the rows that survived the previous ones. Surviving row indices stay sorted, so
+    the result keeps the rank order of the list the catalog was built from.
+
+    Args:
+        ranked_models: (name, spec) pairs in rank order, e.g. a `*_MODEL_PRIORITY_ORDER` list.
+    """
+
+    def __init__(
+        self,
+        ranked_models: list[tuple[str, LiteLLMBaseModelSpec]],
+    ):
+        import numpy as np
+
+        specs = [spec for _, spec in ranked_models]
+        self.names: list[str] = [name for name, _ in ranked_models]
+        self.input_cost: np.ndarray = np.array([_number(s.get("input_cost_per_token", 0)) for s in specs])
+        self.max_tokens: np.ndarray = np.array([_number(s.get("max_tokens", 0)) for s in specs])
+        self.free: np.ndarray = np.array(
+            [all(s.get(key, 0) == 0 for key in FREE_COST_KEYS) for s in specs], dtype=bool
+        ) & ~(self.input_cost > 0)
+        self.flags: dict[str, np.ndarray] = {
+            flag: np.array([_flag_code(s.get(flag, False)) for s in specs], dtype=np.int8) for flag in CAPABILITY_FLAGS
+        }
+        # Statistics used to count the rows each predicate keeps without evaluating it.
+        self._sorted_input_cost: np.ndarray = np.sort(self.input_cost)
+        self._sorted_max_tokens: np.ndarray = np.sort(self.max_tokens)
+        self._free_count: int = int(np.count_nonzero(self.free))
+        self._flag_counts: dict[str, dict[int, int]] = {
+            flag: {code: int(np.count_nonzero(codes == code)) for code in (0, 1)} for flag, codes in self.flags.items()
+        }
+        self._sorted_names: list[str] = sorted(self.names)
+        self._names_array: np.ndarray = np.array(self.names, dtype=str)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _prefix_count(
+        self,
+        prefix: str,
+    ) -> int:
+        return bisect_left(self._sorted_names, prefix + "\U0010ffff") - bisect_left(self._sorted_names, prefix)
+
+    def _predicates(
+        self,
+        *,
+        free_only: bool,
+        max_cost_per_token: float | None,
+        min_context_length: int | None,
+        flags: dict[str, bool | None],
+        provider: str | None,
+    ) -> list[tuple[int, Callable[[np.ndarray], np.ndarray]]]:
+        """Return (rows kept, mask over the given row indices) for every active predicate."""
+        import numpy as np
+
+        predicates: list[tuple[int, Callable[[np.ndarray], np.ndarray]]] = []
+        if free_only:
+            predicates.append((self._free_count, lambda rows: self.free[rows]))
+        if max_cost_per_token is not None:
+            count = int(np.searchsorted(self._sorted_input_cost, max_cost_per_token, side="right"))
+            predicates.append((count, lambda rows: ~(self.input_cost[rows] > max_cost_per_token)))
+        if min_context_length is not None:
+            count = len(self) - int(np.searchsorted(self._sorted_max_tokens, min_context_length, side="left"))
+            predicates.append((count, lambda rows: ~(self.max_tokens[rows] < min_context_length)))
+        for flag, wanted in flags.items():
+            if wanted is not None:
+                code = int(wanted)
+                predicates.append(
+                    (self._flag_counts[flag][code], lambda rows, flag=flag, code=code: self.flags[flag][rows] == code)
+                )
+        if provider is not None:
+            predicates.append(
+                (self._prefix_count(provider), lambda rows: np.char.startswith(self._names_array[rows], provider))
+            )
+        return predicates
+
+    def select(
+        self,
+        *,
+        free_only: bool = False,
+        max_cost_per_token: float | None = None,
+        min_context_length: int | None = None,
+        supports_vision: bool | None = None,
+        supports_audio_input: bool | None = None,
+        supports_audio_output: bool | None = None,
+        supports_function_calling: bool | None = None,
+        provider: str | None = None,
+    ) -> list[str]:
+        """Return the names of the models matching every criterion, in rank order.
+
+        The criteria have the same meaning as in `filter_models`.
+        """
+        import numpy as np
+
+        predicates = self._predicates(
+            free_only=free_only,
+            max_cost_per_token=max_cost_per_token,
+            min_context_length=min_context_length,
+            flags={
+                "supports_vision": supports_vision,
+                "supports_audio_input": supports_audio_input,
+                "supports_audio_output": supports_audio_output,
+                "supports_function_calling": supports_function_calling,
+            },
+            provider=provider,
+        )
+        rows = np.arange(len(self))
+        for _, mask in sorted(predicates, key=lambda predicate: predicate[0]):
+            if not len(rows):
+                break
+            rows = rows[mask(rows)]
+        names = self.names
+        return [names[i] for i in rows.tolist()]
+
+
+def iter_matching(
+    ranked_models: Iterable[tuple[str, LiteLLMBaseModelSpec]],
+    *,
+    free_only: bool = False,
+    max_cost_per_token: float | None = None,
+    min_context_length: int | None = None,
+    supports_vision: bool | None = None,
+    supports_audio_input: bool | None = None,
+    supports_audio_output: bool | None = None,
+    supports_function_calling: bool | None = None,
+    provider: str | None = None,
+) -> Iterator[str]:
+    """Yield the names of the models matching every criterion, in rank order, without numpy.
+
+    Matches exactly what `ColumnarCatalog(ranked_models).select(...)` returns, lazily, so a caller
+    that only needs the first few matches stops there.
+    """
+    flags = {
+        "supports_vision": supports_vision,
+        "supports_audio_input": supports_audio_input,
+        "supports_audio_output": supports_audio_output,
+        "supports_function_calling": supports_function_calling,
+    }
+    wanted_codes = {flag: int(wanted) for flag, wanted in flags.items() if wanted is not None}
+    for name, spec in ranked_models:
+        input_cost = _number(spec.get("input_cost_per_token", 0))
+        # NaN limits compare false, and are kept, as in the vectorized predicates.
+        if free_only and (input_cost > 0 or not all(spec.get(key, 0) == 0 for key in FREE_COST_KEYS)):
+            continue
+        if max_cost_per_token is not None and input_cost > max_cost_per_token:
+            continue
+        if min_context_length is not None and _number(spec.get("max_tokens", 0)) < min_context_length:
+            continue
+        if any(_flag_code(spec.get(flag, False)) != code for flag, code in wanted_codes.items()):
+            continue
+        if provider is not None and not name.startswith(provider):
+            continue
+        yield name
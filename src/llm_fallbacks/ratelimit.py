@@ -0,0 +1,277 @@
+"""Client-side token-bucket rate limiting built from the catalog's `rpm`, `tpm` and `rpd` limits."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec, LiteLLMYAMLConfig
+
+
+# Catalog field -> seconds over which the limit applies.
+RATE_LIMIT_PERIODS: dict[str, float] = {"rpm": 60.0, "tpm": 60.0, "rpd": 86400.0}
+
+
+class TokenBucket:
+    """Bucket holding up to `capacity` tokens, refilled continuously at `capacity / period` per second."""
+
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated")
+
+    def __init__(
+        self,
+        capacity: float,
+        period: float,
+        now: float,
+    ):
+        self.capacity: float = capacity
+        self.refill_rate: float = capacity / period
+        self.tokens: float = capacity
+        self.updated: float = now
+
+    def refill(
+        self,
+        now: float,
+    ):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+            self.updated = now
+
+    def wait_time(
+        self,
+        amount: float,
+    ) -> float:
+        """Return the seconds until `amount` tokens are available (call `refill` first)."""
+        if amount > self.capacity:
+            return math.inf
+        return max(0.0, (amount - self.tokens) / self.refill_rate)
+
+
+class ModelRateLimiter:
+    """The `rpm`, `tpm` and `rpd` buckets of one model, consumed all-or-nothing under one lock.
+
+    Each request takes one token from the `rpm` and `rpd` buckets and `tokens` from the `tpm` bucket.
+    """
+
+    __slots__ = ("_buckets", "_lock", "model")
+
+    def __init__(
+        self,
+        model: str,
+        limits: Mapping[str, float],
+        now: float,
+    ):
+        self.model: str = model
+        self._buckets: list[tuple[str, TokenBucket]] = [
+            (key, TokenBucket(float(limits[key]), period, now))
+            for key, period in RATE_LIMIT_PERIODS.items()
+            if key in limits
+        ]
+        self._lock = threading.Lock()
+
+    def _wait_time(
+        self,
+        tokens: float,
+        now: float,
+    ) -> float:
+        wait = 0.0
+        for key, bucket in self._buckets:
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time(tokens if key == "tpm" else 1))
+        return wait
+
+    def try_acquire(
+        self,
+        tokens: float,
+        now: float,
+    ) -> float:
+        """Consume a request of `tokens` tokens if every bucket allows it.
+
+        Returns:
+            0.0 when the request was admitted, otherwise the seconds to wait before retrying
+            (`inf` when the request can never fit, e.g. more tokens than the `tpm` limit).
+        """
+        with self._lock:
+            wait = self._wait_time(tokens, now)
+            if wait <= 0.0:
+                for key, bucket in self._buckets:
+                    bucket.tokens -= tokens if key == "tpm" else 1
+            return wait
+
+    def wait_time(
+        self,
+        tokens: float,
+        now: float,
+    ) -> float:
+        """Return the seconds until a request of `tokens` tokens would be admitted, without consuming."""
+        with self._lock:
+            return self._wait_time(tokens, now)
+
+
+class RateLimiterRegistry:
+    """Thread- and asyncio-safe per-model token buckets that keep requests under the catalog limits.
+
+    Limiters are created on first use from each model's `rpm`, `tpm` and `rpd` fields. Models
+    without any limit are remembered as unlimited and never take a lock, and limited models only
+    contend on their own lock, so an acquire costs a few microseconds even with many threads.
+    Walk a fallback list with `filter(...)` or `first_available(...)` to skip saturated models
+    instead of sending requests that would come back as 429s.
+
+    Args:
+        model_specs: Model name -> spec holding the `rpm`/`tpm`/`rpd` limits, e.g. `get_litellm_models()`.
+        clock: Monotonic time source of the buckets and of `acquire` timeouts, overridable for tests.
+        sleep: Blocking sleep used by `acquire`, overridable together with `clock` in tests.
+    """
+
+    def __init__(
+        self,
+        model_specs: Mapping[str, LiteLLMBaseModelSpec | Mapping[str, Any]],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.model_specs: Mapping[str, LiteLLMBaseModelSpec | Mapping[str, Any]] = model_specs
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], None] = sleep
+        # None marks a model without limits.
+        self._limiters: dict[str, ModelRateLimiter | None] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: LiteLLMYAMLConfig,
+        **kwargs: Any,
+    ) -> RateLimiterRegistry:
+        """Build a registry from the `litellm_params` of a generated config's `model_list`."""
+        return cls(
+            {
+                entry["model_name"]: entry.get("litellm_params", {})  # pyright: ignore[reportAttributeAccessIssue]
+                for entry in config["model_list"]
+            },
+            **kwargs,
+        )
+
+    def limiter(
+        self,
+        model: str,
+    ) -> ModelRateLimiter | None:
+        """Return the limiter of `model`, or None when the catalog sets no limit for it."""
+        try:
+            return self._limiters[model]
+        except KeyError:
+            pass
+        with self._lock:
+            if model not in self._limiters:
+                spec = self.model_specs.get(model) or {}
+                limits = {
+                    key: value
+                    for key in RATE_LIMIT_PERIODS
+                    if isinstance(value := spec.get(key), (int, float)) and value > 0
+                }
+                self._limiters[model] = ModelRateLimiter(model, limits, self.clock()) if limits else None
+            return self._limiters[model]
+
+    def _try_acquire(
+        self,
+        model: str,
+        tokens: float,
+    ) -> float:
+        limiter = self.limiter(model)
+        return 0.0 if limiter is None else limiter.try_acquire(tokens, self.clock())
+
+    def _check_fits(
+        self,
+        model: str,
+        wait: float,
+        tokens: float,
+    ):
+        if wait == math.inf:
+            raise ValueError(f"A request of {tokens} tokens can never fit the rate limits of {model}")
+
+    def try_acquire(
+        self,
+        model: str,
+        tokens: float = 0,
+    ) -> bool:
+        """Admit a request of `tokens` tokens to `model` if its limits allow it right now, without waiting."""
+        return self._try_acquire(model, tokens) <= 0.0
+
+    def acquire(
+        self,
+        model: str,
+        tokens: float = 0,
+        timeout: float | None = None,
+    ) -> bool:
+        """Block until a request of `tokens` tokens to `model` is admitted.
+
+        Args:
+            model: The model to send the request to.
+            tokens: Prompt plus expected completion tokens, counted against `tpm`.
+            timeout: Maximum seconds to wait; None waits as long as needed.
+
+        Returns:
+            True once admitted, False if `timeout` expired first.
+
+        Raises:
+            ValueError: If `tokens` exceeds the model's `tpm` limit, so the request can never be admitted.
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        while (wait := self._try_acquire(model, tokens)) > 0.0:
+            self._check_fits(model, wait, tokens)
+            if deadline is not None:
+                remaining = deadline - self.clock()
+                if remaining < wait:
+                    return False
+            self.sleep(wait)
+        return True
+
+    async def aacquire(
+        self,
+        model: str,
+        tokens: float = 0,
+        timeout: float | None = None,
+    ) -> bool:
+        """Async variant of `acquire` that waits with `asyncio.sleep` instead of blocking the loop."""
+        deadline = None if timeout is None else self.clock() + timeout
+        while (wait := self._try_acquire(model, tokens)) > 0.0:
+            self._check_fits(model, wait, tokens)
+            if deadline is not None and deadline - self.clock() < wait:
+                return False
+            await asyncio.sleep(wait)
+        return True
+
+    def is_saturated(
+        self,
+        model: str,
+        tokens: float = 0,
+    ) -> bool:
+        """Return whether a request of `tokens` tokens to `model` would be rejected right now."""
+        limiter = self.limiter(model)
+        return limiter is not None and limiter.wait_time(tokens, self.clock()) > 0.0
+
+    def filter(
+        self,
+        models: Iterable[str],
+        tokens: float = 0,
+    ) -> Iterator[str]:
+        """Lazily yield the models of a fallback list that can take a request of `tokens` tokens right now."""
+        return (model for model in models if not self.is_saturated(model, tokens))
+
+    def first_available(
+        self,
+        models: Sequence[str],
+        tokens: float = 0,
+    ) -> str | None:
+        """Admit the request to the first model of a fallback list with capacity left and return it.
+
+        Returns None, without consuming anything, when every model is saturated.
+        """
+        for model in models:
+            if self._try_acquire(model, tokens) <= 0.0:
+                return model
+        return None
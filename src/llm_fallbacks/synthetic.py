@@ -0,0 +1,292 @@
+"""Seeded synthetic model catalogs, for testing and benchmarking at sizes the real price map never reaches."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Mapping
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from llm_fallbacks.config import LiteLLMBaseModelSpec
+
+
+# Catalog sizes the benchmarks and memory reports run against.
+SCALES: dict[str, int] = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+FAMILIES: tuple[str, ...] = (
+    "llama", "mistral", "qwen", "gemma", "gpt", "claude", "command", "phi", "deepseek", "yi", "granite", "jamba"
+)  # fmt: skip
+SIZES: tuple[str, ...] = ("1b", "3b", "7b", "8b", "13b", "34b", "70b", "405b", "mini", "pro", "flash", "large")
+# Fields a generated spec may lack, each independently with probability `missing_field_rate`.
+OPTIONAL_FIELDS: tuple[str, ...] = ("max_input_tokens", "max_output_tokens", "max_tokens", "output_cost_per_token")
+
+
+@dataclass(frozen=True)
+class PricingTier:
+    """A share of the models, with input prices drawn log-uniformly from [low, high] per token.
+
+    Output prices are the input price times a ratio drawn uniformly from `output_ratio`.
+    """
+
+    weight: float
+    low: float = 0.0
+    high: float = 0.0
+    output_ratio: tuple[float, float] = (1.0, 5.0)
+
+
+@dataclass(frozen=True)
+class CatalogDistribution:
+    """The distributions a synthetic catalog is drawn from; weights need not sum to one.
+
+    Args:
+        providers: Provider -> weight.
+        modes: Mode -> weight.
+        capabilities: Capability flag -> probability that a chat model sets it.
+        pricing_tiers: Tier name -> tier.
+        context_windows: Context window in tokens -> weight.
+        provider_prefix_rate: Probability that a name starts with "<provider>/", as most LiteLLM keys do.
+        missing_field_rate: Probability that each of `OPTIONAL_FIELDS` is left out of a spec.
+        duplicate_rate: Probability that a model reuses an earlier model's name. Half of these
+            re-list the same model under another provider, the other half repeat the earlier key
+            in different case, which `get_litellm_models` folds into one entry.
+        rate_limit_rate: Probability that a spec carries `rpm` and `tpm` limits.
+    """
+
+    providers: Mapping[str, float] = field(
+        default_factory=lambda: {
+            "openrouter": 0.2,
+            "bedrock": 0.12,
+            "vertex_ai": 0.08,
+            "azure": 0.08,
+            "openai": 0.08,
+            "together_ai": 0.08,
+            "fireworks_ai": 0.07,
+            "gemini": 0.06,
+            "deepinfra": 0.06,
+            "anthropic": 0.05,
+            "groq": 0.04,
+            "mistral": 0.04,
+            "ollama": 0.04,
+        }
+    )
+    modes: Mapping[str, float] = field(
+        default_factory=lambda: {
+            "chat": 0.7,
+            "embedding": 0.1,
+            "image_generation": 0.05,
+            "rerank": 0.04,
+            "completion": 0.04,
+            "audio_transcription": 0.03,
+            "audio_speech": 0.02,
+            "moderation": 0.02,
+        }
+    )
+    capabilities: Mapping[str, float] = field(
+        default_factory=lambda: {
+            "supports_system_messages": 0.6,
+            "supports_function_calling": 0.55,
+            "supports_tool_choice": 0.4,
+            "supports_vision": 0.3,
+            "supports_parallel_function_calling": 0.3,
+            "supports_response_schema": 0.25,
+            "supports_prompt_caching": 0.1,
+            "supports_pdf_input": 0.08,
+            "supports_audio_input": 0.05,
+            "supports_audio_output": 0.03,
+        }
+    )
+    pricing_tiers: Mapping[str, PricingTier] = field(
+        default_factory=lambda: {
+            "free": PricingTier(0.12),
+            "budget": PricingTier(0.38, 1e-08, 5e-07),
+            "standard": PricingTier(0.35, 5e-07, 5e-06),
+            "premium": PricingTier(0.15, 5e-06, 7.5e-05),
+        }
+    )
+    context_windows: Mapping[int, float] = field(
+        default_factory=lambda: {
+            4_096: 0.05,
+            8_192: 0.1,
+            32_768: 0.2,
+            128_000: 0.4,
+            200_000: 0.15,
+            1_048_576: 0.1,
+        }
+    )
+    provider_prefix_rate: float = 0.8
+    missing_field_rate: float = 0.1
+    duplicate_rate: float = 0.05
+    rate_limit_rate: float = 0.1
+
+
+def _choice(
+    rng: np.random.Generator,
+    weights: Mapping[Any, float],
+    size: int,
+) -> tuple[list[Any], np.ndarray]:
+    """Draw `size` indices into the keys of `weights`, with probabilities proportional to the weights."""
+    keys = list(weights)
+    p = np.array([weights[key] for key in keys], dtype=float)
+    if len(keys) == 0 or p.sum() <= 0:
+        raise ValueError("Distribution weights must be non-empty and sum to more than zero")
+    return keys, rng.choice(len(keys), size=size, p=p / p.sum())
+
+
+def generate_price_map(
+    n: int,
+    *,
+    seed: int = 0,
+    distribution: CatalogDistribution | None = None,
+) -> dict[str, LiteLLMBaseModelSpec]:
+    """Generate a price map of `n` entries in LiteLLM's `model_prices_and_context_window.json` format.
+
+    The same `n`, `seed` and `distribution` always give the same map. Install it with
+    `core.refresh_litellm_models(price_map)`.
+
+    Args:
+        n: Number of entries.
+        seed: Random seed.
+        distribution: What to draw the models from; `CatalogDistribution()` by default.
+    """
+    if n < 0:
+        raise ValueError(f"n must not be negative, got {n}")
+    distribution = CatalogDistribution() if distribution is None else distribution
+    rng = np.random.default_rng(seed)
+
+    # Draw every random quantity as one array, so the per-model loop only assembles dicts.
+    providers, provider_idx = _choice(rng, distribution.providers, n)
+    modes, mode_idx = _choice(rng, distribution.modes, n)
+    tiers, tier_idx = _choice(rng, {name: tier.weight for name, tier in distribution.pricing_tiers.items()}, n)
+    windows, window_idx = _choice(rng, distribution.context_windows, n)
+    tier_low = np.array([distribution.pricing_tiers[t].low for t in tiers])[tier_idx]
+    tier_high = np.array([distribution.pricing_tiers[t].high for t in tiers])[tier_idx]
+    ratio_low = np.array([distribution.pricing_tiers[t].output_ratio[0] for t in tiers])[tier_idx]
+    ratio_high = np.array([distribution.pricing_tiers[t].output_ratio[1] for t in tiers])[tier_idx]
+    priced = tier_high > 0
+    log_low = np.log(np.where(priced, np.maximum(tier_low, 1e-12), 1.0))
+    log_high = np.log(np.where(priced, tier_high, 1.0))
+    input_cost = np.where(priced, np.exp(rng.uniform(log_low, log_high)), 0.0)
+    output_cost = input_cost * rng.uniform(ratio_low, ratio_high)
+    max_output = np.minimum(np.array(windows)[window_idx], rng.choice([4_096, 8_192, 16_384, 65_536], size=n))
+    family_idx = rng.integers(len(FAMILIES), size=n)
+    size_idx = rng.integers(len(SIZES), size=n)
+    prefixed = rng.random(n) < distribution.provider_prefix_rate
+    missing = rng.random((n, len(OPTIONAL_FIELDS))) < distribution.missing_field_rate
+    flags = list(distribution.capabilities)
+    flag_values = rng.random((n, len(flags))) < np.array([distribution.capabilities[f] for f in flags])
+    duplicate = (rng.random(n) < distribution.duplicate_rate) & (np.arange(n) > 0)
+    duplicate_of = (rng.random(n) * np.arange(n)).astype(np.int64)
+    case_variant = rng.random(n) < 0.5
+    limited = rng.random(n) < distribution.rate_limit_rate
+    rpm = rng.choice([20, 60, 500, 3_000, 10_000], size=n)
+
+    # Capability and missing-field draws become bitmasks, so each row looks its combination up once.
+    flag_masks = (flag_values.astype(np.int64) << np.arange(len(flags))).sum(axis=1).tolist()
+    flag_sets: dict[int, dict[str, bool]] = {}
+    missing_masks = (missing.astype(np.int64) << np.arange(len(OPTIONAL_FIELDS))).sum(axis=1).tolist()
+    missing_sets = {
+        mask: [f for bit, f in enumerate(OPTIONAL_FIELDS) if mask >> bit & 1] for mask in set(missing_masks)
+    }
+    provider_names = [providers[k] for k in provider_idx.tolist()]
+    mode_names = [modes[k] for k in mode_idx.tolist()]
+    window_sizes = [int(windows[k]) for k in window_idx.tolist()]
+    input_cost_list, output_cost_list, max_output_list = input_cost.tolist(), output_cost.tolist(), max_output.tolist()
+    family_list, size_list, prefixed_list = family_idx.tolist(), size_idx.tolist(), prefixed.tolist()
+    duplicate_list, duplicate_of_list = duplicate.tolist(), duplicate_of.tolist()
+    case_variant_list = case_variant.tolist()
+    limited_list, rpm_list = limited.tolist(), rpm.tolist()
+
+    price_map: dict[str, LiteLLMBaseModelSpec] = {}
+    base_names: list[str] = []
+    keys: list[str] = []
+    for i in range(n):
+        provider = provider_names[i]
+        if duplicate_list[i]:
+            j = duplicate_of_list[i]
+            base_name = base_names[j]
+            key = keys[j].upper() if case_variant_list[i] else f"{provider}/{base_name}"
+        else:
+            base_name = f"{FAMILIES[family_list[i]]}-{SIZES[size_list[i]]}-{i:x}"
+            key = f"{provider}/{base_name}" if prefixed_list[i] else base_name
+        while key in price_map:  # a duplicate that happens to repeat the exact key
+            key = f"{provider}/{key}"
+        base_names.append(base_name)
+        keys.append(key)
+
+        mode = mode_names[i]
+        spec: dict[str, Any] = {
+            "litellm_provider": provider,
+            "mode": mode,
+            "input_cost_per_token": input_cost_list[i],
+            "output_cost_per_token": output_cost_list[i],
+            "max_input_tokens": window_sizes[i],
+            "max_output_tokens": max_output_list[i],
+            "max_tokens": max_output_list[i],
+        }
+        if missing_masks[i]:
+            for field_name in missing_sets[missing_masks[i]]:
+                del spec[field_name]
+        if mode == "chat" and flag_masks[i]:
+            mask = flag_masks[i]
+            if mask not in flag_sets:
+                flag_sets[mask] = {f: True for bit, f in enumerate(flags) if mask >> bit & 1}
+            spec.update(flag_sets[mask])
+        if limited_list[i]:
+            spec["rpm"] = rpm_list[i]
+            spec["tpm"] = rpm_list[i] * 1_000
+        price_map[key] = spec  # type: ignore[assignment]
+    return price_map
+
+
+def openrouter_models_payload(
+    price_map: Mapping[str, LiteLLMBaseModelSpec],
+) -> dict[str, Any]:
+    """Render price map entries as an OpenRouter `/models` response.
+
+    The result is the input of `_parse_openrouter_models_response`.
+    """
+    data = []
+    for name, spec in price_map.items():
+        model_id = name.split("/", 1)[1] if spec.get("litellm_provider") and "/" in name else name
+        data.append(
+            {
+                "id": model_id,
+                "description": "",
+                "pricing": {
+                    "prompt": str(spec.get("input_cost_per_token", 0)),
+                    "completion": str(spec.get("output_cost_per_token", 0)),
+                    "image": "0",
+                    "request": "0",
+                },
+                "architecture": {
+                    "modality": "text+image->text" if spec.get("supports_vision") else "text->text",
+                    "instruct_type": "Function" if spec.get("supports_function_calling") else None,
+                },
+                "top_provider": {
+                    "context_length": spec.get("max_input_tokens"),
+                    "max_completion_tokens": spec.get("max_output_tokens"),
+                },
+            }
+        )
+    return {"data": data}
+
+
+def generate_openrouter_models(
+    n: int,
+    *,
+    seed: int = 0,
+    distribution: CatalogDistribution | None = None,
+) -> dict[str, Any]:
+    """Generate an OpenRouter `/models` response listing `n` synthetic chat models.
+
+    Args:
+        n: Number of models.
+        seed: Random seed.
+        distribution: What to draw the models from; its modes are replaced by chat only.
+    """
+    distribution = CatalogDistribution() if distribution is None else distribution
+    chat_only = CatalogDistribution(
+        **{**distribution.__dict__, "providers": {"openrouter": 1.0}, "modes": {"chat": 1.0}, "duplicate_rate": 0.0}
+    )
+    return openrouter_models_payload(generate_price_map(n, seed=seed, distribution=chat_only))
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+
+from pathlib import Path
+
+import pytest
+
+
+SUITE_PATH = Path(__file__).parents[2] / "benchmarks" / "suite.py"
+
+
+@pytest.fixture(scope="module")
+def suite():
+    if not SUITE_PATH.is_file():
+        pytest.skip("benchmarks are not shipped with this checkout")
+    spec = importlib.util.spec_from_file_location("benchmark_suite", SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses look their module up while being created
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compare_flags_regressions_improvements_and_changed_cases(suite):
+    """Test the statuses assigned when comparing fastest batches against a baseline."""
+    baseline = {"same": {"min_ms": 10.0}, "slower": {"min_ms": 10.0}, "faster": {"min_ms": 10.0}, "gone": {"min_ms": 1.0}}
+    results = {
+        "same": suite.Timing(min_ms=11.0, median_ms=12.0, number=1, repeat=3),
+        "slower": suite.Timing(min_ms=13.0, median_ms=13.0, number=1, repeat=3),
+        "faster": suite.Timing(min_ms=7.0, median_ms=7.0, number=1, repeat=3),
+        "added": suite.Timing(min_ms=1.0, median_ms=1.0, number=1, repeat=3),
+    }
+    statuses = {c.case: c.status for c in suite.compare(results, baseline, threshold=0.25)}
+    assert statuses == {"same": "ok", "slower": "regression", "faster": "improvement", "added": "new", "gone": "missing"}
+
+
+def test_pinned_fixtures_match_their_manifest(suite):
+    """Test that the committed fixtures load and have the sizes recorded when they were generated."""
+    manifest = json.loads((suite.FIXTURES_DIR / "manifest.json").read_text())
+    assert len(suite.load_fixture("price_map_small.json.gz")) == manifest["price_map_small"]
+    assert len(suite.load_fixture("openrouter_models.json.gz")["data"]) == manifest["openrouter_models"]
+    timing = suite.time_case(lambda: None, repeat=2)
+    assert timing.number >= 1 and timing.min_ms <= timing.median_ms
+
+
+def test_every_case_runs_on_the_small_catalog(suite, monkeypatch: pytest.MonkeyPatch):
+    """Smoke-test the suite: build the cases against the small pinned catalog and call each one once."""
+    from llm_fallbacks import core
+
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    monkeypatch.setenv("LLM_FALLBACKS_OFFLINE", "True")
+    try:
+        price_map = suite.install_catalog("small")
+        cases = suite.build_cases("small")
+        assert cases
+        for name, case in cases.items():
+            assert case() is not None, name
+        assert len(core.get_litellm_models()) <= len(price_map)
+    finally:
+        core.refresh_litellm_models()
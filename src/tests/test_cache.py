@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from llm_fallbacks import core
+from llm_fallbacks.cache import ResultCache, cached_filter_models, cached_models, lru_ttl_cache
+from llm_fallbacks.filter_litellm import filter_models
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_ttl_and_counters():
+    """Test LRU eviction, TTL expiry and the hit/miss/eviction counters."""
+    clock = _Clock()
+    cache = ResultCache(maxsize=2, ttl=10, clock=clock)
+    assert cache.get_or_compute("a", lambda: [1, 2]) == (1, 2)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 0)  # hit, "b" becomes least recently used
+    cache.get_or_compute("c", lambda: 3)
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+    clock.now = 11
+    assert cache.get_or_compute("c", lambda: "expired") == "expired"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (1, 5, 2, 1)
+
+
+def test_normalized_keys_frozen_results_and_refresh():
+    """Test that equivalent calls share one entry, results are immutable and refresh invalidates."""
+    calls = []
+
+    @lru_ttl_cache(maxsize=8)
+    def query(model_type: str = "chat", *, free_only: bool = False) -> list[str]:
+        calls.append(model_type)
+        return [model_type]
+
+    assert query() == query("chat") == query(model_type="chat", free_only=False) == ("chat",)
+    assert calls == ["chat"]
+    assert query.cache_stats().hits == 2
+
+    core.refresh_litellm_models()
+    query("chat")
+    assert calls == ["chat", "chat"]
+    assert query.cache_stats().invalidations == 1
+
+
+def test_cached_wrappers_match_uncached_results():
+    """Test the filter_models and get_*_models wrappers."""
+    assert cached_filter_models("chat", free_only=True) == tuple(filter_models("chat", free_only=True))
+    specs = cached_models("embedding")
+    name = next(iter(specs))
+    with pytest.raises(TypeError):
+        specs[name]["mode"] = "chat"  # type: ignore[index]
+    with pytest.raises(ValueError, match="Unknown model type"):
+        cached_models("nope")
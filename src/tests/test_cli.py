@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from llm_fallbacks.cli import main
+from llm_fallbacks.core import get_fallback_list
+from llm_fallbacks.cost_evaluator import Usage, cost_of
+
+
+def _jsonl(
+    text: str,
+) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_query_matches_filter_models(capsys: pytest.CaptureFixture[str]):
+    """Test that `query` streams the same models, in the same order, as `filter_models`."""
+    from llm_fallbacks.filter_litellm import filter_models
+
+    main(["query", "--type", "chat", "--vision", "--max-cost-per-token", "1e-06", "--fields", "mode"])
+    rows = _jsonl(capsys.readouterr().out)
+    assert [row["model"] for row in rows] == filter_models("chat", supports_vision=True, max_cost_per_token=1e-06)
+    assert list(rows[0]) == ["rank", "model", "mode"]
+
+
+def test_fallbacks_as_csv(capsys: pytest.CaptureFixture[str]):
+    """Test the CSV header and the limited fallback list."""
+    main(["fallbacks", "embedding", "--limit", "3", "--format", "csv", "--fields", "litellm_provider"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "rank,model,litellm_provider"
+    assert [line.split(",")[1] for line in lines[1:]] == get_fallback_list("embedding")[:3]
+
+
+def test_cost_prices_each_model_and_rejects_unknown_ones(capsys: pytest.CaptureFixture[str]):
+    """Test `cost` against the model's own pricing, and the error for an unknown model."""
+    main(["cost", "gpt-4o", "--input-tokens", "1000", "--output-tokens", "100"])
+    (row,) = _jsonl(capsys.readouterr().out)
+    assert row["model"] == "gpt-4o"
+    assert row["cost_usd"] == pytest.approx(cost_of("gpt-4o", Usage(input_tokens=1000, output_tokens=100)))
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["cost", "no-such-model"])
+    assert exc_info.value.code == 1
+
+
+def test_headless_commands_skip_gui_and_provider_imports():
+    """Test that headless commands import neither tkinter, pandas, numpy, the provider configs nor litellm."""
+    code = (
+        "import sys\n"
+        "from llm_fallbacks.cli import main\n"
+        "main(['--offline', 'fallbacks', 'chat', '--limit', '1'])\n"
+        "main(['--offline', 'query', '--type', 'chat', '--free-only', '--limit', '1'])\n"
+        "heavy = {'tkinter', 'pandas', 'numpy', 'llm_fallbacks.config', 'llm_fallbacks.gui', 'litellm'}\n"
+        "heavy &= set(sys.modules)\n"
+        "assert not heavy, heavy\n"
+    )
+    # Hand the session's import path down, so the child finds the package even when it is not installed.
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60, env=env)
+    assert result.returncode == 0, result.stderr
+    assert [json.loads(line)["rank"] for line in result.stdout.splitlines()] == [1, 1]
+
+
+def test_main_module_reexports_the_gui_entry_points():
+    """Test that `llm_fallbacks.__main__` still exposes the GUI names it exported before the CLI."""
+    from llm_fallbacks import __main__, gui
+
+    assert __main__.filter_model_specs is gui.filter_model_specs
+    assert __main__.ModelSpecsApp is gui.ModelSpecsApp
+
+
+def test_command_environment_overrides_are_restored(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that --offline and --price-map-source only apply while their command runs."""
+    monkeypatch.delenv("LLM_FALLBACKS_OFFLINE", raising=False)
+    monkeypatch.setenv("LLM_FALLBACKS_PRICE_MAP_SOURCE", "auto")
+    main(["--offline", "--price-map-source", "litellm", "fallbacks", "chat", "--limit", "1"])
+    assert _jsonl(capsys.readouterr().out)[0]["rank"] == 1
+    assert "LLM_FALLBACKS_OFFLINE" not in os.environ
+    assert os.environ["LLM_FALLBACKS_PRICE_MAP_SOURCE"] == "auto"
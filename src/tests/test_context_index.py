@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from llm_fallbacks.config import CustomProviderConfig
+from llm_fallbacks.context_index import ContextWindowIndex
+from llm_fallbacks.generate_configs import to_litellm_config_yaml
+
+
+MODELS = {
+    "small-cheap": {"mode": "chat", "max_input_tokens": 8192, "input_cost_per_token": 1e-07},
+    "large-pricey": {"mode": "chat", "max_input_tokens": 200_000, "input_cost_per_token": 1e-05},
+    "large-vision": {
+        "mode": "chat",
+        "max_tokens": 128_000,
+        "input_cost_per_token": 2e-06,
+        "supports_vision": True,
+    },
+    "embedder": {"mode": "embedding", "max_input_tokens": 8192, "input_cost_per_token": 1e-08},
+    "unknown-window": {"mode": "chat", "input_cost_per_token": 0.0},
+}
+
+
+def test_models_fitting_is_cost_ranked_and_filtered():
+    """Test window thresholds, the max_tokens fallback, mode and capability filters."""
+    index = ContextWindowIndex(MODELS)
+    assert index.models_fitting(1000, mode="chat") == ("small-cheap", "large-vision", "large-pricey")
+    assert index.models_fitting(8192, mode="chat") == ("small-cheap", "large-vision", "large-pricey")
+    assert index.models_fitting(8193, mode="chat") == ("large-vision", "large-pricey")
+    assert index.models_fitting(1000, mode="chat", limit=2) == ("small-cheap", "large-vision")
+    assert index.models_fitting(150_000) == ("large-pricey",)
+    assert index.models_fitting(1000, require=["supports_vision"]) == ("large-vision",)
+    assert index.models_fitting(10**7) == ()
+
+
+def test_generated_config_has_context_window_fallbacks():
+    """Test that to_litellm_config_yaml lists larger-window deployments of the same mode, by default."""
+    provider = CustomProviderConfig(
+        provider_name="acme",
+        base_url="https://api.acme.test/v1",
+        raw_models={
+            **{name: spec for name, spec in MODELS.items() if name != "large-vision"},
+            "modeless": {"max_input_tokens": 4096, "input_cost_per_token": 1e-09},
+        },
+        auto_fetch_models=False,
+    )
+    config = to_litellm_config_yaml([provider])
+    assert config["litellm_settings"]["context_window_fallbacks"] == [{"acme/small-cheap": ["acme/large-pricey"]}]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from llm_fallbacks.cost_estimator import CostEstimator, Workload
+
+
+MODELS = {
+    "tiered": {
+        "input_cost_per_token": 1e-06,
+        "output_cost_per_token": 4e-06,
+        "input_cost_per_token_above_128k_tokens": 2e-06,
+        "output_cost_per_token_above_128k_tokens": 8e-06,
+        "cache_read_input_token_cost": 1e-07,
+    },
+    "flat": {"input_cost_per_token": 1.5e-06, "output_cost_per_token": 3e-06, "input_cost_per_image": 0.01},
+    "per-char": {"input_cost_per_character": 5e-07, "output_cost_per_character": 5e-07},
+    "unpriced": {"mode": "chat"},
+}
+
+
+def test_cost_matrix_applies_tier_cache_and_images():
+    """Test exact per-request costs, including the whole-request above-128k tier and cache reads."""
+    workload = Workload.from_arrays(
+        input_tokens=[1000, 200_000, 1000],
+        output_tokens=[500, 500, 0],
+        cache_hit_ratio=[0.5, 0.0, 0.0],
+        images=[0, 0, 2],
+    )
+    estimator = CostEstimator(MODELS)
+    assert estimator.model_names == ["tiered", "flat", "per-char"]
+    costs = estimator.cost_matrix(workload)
+    np.testing.assert_allclose(
+        costs,
+        [
+            [500 * 1e-06 + 500 * 1e-07 + 500 * 4e-06, 1000 * 1.5e-06 + 500 * 3e-06, 1500 * 2e-06],
+            [200_000 * 2e-06 + 500 * 8e-06, 200_000 * 1.5e-06 + 500 * 3e-06, 200_500 * 2e-06],
+            [1000 * 1e-06, 1000 * 1.5e-06 + 2 * 0.01, 1000 * 2e-06],
+        ],
+    )
+    np.testing.assert_allclose(estimator.total_costs(workload, chunk_size=2), costs.sum(axis=0))
+
+
+def test_cheapest_matches_argmin_across_chunks():
+    """Test that chunked cheapest-model selection agrees with the full matrix."""
+    rng = np.random.default_rng(0)
+    workload = Workload.from_arrays(
+        input_tokens=rng.integers(1, 300_000, 1000),
+        output_tokens=rng.integers(0, 4000, 1000),
+        cache_hit_ratio=rng.random(1000),
+    )
+    estimator = CostEstimator(MODELS)
+    indices, costs = estimator.cheapest(workload, chunk_size=97)
+    full = estimator.cost_matrix(workload)
+    np.testing.assert_array_equal(indices, full.argmin(axis=1))
+    np.testing.assert_allclose(costs, full.min(axis=1))
+    assert estimator.cheapest_models(Workload.from_arrays([10], [0], 1.0)) == ["tiered"]
+
+    with pytest.raises(ValueError, match="cache_hit_ratio"):
+        Workload.from_arrays([10], [10], cache_hit_ratio=2.0)
+
+
+def test_no_priced_models():
+    """Test that a catalog without pricing builds an empty estimator that refuses to pick a model."""
+    estimator = CostEstimator({"unpriced": {"mode": "chat"}})
+    workload = Workload.from_arrays([10, 20], [5, 5], 0.0)
+    assert estimator.model_names == []
+    assert estimator.cost_matrix(workload).shape == (2, 0)
+    np.testing.assert_array_equal(estimator.total_costs(workload), np.zeros(0))
+    with pytest.raises(ValueError, match="no priced models"):
+        estimator.cheapest(workload)
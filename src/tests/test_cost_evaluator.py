@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from llm_fallbacks import core
+from llm_fallbacks.cost_evaluator import Usage, catalog_evaluators, compile_pricing, cost_of, cost_of_batch
+
+
+def _reference_cost(spec: dict, usage: Usage) -> float:
+    """Price a call by probing the spec directly, the way a gateway would without compiled evaluators."""
+
+    def price(key: str, multiplier: float = 1.0) -> float | None:
+        value = spec.get(key)
+        return value * multiplier if isinstance(value, (int, float)) and value >= 0 else None
+
+    def first(*prices: float | None) -> float:
+        return next((p for p in prices if p is not None), 0.0)
+
+    above = usage.input_tokens > 128_000
+    tier = "_above_128k_tokens" if above else ""
+    input_price = first(
+        price(f"input_cost_per_token{tier}") if above else None,
+        price(f"input_cost_per_character{tier}", 4.0) if above else None,
+        price("input_cost_per_token"),
+        price("input_cost_per_character", 4.0),
+    )
+    output_price = first(
+        price(f"output_cost_per_token{tier}") if above else None,
+        price(f"output_cost_per_character{tier}", 4.0) if above else None,
+        price("output_cost_per_token"),
+        price("output_cost_per_character", 4.0),
+    )
+    cached_price = first(price("cache_read_input_token_cost"), price("input_cost_per_token_cache_hit"), input_price)
+    image_price = first(price(f"input_cost_per_image{tier}") if above else None, price("input_cost_per_image"))
+    audio_price = first(
+        price(f"input_cost_per_audio_per_second{tier}") if above else None, price("input_cost_per_audio_per_second")
+    )
+    return (
+        (usage.input_tokens - usage.cached_input_tokens) * input_price
+        + usage.cached_input_tokens * cached_price
+        + usage.output_tokens * output_price
+        + usage.images * image_price
+        + usage.audio_seconds * audio_price
+        + first(price("input_cost_per_request"), price("input_cost_per_query"))
+    )
+
+
+def test_catalog_evaluators_agree_with_reference():
+    """Test every priced catalog model against the reference on random usages, both pricing tiers included."""
+    rng = random.Random(0)
+    models = core.get_litellm_models()
+    evaluators = catalog_evaluators()
+    assert evaluators
+    for name, evaluator in evaluators.items():
+        input_tokens = rng.choice((rng.randint(0, 128_000), rng.randint(128_001, 1_000_000)))
+        usage = Usage(
+            input_tokens=input_tokens,
+            output_tokens=rng.randint(0, 8000),
+            cached_input_tokens=rng.randint(0, input_tokens),
+            images=rng.randint(0, 3),
+            audio_seconds=rng.random() * 60,
+        )
+        assert evaluator(usage) == pytest.approx(_reference_cost(models[name], usage), rel=1e-12), name
+
+
+def test_cost_of_batch_and_custom_evaluators():
+    """Test the batched variant, OpenAI usage parsing and unpriced models."""
+    evaluators = compile_pricing(
+        {"m": {"input_cost_per_token": 1e-06, "output_cost_per_token": 2e-06}, "free-form": {"mode": "chat"}}
+    )
+    assert list(evaluators) == ["m"]
+    usage = Usage.from_openai(
+        {"prompt_tokens": 100, "completion_tokens": 10, "prompt_tokens_details": {"cached_tokens": 40}}
+    )
+    assert usage == Usage(input_tokens=100, output_tokens=10, cached_input_tokens=40)
+    assert cost_of("m", usage, evaluators) == pytest.approx(120e-06)
+    assert cost_of_batch("m", [usage, Usage(output_tokens=1)], evaluators) == pytest.approx([120e-06, 2e-06])
+    with pytest.raises(ValueError, match="No pricing known"):
+        cost_of("free-form", usage, evaluators)
+
+
+def test_refresh_recompiles_evaluators():
+    """Test that refreshing the catalog bumps its version and rebuilds the compiled evaluators."""
+    compiled = catalog_evaluators()
+    assert catalog_evaluators() is compiled
+    version = core.get_catalog_version()
+    core.refresh_litellm_models()
+    assert core.get_catalog_version() == version + 1
+    assert catalog_evaluators() is not compiled
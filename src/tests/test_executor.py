@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from llm_fallbacks.executor import FallbackExecutor, FallbackExhaustedError, FallbackTimeoutError
+
+
+class _StubOpenAIHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible `/v1/chat/completions` whose model name picks the behaviour.
+
+    `error-*` models answer 500, `slow-<seconds>-*` models sleep before answering, anything else succeeds.
+    """
+
+    def do_POST(self):
+        body: dict[str, Any] = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        model: str = body["model"]
+        if model.startswith("slow-"):
+            time.sleep(float(model.split("-")[1]))
+        if model.startswith("error-"):
+            self.send_response(500)
+            payload = {"error": {"message": "injected failure", "type": "server_error"}}
+        else:
+            self.send_response(200)
+            payload = {
+                "object": "chat.completion",
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+            }
+        encoded = json.dumps(payload).encode()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args: Any):  # noqa: A002
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOpenAIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+
+
+def _completion(address: tuple[str, int], model: str) -> str:
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    try:
+        connection.request(
+            "POST",
+            "/v1/chat/completions",
+            body=json.dumps({"model": model, "messages": [{"role": "user", "content": "hi"}]}),
+            headers={"Content-Type": "application/json"},
+        )
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+    finally:
+        connection.close()
+    if response.status != 200:
+        raise RuntimeError(payload["error"]["message"])
+    return payload["model"]
+
+
+def test_sequential_failover(stub_server):
+    """Test that failing models are skipped in order until one succeeds."""
+    executor = FallbackExecutor(["error-a", "error-b", "good-c", "good-d"])
+    assert executor.call(lambda model: _completion(stub_server, model)) == "good-c"
+
+
+def test_exhausted_raises_with_every_error(stub_server):
+    """Test that all attempt errors are reported when every model fails."""
+    executor = FallbackExecutor(["error-a", "error-b"])
+    with pytest.raises(FallbackExhaustedError) as excinfo:
+        executor.call(lambda model: _completion(stub_server, model))
+    assert [model for model, _ in excinfo.value.errors] == ["error-a", "error-b"]
+
+
+def test_hedged_call_cuts_tail_latency(stub_server):
+    """Test that a slow first model is hedged by the next one after the hedge delay."""
+    executor = FallbackExecutor(["slow-2-a", "good-b"], hedge_delay=0.1)
+    start = time.monotonic()
+    assert executor.call(lambda model: _completion(stub_server, model)) == "good-b"
+    assert time.monotonic() - start < 1.5
+
+
+def test_failed_hedge_frees_its_slot(stub_server):
+    """Test that a hedge failing next to a slow attempt launches the next model without waiting."""
+    delays = {"slow-2-a": 0.05, "error-b": None}
+    executor = FallbackExecutor(["slow-2-a", "error-b", "good-c"], hedge_delay=delays.get)
+    start = time.monotonic()
+    assert executor.call(lambda model: _completion(stub_server, model)) == "good-c"
+    assert time.monotonic() - start < 1.5
+
+
+def test_deadline(stub_server):
+    """Test that the per-call deadline stops waiting on slow models."""
+    executor = FallbackExecutor(["slow-2-a", "slow-2-b"], deadline=0.2)
+    with pytest.raises(FallbackTimeoutError):
+        executor.call(lambda model: _completion(stub_server, model))
+
+
+def test_async_hedged_call_cancels_loser(stub_server):
+    """Test the async executor: the hedge wins and the slow attempt is cancelled."""
+    cancelled: list[str] = []
+
+    async def completion(model: str) -> str:
+        try:
+            return await asyncio.to_thread(_completion, stub_server, model)
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+
+    async def main() -> str:
+        result = await FallbackExecutor(["slow-1-a", "error-b", "good-c"], hedge_delay=0.05).acall(completion)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == "good-c"
+    assert cancelled == ["slow-1-a"]
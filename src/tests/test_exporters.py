@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+from typing import TYPE_CHECKING
+
+from llm_fallbacks.exporters import dump_models_json, dump_sharded_models_json, format_float
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+MODELS = {
+    "openai/gpt-x": {"mode": "chat", "litellm_provider": "openai", "input_cost_per_token": 1.5e-07},
+    "openai/embed-x": {"mode": "embedding", "litellm_provider": "openai", "input_cost_per_token": 2e-08},
+    "mistral/chat-y": {"mode": "chat", "litellm_provider": "mistral", "input_cost_per_token": 0.0},
+}
+
+
+def test_format_float_is_short_and_exact():
+    """Test that format_float avoids scientific notation and binary noise."""
+    assert format_float(1e-07) == "0.0000001"
+    assert format_float(1.5e-07) == "0.00000015"
+    assert format_float(2.0) == "2.0"
+    for value in (0.1, 3.3e-06, 1e22, 123.456):
+        assert float(format_float(value)) == value
+
+
+def test_dump_models_json_compact_gzip(tmp_path: Path):
+    """Test that the compact gzip catalog round-trips and is smaller than the indented one."""
+    indented = dump_models_json(MODELS, tmp_path / "all_models.json")
+    compressed = dump_models_json(MODELS, tmp_path / "all_models.json", compact=True, compress=True)
+    assert compressed.name == "all_models.json.gz"
+    assert json.loads(gzip.decompress(compressed.read_bytes())) == MODELS
+    assert len(gzip.decompress(compressed.read_bytes())) < len(indented.read_bytes())
+
+
+def test_dump_sharded_models_json(tmp_path: Path):
+    """Test that sharding writes one file per mode and an index pointing at them."""
+    index_path = dump_sharded_models_json(MODELS, tmp_path / "shards", shard_by="mode", compact=True)
+    index = json.loads(index_path.read_text())
+    assert index["shard_by"] == "mode"
+    assert index["shards"]["chat"] == {"path": "chat.json", "count": 2}
+    assert index["models"]["openai/embed-x"] == "embedding"
+    chat_shard = json.loads((index_path.parent / index["shards"]["chat"]["path"]).read_text())
+    assert list(chat_shard) == ["openai/gpt-x", "mistral/chat-y"]
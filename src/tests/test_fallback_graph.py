@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import math
+
+from llm_fallbacks.fallback_graph import FallbackGraph
+
+
+ROUTER_SETTINGS = {
+    "fallbacks": [
+        {"a": ["b", "c"]},
+        {"b": ["c"]},
+        {"c": ["a"]},
+        {"d": ["e", "missing"]},
+    ]
+}
+
+
+def test_cycles_and_unreachable():
+    """Test that cycles, dangling targets and unused deployments are reported."""
+    graph = FallbackGraph.from_router_settings(ROUTER_SETTINGS)
+    report = graph.analyze(deployments=["a", "b", "c", "d", "e", "f"])
+    assert [sorted(cycle) for cycle in report.cycles] == [["a", "b", "c"]]
+    assert report.unreachable == ["missing"]
+    assert report.unused == ["f"]
+    assert report.max_cascade_depth == math.inf
+    assert graph.cascade_depths()["d"] == 1.0
+
+
+def test_hop_stats():
+    """Test expected and worst-case hops from per-model failure rates."""
+    graph = FallbackGraph({"a": ["b", "c"]})
+    stats = graph.hop_stats({"a": 0.5, "b": 0.5, "c": 0.0})["a"]
+    assert stats.worst_case == 2
+    assert stats.expected == 0.5 + 0.25
+    assert stats.success_probability == 1.0
+
+
+def test_prune_to_latency_budget():
+    """Test that fallback lists are cut where the cumulative latency exceeds the budget."""
+    graph = FallbackGraph({"a": ["b", "c", "d"]})
+    pruned = graph.prune_to_latency_budget({"a": 1.0, "b": 2.0, "c": 3.0, "d": 0.5}, budget=6.4)
+    assert pruned.to_router_fallbacks() == [{"a": ["b", "c"]}]
+
+
+def test_large_chain_does_not_recurse():
+    """Test that a 10k-model chain is analyzed without hitting the recursion limit."""
+    chain = {f"m{i}": [f"m{i + 1}"] for i in range(10_000)}
+    depths = FallbackGraph(chain).cascade_depths()
+    assert depths["m0"] == 10_000
+    assert FallbackGraph(chain).cycles() == []
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from llm_fallbacks.config import BaseProviderConfig, CustomProviderConfig
+from llm_fallbacks.generate_configs import rediscover_providers, summarize_model_list, to_litellm_config_yaml
+
+
+def _provider() -> CustomProviderConfig:
+    return CustomProviderConfig(
+        provider_name="acme",
+        base_url="https://api.acme.test/v1",
+        raw_models={
+            "alpha": {"mode": "chat", "input_cost_per_token": 1e-06, "output_cost_per_token": 2e-06},
+            "beta": {"mode": "chat", "input_cost_per_token": 1e-06, "output_cost_per_token": 2e-06},
+            "gamma": {"mode": "chat", "input_cost_per_token": 1e-06, "output_cost_per_token": 2e-06},
+            "premium": {"mode": "chat", "input_cost_per_token": 5e-05, "output_cost_per_token": 1e-04},
+        },
+        auto_fetch_models=False,
+    )
+
+
+def test_collapse_wildcards_keeps_only_overrides():
+    """Test that models sharing every override field collapse into one wildcard deployment."""
+    config = to_litellm_config_yaml([_provider()], collapse_wildcards=True)
+    model_names = [entry["model_name"] for entry in config["model_list"]]
+    assert model_names == ["acme/*", "acme/premium"]
+    wildcard_params = config["model_list"][0]["litellm_params"]
+    assert wildcard_params["model"] == "openai/acme/*"
+    assert wildcard_params["input_cost_per_token"] == 1e-06
+    assert summarize_model_list(config) == {"entries": 2, "wildcard_entries": 1, "explicit_entries": 1}
+
+
+def test_collapse_wildcards_disabled_by_default():
+    """Test that every model keeps its own entry unless collapsing is requested."""
+    config = to_litellm_config_yaml([_provider()])
+    assert summarize_model_list(config) == {"entries": 4, "wildcard_entries": 0, "explicit_entries": 4}
+
+
+def test_collapse_wildcards_keeps_models_with_other_limits_or_capabilities_explicit():
+    """Test that models differing only in context window or supports_* flags are not collapsed."""
+    base = {"mode": "chat", "input_cost_per_token": 1e-06, "output_cost_per_token": 2e-06}
+    provider = CustomProviderConfig(
+        provider_name="acme",
+        base_url="https://api.acme.test/v1",
+        raw_models={
+            "small-a": {**base, "max_input_tokens": 8192},
+            "small-b": {**base, "max_input_tokens": 8192},
+            "long": {**base, "max_input_tokens": 1_000_000},
+            "vision": {**base, "max_input_tokens": 8192, "supports_vision": True},
+        },
+        auto_fetch_models=False,
+    )
+    config = to_litellm_config_yaml([provider], collapse_wildcards=True)
+    entries = {entry["model_name"]: entry["litellm_params"] for entry in config["model_list"]}
+    assert list(entries) == ["acme/*", "acme/long", "acme/vision"]
+    assert entries["acme/*"]["max_input_tokens"] == 8192 and "supports_vision" not in entries["acme/*"]
+    assert entries["acme/long"]["max_input_tokens"] == 1_000_000
+    assert entries["acme/vision"]["supports_vision"] is True
+
+
+def test_rediscover_providers_leaves_the_shared_catalog_alone():
+    """Test that repeating discovery for --profile does not rewrite ALL_KNOWN_MODELS."""
+    provider = CustomProviderConfig(
+        provider_name="rediscover",
+        base_url="https://api.rediscover.test/v1",
+        raw_models={"rediscover/a": {"mode": "chat", "input_cost_per_token": 1e-06}},
+        auto_fetch_models=False,
+    )
+    known = BaseProviderConfig.ALL_KNOWN_MODELS
+    before = dict(known)
+    provider.raw_models = {"rediscover/a": {"mode": "chat", "input_cost_per_token": 9e-06}}
+    (copy,) = rediscover_providers([provider])
+    assert copy.model_specs["rediscover/a"]["input_cost_per_token"] == 9e-06
+    assert BaseProviderConfig.ALL_KNOWN_MODELS is known and known == before
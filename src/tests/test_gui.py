@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from llm_fallbacks import core  # noqa: E402
+from llm_fallbacks.gui import filter_model_specs, get_model_specs_frame  # noqa: E402
+
+
+def test_specs_frame_is_typed_and_cached_per_catalog_version():
+    """Test the row-per-model orientation, the column dtypes and the per-version cache."""
+    df = get_model_specs_frame()
+    assert "gpt-4o" in df.index
+    assert df["input_cost_per_token"].dtype == float
+    assert df["max_input_tokens"].dtype == float
+    assert df["supports_vision"].dtype == "boolean"
+    assert df["mode"].dtype == "category"
+    assert get_model_specs_frame() is df
+    core.refresh_litellm_models()
+    assert get_model_specs_frame() is not df
+
+
+def test_filter_model_specs_runs_on_typed_frame():
+    """Test value, boolean-flag, correlation and variance filters against the cached frame."""
+    cheap = filter_model_specs("value", "input_cost_per_token", comparison="<=", value=1e-07, as_dict=False)
+    assert len(cheap) and (cheap["input_cost_per_token"] <= 1e-07).all()
+    vision = filter_model_specs("value", "supports_vision", comparison="==", value=True)
+    assert vision and all(spec["supports_vision"] for spec in vision.values())
+    correlated = filter_model_specs(
+        "correlation", target_column="input_cost_per_token", correlation_threshold=0.5, as_dict=False
+    )
+    assert "input_cost_per_token" in correlated.columns
+    varying = filter_model_specs("variance", ["max_tokens", "input_cost_per_token"], variance_threshold=1, as_dict=False)
+    assert list(varying.columns) == ["max_tokens"]
+
+
+def test_filter_pipeline_stacks_memoizes_and_undoes():
+    """Test that stages narrow the previous result, undo pops back and re-adding reuses the memo."""
+    from llm_fallbacks.gui import FilterPipeline
+
+    pipeline = FilterPipeline()
+    cheap = pipeline.add("value", "input_cost_per_token", comparison="<=", value=1e-06).result
+    both = pipeline.add("value", "supports_vision", comparison="==", value=True).result
+    assert len(pipeline) == 2
+    assert set(both.index) <= set(cheap.index)
+    assert both["supports_vision"].all()
+
+    assert pipeline.undo() is cheap
+    assert pipeline.add("value", "supports_vision", comparison="==", value=True).result is both
+    assert pipeline.reset() is pipeline.source
+
+
+def test_filter_pipeline_compute_leaves_pipeline_untouched_until_push():
+    """Test the worker-side compute and the main-thread push used by the GUI's background filtering."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from llm_fallbacks.gui import FilterPipeline
+
+    pipeline = FilterPipeline()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        preview = executor.submit(pipeline.compute, "topn", "max_tokens", n=5).result()
+    assert len(pipeline) == 0 and pipeline.result is pipeline.source
+    assert len(preview) == 5
+    assert pipeline.push("topn", "max_tokens", preview, n=5).result is preview
+    assert len(pipeline) == 1
+
+
+def test_sorted_positions_orders_rows_without_the_widget():
+    """Test numeric, index and mixed-type column sorts with missing values last."""
+    import pandas as pd
+
+    from llm_fallbacks.gui import sorted_positions
+
+    df = pd.DataFrame(
+        {"cost": [2.0, None, 1.0], "mixed": ["b", float("nan"), 3]},
+        index=["m-b", "m-c", "m-a"],
+    )
+    assert sorted_positions(df, "cost").tolist() == [2, 0, 1]
+    assert sorted_positions(df, "cost", reverse=True).tolist() == [0, 2, 1]
+    assert sorted_positions(df, "model").tolist() == [2, 0, 1]
+    # Mixed types sort by their string form ("3" < "b"); NaN stays last instead of sorting as "nan".
+    assert sorted_positions(df, "mixed").tolist() == [2, 0, 1]
+    assert sorted_positions(df, "mixed", reverse=True).tolist() == [0, 2, 1]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from llm_fallbacks.generate_configs import to_litellm_config_yaml
+from llm_fallbacks.health import CLOSED, HALF_OPEN, OPEN, HealthRegistry
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_defaults_match_generated_router_settings():
+    """Test that the breaker defaults are the router settings the generated config emits."""
+    router_settings = to_litellm_config_yaml([])["router_settings"]
+    registry = HealthRegistry()
+    assert registry.allowed_fails == router_settings["allowed_fails"]
+    assert registry.allowed_fails_policy == router_settings["allowed_fails_policy"]
+    assert registry.cooldown_time == router_settings["cooldown_time"]
+
+
+def test_breaker_opens_cools_down_and_recovers():
+    """Test the closed -> open -> half-open -> closed cycle and fallback-list filtering."""
+    clock = _Clock()
+    registry = HealthRegistry(allowed_fails=1, cooldown_time=10, provider_allowed_fails=100, clock=clock)
+    fallbacks = ["a/one", "a/two", "b/three"]
+
+    registry.record_failure("a/one", "ServiceUnavailableError")
+    assert registry.state("a/one") == CLOSED
+    registry.record_failure("a/one", "ServiceUnavailableError")
+    assert registry.state("a/one") == OPEN
+    assert list(registry.filter(fallbacks)) == ["a/two", "b/three"]
+
+    clock.now = 11
+    assert registry.first_available(fallbacks) == "a/one"
+    assert registry.state("a/one") == HALF_OPEN
+    # The trial is in flight, so other callers still skip the model.
+    assert registry.first_available(fallbacks) == "a/two"
+    registry.record_success("a/one")
+    assert registry.state("a/one") == CLOSED
+    assert registry.first_available(fallbacks) == "a/one"
+
+
+def test_policy_per_error_type_and_provider_breaker():
+    """Test per-error-type tolerances and that a failing provider is skipped as a whole."""
+    registry = HealthRegistry(allowed_fails=0, allowed_fails_policy={"RateLimitErrorAllowedFails": 2})
+    for _ in range(2):
+        registry.record_failure("a/one", RateLimitError("slow down"))
+    assert registry.is_available("a/one")
+    registry.record_failure("a/one", RateLimitError("slow down"))
+    assert not registry.is_available("a/one")
+
+    registry.record_failure("b/one", "InternalServerError")
+    assert not registry.is_available("b/two")
+    assert registry.is_available("c/one")
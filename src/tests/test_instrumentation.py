@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from llm_fallbacks import core, instrumentation
+from llm_fallbacks.cache import ResultCache
+from llm_fallbacks.filter_litellm import filter_models
+
+
+@pytest.fixture
+def memory_sink():
+    sink = instrumentation.InMemorySink()
+    previous = instrumentation.set_sink(sink)
+    yield sink
+    instrumentation.set_sink(previous)
+
+
+def test_hot_paths_report_spans_and_cache_counters(memory_sink: instrumentation.InMemorySink):
+    """Test that ranking, filtering and cache lookups reach the installed sink."""
+    filter_models("chat", max_cost_per_token=1e-06)
+    core.sort_models_by_cost_and_limits(core.get_chat_models())
+    names = memory_sink.span_names()
+    assert ("filter.query", {"model_type": "chat"}) in [(name, labels) for name, _, labels in memory_sink.spans]
+    assert "ranking.sort" in names
+    assert "catalog.normalize" in names
+    assert all(seconds >= 0 for _, seconds, _ in memory_sink.spans)
+
+    cache = ResultCache(maxsize=1, name="test")
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    assert memory_sink.total("cache.hits", cache="test") == 1
+    assert memory_sink.total("cache.misses", cache="test") == 2
+    assert memory_sink.total("cache.evictions", cache="test") == 1
+
+
+def test_disabled_instrumentation_records_nothing():
+    """Test that no sink means no-op spans and undecorated behaviour."""
+    sink = instrumentation.InMemorySink()
+    previous = instrumentation.set_sink(sink)
+    instrumentation.set_sink(None)
+    try:
+        with instrumentation.span("ignored"):
+            instrumentation.count("ignored")
+        filter_models("embedding")
+        assert sink.spans == [] and sink.counters == {}
+    finally:
+        instrumentation.set_sink(previous)
+
+
+def test_prometheus_render():
+    """Test the text exposition format of counters and span histograms."""
+    sink = instrumentation.PrometheusSink(namespace="app", buckets=(0.1, 1.0))
+    sink.count("cache.hits", 2, {"cache": "q"})
+    sink.count("cache.misses", 1_234_567, {"cache": "q"})
+    sink.span("ranking.sort", 0.05, {})
+    sink.span("ranking.sort", 0.5, {})
+    assert sink.render().splitlines() == [
+        "# TYPE app_cache_hits_total counter",
+        'app_cache_hits_total{cache="q"} 2.0',
+        "# TYPE app_cache_misses_total counter",
+        'app_cache_misses_total{cache="q"} 1234567.0',
+        "# TYPE app_ranking_sort_seconds histogram",
+        'app_ranking_sort_seconds_bucket{le="0.1"} 1',
+        'app_ranking_sort_seconds_bucket{le="1"} 2',
+        'app_ranking_sort_seconds_bucket{le="+Inf"} 2',
+        "app_ranking_sort_seconds_sum 0.55",
+        "app_ranking_sort_seconds_count 2",
+    ]
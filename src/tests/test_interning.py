@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import pickle
+
+import pytest
+
+from llm_fallbacks import core
+from llm_fallbacks.interning import FrozenSpec, SpecInterner
+
+
+@pytest.fixture
+def interned_catalog():
+    """Intern the catalog for one test, then reload it as plain dicts."""
+    yield core.intern_catalog()
+    core._spec_interner = None
+    core.refresh_litellm_models()
+
+
+def test_frozen_spec_is_read_only_and_copies_to_a_dict():
+    """Test that a FrozenSpec rejects mutation, hashes by content and copies to a plain dict."""
+    spec = FrozenSpec({"mode": "chat", "supported_regions": ["us"]})
+    with pytest.raises(TypeError, match="immutable"):
+        spec["mode"] = "embedding"
+    with pytest.raises(TypeError):
+        spec.update(mode="embedding")
+    copy = spec.copy()
+    copy["mode"] = "embedding"
+    assert type(copy) is dict and spec["mode"] == "chat"
+    assert hash(spec) == hash(FrozenSpec({"supported_regions": ["us"], "mode": "chat"}))
+    assert json.loads(json.dumps(spec)) == spec
+    assert pickle.loads(pickle.dumps(spec)) == spec
+
+
+def test_interner_shares_identical_specs_and_reports_savings():
+    """Test that equal specs become one object, differently typed values do not, and the stats."""
+    interner = SpecInterner()
+    catalog = interner.intern_all(
+        {
+            "a": {"mode": "chat", "max_tokens": 1, "metadata": {"notes": "x"}},
+            "b": {"mode": "chat", "max_tokens": 1, "metadata": {"notes": "x"}},
+            "c": {"mode": "chat", "max_tokens": 1.0, "metadata": {"notes": "x"}},
+            "d": {"mode": "chat", "max_tokens": 1, "metadata": {"notes": "x", "rpm": 1}},
+            "e": {"mode": "chat", "max_tokens": 1, "metadata": {"notes": "x", "rpm": 1.0}},
+        }
+    )
+    assert catalog["a"] is catalog["b"] and catalog["a"] is not catalog["c"]
+    assert catalog["d"] is not catalog["e"]
+    assert interner.intern(catalog["a"]) is catalog["a"]
+    stats = interner.stats()
+    assert (stats.seen, stats.unique) == (5, 4)
+    assert stats.dedup_ratio == pytest.approx(1 / 5)
+    assert stats.bytes_saved > 0
+
+
+def test_catalog_is_plain_until_interned():
+    """Test that the getters return mutable specs unless interning was opted into."""
+    assert core.get_spec_interner() is None
+    assert not any(isinstance(spec, FrozenSpec) for spec in core.get_litellm_models().values())
+
+
+def test_catalog_specs_are_interned_including_provider_overrides(interned_catalog):
+    """Test the price map ingest and that identical provider overrides share one catalog spec."""
+    from llm_fallbacks.config import BaseProviderConfig, CustomProviderConfig
+
+    models = core.get_litellm_models()
+    assert all(isinstance(spec, FrozenSpec) for spec in models.values())
+    assert interned_catalog.seen > interned_catalog.unique
+    assert core.get_spec_interner().stats() == interned_catalog  # pyright: ignore[reportOptionalMemberAccess]
+
+    override = {"mode": "chat", "input_cost_per_token": 3e-07, "litellm_provider": "interned"}
+    CustomProviderConfig(
+        provider_name="interned",
+        base_url="https://api.interned.test/v1",
+        raw_models={"interned/one": dict(override), "interned/two": dict(override)},
+        auto_fetch_models=False,
+    )
+    known = BaseProviderConfig.ALL_KNOWN_MODELS
+    assert known["interned/one"] is known["interned/two"]
+    assert isinstance(known["interned/one"], FrozenSpec)
+
+
+def test_openrouter_models_that_are_catalog_keys_are_parsed_from_a_copy(interned_catalog):
+    """Test parsing an OpenRouter payload whose ids are LiteLLM keys, for free and paid models."""
+    from llm_fallbacks.config import CustomProviderConfig, _parse_openrouter_models_response
+
+    models = core.get_litellm_models()
+    paid, free = sorted(name for name, spec in models.items() if spec.get("mode") == "chat")[:2]
+    catalog_spec = models[paid]
+    payload = {
+        "data": [
+            {
+                "id": paid,
+                "pricing": {"prompt": "0.000002", "completion": "0.000004"},
+                "top_provider": {"context_length": 4096},
+            },
+        ]
+    }
+    parsed = _parse_openrouter_models_response("openrouter", payload)
+    assert parsed[paid]["input_cost_per_token"] == 2e-06 and parsed[paid]["max_input_tokens"] == 4096
+    assert not isinstance(parsed[paid], FrozenSpec) and models[paid] is catalog_spec
+
+    provider = CustomProviderConfig(
+        provider_name="openrouter_copy",
+        base_url="https://openrouter.test/api/v1",
+        parse_models_function=_parse_openrouter_models_response,
+        custom_get_models_from_api=lambda api_key: payload,
+        # A catalog spec passed as-is, marked free: its costs are overridden on a copy.
+        raw_models={free: models[free]},
+        free_models={free: {}},
+    )
+    assert provider.model_specs[paid]["output_cost_per_token"] == 4e-06
+    assert provider.free_models[free]["input_cost_per_token"] == 0.0
+    assert isinstance(models[free], FrozenSpec)
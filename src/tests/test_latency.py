@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from llm_fallbacks.core import sort_models_by_cost_and_limits
+from llm_fallbacks.latency import LatencyAwareRanker, LatencyStats, RankingWeights
+
+
+MODELS = {
+    "cheap-slow": {"input_cost_per_token": 1e-07, "output_cost_per_token": 1e-07, "max_tokens": 8192},
+    "mid-fast": {"input_cost_per_token": 2e-07, "output_cost_per_token": 2e-07, "max_tokens": 8192},
+    "pricey-fast": {"input_cost_per_token": 1e-05, "output_cost_per_token": 1e-05, "max_tokens": 8192},
+}
+
+
+def test_latency_stats_quantiles_and_ewma():
+    """Test the windowed quantiles and the moving average."""
+    stats = LatencyStats(alpha=0.5, window=4)
+    for seconds in (1.0, 2.0, 3.0, 4.0, 5.0):
+        stats.record("m", seconds)
+    assert stats.p50("m") == 3.0
+    assert stats.p95("m") == 5.0
+    assert stats.ewma("m") == 4.0625
+    assert stats.version == 5
+    assert stats.p95("unknown") is None
+
+
+def test_slow_cheap_model_drops_behind_fast_one():
+    """Test that a high p95 outweighs a small price advantage, and that re-ranking follows new samples."""
+    stats = LatencyStats()
+    assert [name for name, _ in sort_models_by_cost_and_limits(MODELS)][0] == "cheap-slow"
+    for _ in range(20):
+        stats.record("cheap-slow", 20.0)
+        stats.record("mid-fast", 0.5)
+        stats.record("pricey-fast", 0.5)
+
+    ranker = LatencyAwareRanker(MODELS, stats, RankingWeights(cost=1.0, context=0.0, p95=2.0))
+    assert [name for name, _ in ranker.rank()] == ["mid-fast", "pricey-fast", "cheap-slow"]
+
+    for _ in range(256):
+        stats.record("cheap-slow", 0.5)
+    assert [name for name, _ in ranker.rank()][0] == "cheap-slow"
+
+
+def test_sort_models_accepts_latency_stats():
+    """Test the latency term through sort_models_by_cost_and_limits."""
+    stats = LatencyStats()
+    stats.record("cheap-slow", 30.0)
+    stats.record("mid-fast", 0.2)
+    ranked = sort_models_by_cost_and_limits(MODELS, latency_stats=stats)
+    assert [name for name, _ in ranked][0] == "mid-fast"
+
+
+def test_free_models_score_ahead_of_the_cheapest_paid_one():
+    """Test that a free model's cost term stays below that of the cheapest paid model."""
+    free = {"free": {"input_cost_per_token": 0.0, "output_cost_per_token": 0.0, "max_tokens": 8192}}
+    ranker = LatencyAwareRanker({**MODELS, **free}, LatencyStats(), RankingWeights(context=0.0, p95=0.0))
+    scores = ranker.scores()
+    assert scores["free"] == 0.0
+    assert scores["cheap-slow"] > scores["free"] and scores["pricey-fast"] == 1.0
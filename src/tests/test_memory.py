@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from llm_fallbacks.cli import main
+from llm_fallbacks.memory import format_report, measure_structures
+
+
+def test_shared_exclusive_and_duplicate_specs():
+    """Test that shared objects split deep size and that equal, distinct spec dicts count as duplicates."""
+    shared = {"mode": "chat", "input_cost_per_token": 1e-06, "metadata": {"notes": "x"}}
+    copy = {"mode": "chat", "input_cost_per_token": 1e-06, "metadata": {"notes": "x"}}
+    other = {"mode": "embedding"}
+    catalog = {"a": shared, "b": copy, "c": other}
+    ranked = [("a", shared), ("c", other)]
+
+    report = measure_structures({"catalog": catalog, "ranked": ranked})
+    by_name = {structure.name: structure for structure in report.structures}
+    assert by_name["catalog"].spec_dicts == 3 and by_name["ranked"].spec_dicts == 2
+    assert by_name["catalog"].duplicate_spec_dicts == 1 and by_name["ranked"].duplicate_spec_dicts == 0
+    assert report.distinct_specs == 2
+    # Only the copy's dict and nested metadata dict are not already held by the first copy.
+    assert report.duplicate_spec_bytes == sys.getsizeof(copy) + sys.getsizeof(copy["metadata"])
+
+    for structure in report.structures:
+        assert structure.deep_bytes == structure.exclusive_bytes + structure.shared_bytes
+    assert by_name["ranked"].shared_bytes > 0
+    assert report.total_bytes == by_name["catalog"].deep_bytes + by_name["ranked"].exclusive_bytes
+    assert "1 duplicates" in format_report(report)
+
+
+def test_equal_but_differently_typed_values_are_not_duplicates():
+    """Test that 1 and 1.0 keep two spec dicts distinct."""
+    report = measure_structures({"catalog": {"a": {"max_tokens": 1}, "b": {"max_tokens": 1.0}}})
+    assert report.duplicate_spec_dicts == 0
+
+
+def test_memory_subcommand_covers_catalog_structures(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test the `memory` rows: ALL_KNOWN_MODELS, the priority orders and the totals row."""
+    # Restored after the test; `--offline` sets both.
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    monkeypatch.setenv("LLM_FALLBACKS_OFFLINE", "True")
+    main(["--offline", "memory"])
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    names = [row["structure"] for row in rows]
+    assert names[0] == "ALL_KNOWN_MODELS" and names[-1] == "(all)"
+    assert "ALL_MODELS" in names and "FREE_MODELS" in names
+    assert sum(name.endswith("_MODEL_PRIORITY_ORDER") for name in names) == 14
+    assert rows[-1]["deep_bytes"] >= max(row["deep_bytes"] for row in rows[:-1])
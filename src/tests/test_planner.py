@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import math
+
+from llm_fallbacks.config import CustomProviderConfig
+from llm_fallbacks.generate_configs import to_litellm_config_yaml
+from llm_fallbacks.planner import group_equivalent_models, model_capacity_rpm, plan_traffic, traffic_group_name
+
+
+def test_capacity_is_tightest_limit():
+    """Test that rpm, tpm at the average request size and rpd spread over the day all cap the rate."""
+    assert model_capacity_rpm({"rpm": 30, "tpm": 60000}, 1000) == 30
+    assert model_capacity_rpm({"rpm": 30, "tpm": 10000}, 1000) == 10
+    assert model_capacity_rpm({"rpm": 30, "rpd": 1440}, 1000) == 1
+    assert model_capacity_rpm({"mode": "chat"}, 1000) == math.inf
+
+
+def test_water_filling_fills_small_models_and_splits_the_rest():
+    """Test that capped models are filled and the remainder is split evenly among the others."""
+    models = {"small": {"rpm": 5}, "medium": {"rpm": 40}, "unlimited": {}}
+    plan = plan_traffic(models, 60, 1000)
+    assert plan.allocations == {"small": 5, "medium": 27.5, "unlimited": 27.5}
+    assert plan.unserved_rpm == 0
+
+    plan = plan_traffic({"small": {"rpm": 5}, "medium": {"rpm": 40}}, 100, 1000)
+    assert plan.served_rpm == 45
+    assert plan.unserved_rpm == 55
+    assert plan.weights() == {"small": 5 / 45, "medium": 40 / 45}
+
+
+def test_groups_and_config_weights():
+    """Test that only equivalent models share traffic and that they are weighted within one model group."""
+    groups = group_equivalent_models(
+        {
+            "a": {"mode": "chat"},
+            "b": {"mode": "embedding"},
+            "c": {"mode": "chat"},
+            "d": {"mode": "chat", "input_cost_per_token": 1e-06},
+        }
+    )
+    assert [list(group) for group in groups.values()] == [["a", "c"], ["b"], ["d"]]
+    assert traffic_group_name(("chat", False, True, False, True, False)) == "traffic/chat+vision+audio_input"
+    assert traffic_group_name(("chat", True, False, False, False, False)) == "traffic/chat:free"
+
+    provider = CustomProviderConfig(
+        provider_name="planned",
+        base_url="https://api.planned.test/v1",
+        raw_models={
+            "steady": {"mode": "chat", "rpm": 10},
+            "bursty": {"mode": "chat", "rpm": 30},
+        },
+        auto_fetch_models=False,
+    )
+    config = to_litellm_config_yaml([provider], target_rpm=40)
+    model_names = [entry["model_name"] for entry in config["model_list"]]
+    assert model_names == ["planned/steady", "planned/bursty", "traffic/chat:free", "traffic/chat:free"]
+    # Weights only count between deployments of one model group, so they sit on the shared group.
+    weights = {
+        entry["litellm_params"]["model"]: entry["litellm_params"]["weight"]
+        for entry in config["model_list"]
+        if entry["model_name"] == "traffic/chat:free"
+    }
+    assert weights == {"openai/planned/steady": 0.25, "openai/planned/bursty": 0.75}
+    assert all("weight" not in entry["litellm_params"] for entry in config["model_list"][:2])
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from llm_fallbacks import core
+
+_SNAPSHOT = {"snapshot-model": {"litellm_provider": "snapshot", "mode": "chat"}}
+
+
+@pytest.fixture
+def snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "model_prices.json"
+    monkeypatch.setenv("LLM_FALLBACKS_PRICE_MAP_SNAPSHOT", str(path))
+    monkeypatch.setenv("LLM_FALLBACKS_OFFLINE", "True")
+    return path
+
+
+def test_explicit_sources(snapshot: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test the snapshot source, its fallback to the packaged map, and an unknown source."""
+    monkeypatch.setenv("LLM_FALLBACKS_PRICE_MAP_SOURCE", "snapshot")
+    assert "gpt-4o" in core._load_litellm_models()  # no snapshot yet
+    snapshot.write_text(json.dumps(_SNAPSHOT))
+    assert core._load_litellm_models() == _SNAPSHOT
+
+    monkeypatch.setenv("LLM_FALLBACKS_PRICE_MAP_SOURCE", "nowhere")
+    with pytest.raises(ValueError, match="Unknown price map source"):
+        core._load_litellm_models()
+
+
+def test_auto_prefers_a_fresh_snapshot_and_uses_a_stale_one_offline(snapshot: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that offline `auto` reads any snapshot and otherwise the packaged map, never the network."""
+    monkeypatch.setenv("LLM_FALLBACKS_PRICE_MAP_SOURCE", "auto")
+    assert "gpt-4o" in core._load_litellm_models()
+    snapshot.write_text(json.dumps(_SNAPSHOT))
+    os.utime(snapshot, (0, 0))
+    assert core._load_litellm_models() == _SNAPSHOT
+
+
+def test_resource_source_does_not_import_litellm():
+    """Test that the packaged price map is read without importing litellm."""
+    code = (
+        "import sys\n"
+        "from llm_fallbacks import core\n"
+        "assert len(core._load_litellm_models()) > 1000\n"
+        "assert 'litellm' not in sys.modules\n"
+    )
+    env = {**os.environ, "LLM_FALLBACKS_PRICE_MAP_SOURCE": "resource", "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60, env=env)
+    assert result.returncode == 0, result.stderr
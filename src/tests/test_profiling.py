@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pstats
+import time
+
+from pathlib import Path
+
+import pytest
+
+from llm_fallbacks.profiling import StageProfiler
+
+
+def _busy(seconds: float) -> list[str]:
+    deadline = time.process_time() + seconds
+    allocated: list[str] = []
+    while time.process_time() < deadline:
+        allocated.append(str(len(allocated)))
+    return allocated
+
+
+def test_stage_writes_pstats_collapsed_stacks_and_allocations(tmp_path: Path):
+    """Test the four profiles of a stage and the summary."""
+    profiler = StageProfiler(tmp_path, interval=0.001)
+    with profiler.stage("busy"):
+        kept = _busy(0.2)
+    assert kept
+
+    stats = pstats.Stats(str(tmp_path / "busy.pstats"))
+    assert any(function == "_busy" for _, _, function in stats.stats)  # pyright: ignore[reportAttributeAccessIssue]
+    collapsed = (tmp_path / "busy.collapsed").read_text().splitlines()
+    assert collapsed and any("_busy (tests/test_profiling.py" in line for line in collapsed)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+    allocations = (tmp_path / "busy.alloc.collapsed").read_text()
+    assert "test_profiling.py" in allocations
+    assert "test_profiling.py" in (tmp_path / "busy.tracemalloc.txt").read_text()
+
+    summary = profiler.write_summary().read_text().splitlines()
+    assert summary[1].split()[0] == "busy"
+    assert profiler.stages[0].samples > 0 and profiler.stages[0].peak_bytes > 0
+
+
+def test_nested_stages_are_rejected(tmp_path: Path):
+    """Test that a stage cannot start while another one traces allocations."""
+    profiler = StageProfiler(tmp_path)
+    with profiler.stage("outer"):
+        with pytest.raises(ValueError, match="already tracing"):
+            with profiler.stage("inner"):
+                pass
+    assert [stage.name for stage in profiler.stages] == ["outer"]
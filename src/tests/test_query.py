@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import itertools
+
+from llm_fallbacks.core import sort_models_by_cost_and_limits
+from llm_fallbacks.filter_litellm import _MODEL_TYPE_GETTERS, _priority_order, filter_models
+from llm_fallbacks.query import ColumnarCatalog, iter_matching
+
+
+def _legacy_filter(priority_order, free_only=False, max_cost_per_token=None, min_context_length=None, **criteria):
+    """The loop-and-re-sort implementation filter_models had before the query engine."""
+    provider = criteria.pop("provider", None)
+    filtered = {}
+    for name, spec in dict(priority_order).items():
+        if free_only and spec.get("input_cost_per_token", 0) > 0:
+            continue
+        if max_cost_per_token is not None and spec.get("input_cost_per_token", 0) > max_cost_per_token:
+            continue
+        if min_context_length is not None and spec.get("max_tokens", 0) < min_context_length:
+            continue
+        if any(wanted is not None and spec.get(flag, False) != wanted for flag, wanted in criteria.items()):
+            continue
+        if provider is not None and not name.startswith(provider):
+            continue
+        filtered[name] = spec
+    return [name for name, _ in sort_models_by_cost_and_limits(filtered, free_only=free_only)]
+
+
+CRITERIA = [
+    {},
+    {"free_only": True},
+    {"max_cost_per_token": 1e-06},
+    {"min_context_length": 100_000},
+    {"supports_vision": True, "supports_function_calling": True},
+    {"supports_vision": False, "supports_audio_input": False, "supports_audio_output": False},
+    {"provider": "openrouter/"},
+    {"provider": "gpt-4", "max_cost_per_token": 1e-05, "min_context_length": 8192},
+]
+
+
+def test_select_matches_legacy_filter_for_every_model_type():
+    """Test that the query engine returns exactly what the old loop plus re-sort returned."""
+    for model_type, criteria in itertools.product(_MODEL_TYPE_GETTERS, CRITERIA):
+        expected = _legacy_filter(_priority_order(model_type), **criteria)
+        assert filter_models(model_type, **criteria) == expected, (model_type, criteria)
+
+
+def test_iter_matching_matches_select_for_every_model_type():
+    """Test that the numpy-free scan returns exactly what the columnar query returns."""
+    for model_type, criteria in itertools.product(_MODEL_TYPE_GETTERS, CRITERIA):
+        ranked = _priority_order(model_type)
+        assert list(iter_matching(ranked, **criteria)) == ColumnarCatalog(ranked).select(**criteria), (
+            model_type,
+            criteria,
+        )
+
+
+def test_select_keeps_rank_order_and_flag_semantics():
+    """Test rank order, non-boolean flag values and provider prefixes on a hand-built list."""
+    catalog = ColumnarCatalog(
+        [
+            ("b/second", {"input_cost_per_token": 0.0, "supports_vision": True, "max_tokens": 4096}),
+            ("a/first", {"input_cost_per_token": 0.0, "output_cost_per_token": 1e-06, "supports_vision": None}),
+            ("b/third", {"input_cost_per_token": 2e-06, "max_tokens": 200_000}),
+        ]
+    )
+    assert catalog.select() == ["b/second", "a/first", "b/third"]
+    assert catalog.select(free_only=True) == ["b/second"]
+    assert catalog.select(supports_vision=False) == ["b/third"]
+    assert catalog.select(provider="b/", min_context_length=8192) == ["b/third"]
+    assert catalog.select(provider="c/") == []
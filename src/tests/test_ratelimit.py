@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from llm_fallbacks.ratelimit import RateLimiterRegistry
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(
+        self,
+        seconds: float,
+    ):
+        self.now += seconds
+
+
+MODELS = {
+    "a/limited": {"rpm": 2, "tpm": 1000},
+    "a/daily": {"rpd": 1},
+    "b/unlimited": {"mode": "chat"},
+}
+
+
+def test_buckets_refill_and_enforce_tpm():
+    """Test rpm and tpm buckets, their refill over time and that unlimited models are never throttled."""
+    clock = _Clock()
+    registry = RateLimiterRegistry(MODELS, clock=clock)
+    assert registry.try_acquire("a/limited", 400)
+    assert registry.try_acquire("a/limited", 400)
+    assert not registry.try_acquire("a/limited", 100)  # rpm exhausted
+    clock.now = 30  # refills one request and 500 of the 800 spent tokens
+    assert not registry.try_acquire("a/limited", 800)
+    assert registry.try_acquire("a/limited", 700)
+    assert registry.limiter("b/unlimited") is None
+    assert all(registry.try_acquire("b/unlimited", 10**9) for _ in range(100))
+    with pytest.raises(ValueError, match="can never fit"):
+        registry.acquire("a/limited", 2000)
+
+
+def test_fallback_selection_skips_saturated_models():
+    """Test that filter and first_available move past models whose buckets are empty."""
+    registry = RateLimiterRegistry(MODELS, clock=_Clock())
+    fallbacks = ["a/daily", "a/limited", "b/unlimited"]
+    assert registry.first_available(fallbacks) == "a/daily"
+    assert list(registry.filter(fallbacks)) == ["a/limited", "b/unlimited"]
+    assert registry.first_available(fallbacks, tokens=5000) == "b/unlimited"
+
+
+def test_concurrent_acquires_never_overshoot():
+    """Test that threads and coroutines together admit exactly the bucket capacity."""
+    registry = RateLimiterRegistry({"m": {"rpm": 50}}, clock=_Clock())
+    admitted: list[bool] = []
+
+    def worker():
+        admitted.extend(registry.try_acquire("m") for _ in range(20))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(admitted) == 50
+    assert asyncio.run(registry.aacquire("m", timeout=0.01)) is False
+
+
+def test_acquire_times_out_on_the_registry_clock():
+    """Test that acquire measures its timeout with the injected clock and waits for a refill."""
+    clock = _Clock()
+    registry = RateLimiterRegistry({"m": {"rpm": 1}}, clock=clock, sleep=clock.sleep)
+    assert registry.acquire("m")
+    assert registry.acquire("m", timeout=30) is False
+    assert clock.now == 0
+    assert registry.acquire("m", timeout=90)
+    assert clock.now == pytest.approx(60)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from llm_fallbacks.synthetic import (
+    OPTIONAL_FIELDS,
+    CatalogDistribution,
+    PricingTier,
+    generate_openrouter_models,
+    generate_price_map,
+)
+
+
+def test_generation_is_deterministic_per_seed():
+    """Test that a seed always gives the same catalog and another seed a different one."""
+    assert generate_price_map(2_000, seed=7) == generate_price_map(2_000, seed=7)
+    assert generate_price_map(2_000, seed=7) != generate_price_map(2_000, seed=8)
+    assert len(generate_price_map(2_000)) == 2_000
+
+
+def test_distributions_are_followed():
+    """Test mode shares, free pricing, missing fields and case-folded duplicates against the configured rates."""
+    distribution = CatalogDistribution(
+        modes={"chat": 3, "embedding": 1},
+        pricing_tiers={"free": PricingTier(1), "paid": PricingTier(1, 1e-07, 1e-06)},
+        missing_field_rate=0.2,
+        duplicate_rate=0.1,
+    )
+    models = generate_price_map(20_000, seed=1, distribution=distribution)
+    specs = list(models.values())
+    assert {spec["mode"] for spec in specs} == {"chat", "embedding"}
+    assert sum(spec["mode"] == "chat" for spec in specs) / len(specs) == pytest.approx(0.75, abs=0.02)
+    assert sum(spec["input_cost_per_token"] == 0 for spec in specs) / len(specs) == pytest.approx(0.5, abs=0.02)
+    assert all(spec["input_cost_per_token"] == 0 or 1e-07 <= spec["input_cost_per_token"] <= 1e-06 for spec in specs)
+    missing = sum(field not in spec for spec in specs for field in OPTIONAL_FIELDS) / (len(specs) * len(OPTIONAL_FIELDS))
+    assert missing == pytest.approx(0.2, abs=0.02)
+    assert not any("supports_vision" in spec for spec in specs if spec["mode"] == "embedding")
+    case_duplicates = len(models) - len({name.casefold() for name in models})
+    assert case_duplicates / len(models) == pytest.approx(0.05, abs=0.01)
+
+
+def test_openrouter_payload_lists_chat_models():
+    """Test the OpenRouter `/models` payload shape."""
+    payload = generate_openrouter_models(50, seed=3)
+    assert len(payload["data"]) == 50
+    assert len({model["id"] for model in payload["data"]}) == 50
+    first = payload["data"][0]
+    assert set(first) == {"id", "description", "pricing", "architecture", "top_provider"}
+    assert float(first["pricing"]["prompt"]) >= 0